@@ -0,0 +1,154 @@
+"""Benchmark for the construction of cache keys.
+
+Replays request-like workloads where the arguments of each call are parsed from input,
+so equal arguments are usually different objects, and compares the hit rate and cost
+per call of the current key construction with the previous one, which compared most
+hashable arguments by identity and unhashable arguments by `repr`.
+
+The cost per call is the median of several runs, since it is easily skewed by other
+processes. Typical results: `l10n` hits far more often and is an order of magnitude
+faster, since the currency codes are new strings that previously never matched.
+`to_places` hits as often as before, since its decimals and small ints were already
+compared by value, but builds its keys faster. `forex` hits as often and costs about
+the same as before, since the `repr` of a `RatesDict` was already a correct key, and
+the cheaper construction of the flat key is offset by hashing and comparing its items
+instead of a single string.
+
+Run with `hatch run bench:cache-keys` or `python benchmarks/cache_keys.py`.
+"""
+
+import decimal
+import json
+import logging
+import random
+import statistics
+import time
+from collections.abc import Callable, Hashable
+from typing import Any
+
+import linearmoney as lm
+from linearmoney import cache
+
+# The cache logs a warning for every eviction, which would dominate the timings.
+logging.disable(logging.WARNING)
+
+CALLS = 20_000
+REPEATS = 7
+
+
+def _legacy_make_key(args: tuple, kwargs: dict[str, Any]) -> tuple:
+    # The key construction before value-based keys.
+    key_accumulator: list[Hashable] = []
+    for i in args:
+        if isinstance(i, Hashable):
+            if isinstance(i, decimal.Decimal):
+                key_accumulator.append(str(i))
+            else:
+                key_accumulator.append((type(i), i, id(i)))
+        else:
+            key_accumulator.append(repr(i))
+    for k, v in kwargs.items():
+        if isinstance(v, Hashable):
+            if isinstance(v, decimal.Decimal):
+                key_accumulator.append((k, str(v)))
+            else:
+                key_accumulator.append((k, type(v), v))
+        else:
+            key_accumulator.append((k, repr(v)))
+    return tuple(key_accumulator)
+
+
+def _forex_workload(rng: random.Random) -> Callable[[], Any]:
+    payloads = [
+        json.dumps(
+            {
+                "base": "usd",
+                "rates": {
+                    "jpy": round(150 + day / 10, 2),
+                    "eur": f"0.9{day:02}",
+                    "gbp": 0.79,
+                    "cad": "1.3612",
+                },
+            }
+        )
+        for day in range(30)
+    ]
+    calls = [rng.choice(payloads) for _ in range(CALLS)]
+    calls_iter = iter(calls)
+
+    def call() -> None:
+        lm.vector.forex(json.loads(next(calls_iter)))
+
+    return call
+
+
+def _to_places_workload(rng: random.Random) -> Callable[[], Any]:
+    prices = [f"{rng.randint(100, 100_000) / 100:.2f}" for _ in range(100)]
+    calls = [(rng.choice(prices), str(rng.choice((0, 2, 3)))) for _ in range(CALLS)]
+    calls_iter = iter(calls)
+
+    def call() -> None:
+        price, places = next(calls_iter)
+        lm.round.to_places(decimal.Decimal(price), int(places))
+
+    return call
+
+
+def _l10n_workload(rng: random.Random) -> Callable[[], Any]:
+    en_us = lm.data.locale("en", "us")
+    prices = [f"{rng.randint(100, 10_000) / 100:.2f}" for _ in range(50)]
+    codes = ("usd", "eur", "jpy", "gbp")
+    calls = [(rng.choice(prices), rng.choice(codes)) for _ in range(CALLS)]
+    calls_iter = iter(calls)
+
+    def call() -> None:
+        price, code = next(calls_iter)
+        # Currency codes from the request are new strings every time.
+        currency = lm.data.currency(code.upper())
+        lm.scalar.l10n(decimal.Decimal(price), currency, en_us)
+
+    return call
+
+
+def _measure(workload: Callable[[random.Random], Callable[[], Any]]) -> tuple:
+    cache.invalidate()
+    call = workload(random.Random(0))
+    cache.enable_stats(True)
+    cache.reset_stats()
+    for _ in range(CALLS):
+        call()
+    cache.enable_stats(False)
+    stats = cache.stats()
+    hits = sum([i["hits"] for i in stats.values()])  # type: ignore[union-attr]
+    misses = sum([i["misses"] for i in stats.values()])  # type: ignore[union-attr]
+    # Timed separately without statistics, which add two timer calls to every call.
+    timings = []
+    for _ in range(REPEATS):
+        cache.invalidate()
+        call = workload(random.Random(0))
+        started = time.perf_counter()
+        for _ in range(CALLS):
+            call()
+        timings.append((time.perf_counter() - started) / CALLS * 1e6)
+    return hits / (hits + misses), statistics.median(timings)
+
+
+def main() -> None:
+    current = cache._make_key
+    print(f"{'workload':<10} {'keys':<8} {'hit rate':>9} {'us/call':>9}")
+    for name, workload in [
+        ("forex", _forex_workload),
+        ("to_places", _to_places_workload),
+        ("l10n", _l10n_workload),
+    ]:
+        for label, make_key in [("previous", _legacy_make_key), ("current", current)]:
+            cache._make_key = make_key
+            try:
+                hit_rate, per_call = _measure(workload)
+            finally:
+                cache._make_key = current
+            print(f"{name:<10} {label:<8} {hit_rate:>9.1%} {per_call:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
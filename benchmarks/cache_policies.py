@@ -0,0 +1,106 @@
+"""Trace-replay benchmark for the eviction policies of the cache.
+
+Replays call traces through a cached function with each eviction policy and reports
+the hit ratio and the cost per call. A trace is a sequence of arguments of a single
+cached function. The built-in traces are synthetic:
+
+* `zipf`: A skewed workload where a few arguments are used most of the time.
+* `scan`: The same skewed workload interrupted by scans over unique arguments, like
+  a nightly job that calls `store` or `restore` for every stored vector.
+* `loop`: A loop over slightly more arguments than fit in the cache.
+
+Recorded traces can be replayed by passing the paths of text files with one argument
+per line, e.g. the cache keys logged by a production server.
+
+Run with `hatch run bench:cache-policies [TRACE ...]` or
+`python benchmarks/cache_policies.py [TRACE ...]`.
+"""
+
+import logging
+import random
+import sys
+import time
+from collections.abc import Callable, Sequence
+
+from linearmoney import cache
+
+# The cache logs a warning for every eviction, which would dominate the timings.
+logging.disable(logging.WARNING)
+
+POLICIES = ("lru", "lfu", "2q")
+# `max_size` of the cache with the default `base_size`.
+MAX_SIZE = 256
+CALLS = 100_000
+
+
+def _zipf(rng: random.Random, keys: int) -> Callable[[], str]:
+    weights = [1 / (i + 1) for i in range(keys)]
+    population = [f"hot-{i}" for i in range(keys)]
+
+    def draw() -> str:
+        return rng.choices(population, weights)[0]
+
+    return draw
+
+
+def _zipf_trace(rng: random.Random) -> list[str]:
+    draw = _zipf(rng, 2_000)
+    return [draw() for _ in range(CALLS)]
+
+
+def _scan_trace(rng: random.Random) -> list[str]:
+    draw = _zipf(rng, 2_000)
+    trace: list[str] = []
+    scans = 0
+    while len(trace) < CALLS:
+        trace.extend([draw() for _ in range(5_000)])
+        trace.extend([f"scan-{scans}-{i}" for i in range(2 * MAX_SIZE)])
+        scans += 1
+    return trace[:CALLS]
+
+
+def _loop_trace(rng: random.Random) -> list[str]:
+    keys = [f"loop-{i}" for i in range(MAX_SIZE + MAX_SIZE // 8)]
+    return [keys[i % len(keys)] for i in range(CALLS)]
+
+
+def _replay(trace: Sequence[str], policy: str) -> tuple[float, float]:
+    def _identity(arg: str) -> str:
+        return arg
+
+    # Function caches are identified by the qualified name of the function.
+    _identity.__qualname__ = f"_identity_{policy}"
+    cached_identity = cache.cached(policy=policy)(_identity)  # type: ignore[arg-type]
+    cache.invalidate()
+    cache.enable_stats(True)
+    cache.reset_stats()
+    started = time.perf_counter()
+    for arg in trace:
+        cached_identity(arg)
+    elapsed = time.perf_counter() - started
+    cache.enable_stats(False)
+    stats = cache.stats(cached_identity)
+    hit_ratio = stats["hits"] / len(trace)  # type: ignore[index]
+    return hit_ratio, elapsed / len(trace) * 1e6
+
+
+def main(paths: Sequence[str]) -> None:
+    rng = random.Random(0)
+    traces: list[tuple[str, Sequence[str]]] = [
+        ("zipf", _zipf_trace(rng)),
+        ("scan", _scan_trace(rng)),
+        ("loop", _loop_trace(rng)),
+    ]
+    for path in paths:
+        with open(path) as f:
+            traces.append((path, [line.rstrip("\n") for line in f]))
+    cache.set_base_size(MAX_SIZE)
+    print(f"{'trace':<24} {'policy':<6} {'hit ratio':>9} {'us/call':>8}")
+    for name, trace in traces:
+        for policy in POLICIES:
+            hit_ratio, per_call = _replay(trace, policy)
+            print(f"{name:<24} {policy:<6} {hit_ratio:>9.1%} {per_call:>8.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
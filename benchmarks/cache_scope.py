@@ -0,0 +1,90 @@
+"""Thread-scaling benchmark for the thread and process scopes of the cache.
+
+Every thread evaluates assets drawn from the same set of shared vectors, like the
+worker threads of a web server handling similar requests. With the thread scope, each
+thread warms its own copy of the cache, so the number of misses grows with the number
+of threads. With the process scope, the threads share a single cache.
+
+The hit rate is measured by counting the calls of the wrapped function, and the
+throughput is the number of cached calls per second across all threads.
+
+Run with `hatch run bench:cache-scope` or `python benchmarks/cache_scope.py`.
+"""
+
+import itertools
+import logging
+import random
+import threading
+import time
+
+import linearmoney as lm
+
+# The cache logs a warning for every eviction, which would dominate the timings.
+logging.disable(logging.WARNING)
+
+CALLS_PER_THREAD = 2_000
+THREAD_COUNTS = (1, 4, 16, 64)
+KEYS = 40
+
+
+def _run(scope: str, thread_count: int) -> tuple[float, float]:
+    rates = {"jpy": "151.37", "eur": "0.9234", "gbp": "0.7891", "cad": "1.3612"}
+    fo = lm.vector.forex({"base": "usd", "rates": rates})
+    sp = lm.vector.space(fo)
+    currencies = sp.axes
+    assets = [
+        lm.vector.asset(i, currencies[i % len(currencies)], sp) for i in range(KEYS)
+    ]
+    misses = itertools.count()
+
+    @lm.cache.cached()
+    def valuation(idx: int, iso_code: str):
+        next(misses)
+        return lm.vector.Evaluator(fo, iso_code)(assets[idx])
+
+    lm.cache.set_scope(scope)
+    lm.cache.invalidate()
+    start = threading.Barrier(thread_count + 1)
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        # Skewed towards the first keys like most real workloads.
+        calls = [
+            (min(int(rng.expovariate(8 / KEYS)), KEYS - 1), rng.choice(currencies))
+            for _ in range(CALLS_PER_THREAD)
+        ]
+        start.wait()
+        for idx, iso_code in calls:
+            valuation(idx, iso_code)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(thread_count)]
+    for t in threads:
+        t.start()
+    start.wait()
+    began = time.perf_counter()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - began
+    # Threads other than the main thread have their own thread local caches, which
+    # are discarded with the threads.
+    lm.cache.invalidate()
+    total = CALLS_PER_THREAD * thread_count
+    hit_rate = 1 - next(misses) / total
+    return hit_rate, total / elapsed
+
+
+def main() -> None:
+    print(f"{'threads':>7} {'scope':>8} {'hit rate':>9} {'calls/s':>12}")
+    try:
+        for thread_count in THREAD_COUNTS:
+            for scope in ("thread", "process"):
+                hit_rate, throughput = _run(scope, thread_count)
+                print(
+                    f"{thread_count:>7} {scope:>8} {hit_rate:>9.1%} {throughput:>12,.0f}"
+                )
+    finally:
+        lm.cache.set_scope("thread")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Microbenchmark for the construction of money vectors by arithmetic operations.
+
+Compares the validating public constructor, which the operators used to call for every
+result, with the internal trusted constructor they use now, and measures chained
+arithmetic end-to-end with the cache disabled, so that every operation actually
+builds its result.
+
+Run with `hatch run bench:vectors` or `python benchmarks/vector_construction.py`.
+"""
+
+import decimal
+import logging
+import timeit
+
+import linearmoney as lm
+
+# The cache logs a warning for every eviction, which would dominate the timings.
+logging.disable(logging.WARNING)
+
+NUMBER = 20_000
+
+
+def _report(name: str, seconds: float) -> None:
+    print(f"{name:<48} {seconds / NUMBER * 1e6:>8.2f} us/op")
+
+
+def main() -> None:
+    rates = {"jpy": "151.37", "eur": "0.9234", "gbp": "0.7891", "cad": "1.3612"}
+    fo = lm.vector.forex({"base": "usd", "rates": rates})
+    sp = lm.vector.space(fo)
+    components = tuple([decimal.Decimal("12.34") for _ in sp.axes])
+    axes = sp.axes
+    vec = lm.vector.asset(10, "usd", sp) + lm.vector.asset(1000, "jpy", sp)
+
+    def eager() -> None:
+        # Everything the constructor used to do for every result.
+        result = lm.vector.MoneyVector(components, axes)
+        repr(result)
+        hash(result)
+
+    def trusted() -> None:
+        lm.vector.MoneyVector._from_trusted(components, axes)
+
+    def arithmetic() -> None:
+        -((vec + vec) * 2 - vec)
+
+    _report(
+        "validated constructor with eager repr/hash",
+        timeit.timeit(eager, number=NUMBER),
+    )
+    _report("trusted constructor", timeit.timeit(trusted, number=NUMBER))
+
+    lm.cache.enable(False)
+    try:
+        _report(
+            "chained arithmetic (4 results, cache disabled)",
+            timeit.timeit(arithmetic, number=NUMBER),
+        )
+    finally:
+        lm.cache.enable(True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+"""Batch kernels for fixed-point integer columns used internally by the
+linearmoney package.
+
+A column is the sequence of fixed-point integer components of one axis of a batch of
+vectors. If NumPy is installed, columns whose values fit in 64 bits are stored as
+read-only `int64` arrays and the kernels operate on whole arrays at once. Otherwise,
+or if a column contains a value that doesn't fit in 64 bits, the column is stored as a
+tuple of Python ints and the kernels fall back to pure Python.
+
+Every kernel checks for `int64` overflow and recomputes the affected result with
+exact Python ints, so the results never depend on which backend is used.
+
+The float kernels are only used for approximate evaluation. They use the same order
+of operations in both backends, so the same error bounds hold for both.
+"""
+
+from __future__ import annotations
+
+__all__: list[str] = [
+    "Column",
+    "column",
+    "to_ints",
+    "add",
+    "sub",
+    "scale",
+    "neg",
+    "dot",
+    "float_column",
+    "fixed_to_float",
+    "float_dot",
+]
+
+from collections.abc import Iterable, Sequence
+from typing import Any, TypeAlias
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+Column: TypeAlias = Any
+
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+# The largest bound on the absolute value of a dot product that is computed with
+# `int64` arithmetic. Half of the `int64` range leaves enough room for the rounding
+# error of the floating point bound estimate.
+_DOT_BOUND = 2**62
+
+
+def _is_array(col: Column | int) -> bool:
+    return np is not None and isinstance(col, np.ndarray)
+
+
+def column(values: Iterable[int]) -> Column:
+    """Return `values` packed into a column using the fastest available
+    representation."""
+
+    if _is_array(values):
+        return values
+    values = values if isinstance(values, (list, tuple)) else list(values)
+    if np is not None:
+        try:
+            arr = np.array(values, dtype=np.int64)
+        except OverflowError:
+            pass
+        else:
+            arr.flags.writeable = False
+            return arr
+    return tuple(values)
+
+
+def to_ints(col: Column) -> list[int]:
+    """Return the values of `col` as a list of Python ints."""
+
+    if _is_array(col):
+        return col.tolist()
+    return list(col)
+
+
+def _as_int64(value: Column | int) -> Column | None:
+    # Return `value` as an operand for an `int64` kernel or `None` if the slow path
+    # must be used.
+
+    if _is_array(value):
+        return value
+    if isinstance(value, int) and np is not None:
+        if _INT64_MIN <= value <= _INT64_MAX:
+            return np.int64(value)
+    return None
+
+
+def _python_operands(a: Column, b: Column) -> tuple[Sequence, Sequence]:
+    if isinstance(a, int):
+        return [a] * len(b), to_ints(b)
+    if isinstance(b, int):
+        return to_ints(a), [b] * len(a)
+    return to_ints(a), to_ints(b)
+
+
+def add(a: Column | int, b: Column | int) -> Column:
+    """Return the element-wise sum of `a` and `b`.
+
+    Either operand can be a single int, which is added to every element of the other
+    operand.
+    """
+
+    x, y = _as_int64(a), _as_int64(b)
+    if x is not None and y is not None:
+        result = np.add(x, y)
+        # Signed overflow occurred if the result has a different sign than both
+        # operands.
+        if not np.any((x ^ result) & (y ^ result) < 0):
+            result.flags.writeable = False
+            return result
+    lhs, rhs = _python_operands(a, b)
+    return column([i + j for i, j in zip(lhs, rhs)])
+
+
+def sub(a: Column | int, b: Column | int) -> Column:
+    """Return the element-wise difference of `a` and `b`.
+
+    Either operand can be a single int, which is used for every element of the other
+    operand.
+    """
+
+    x, y = _as_int64(a), _as_int64(b)
+    if x is not None and y is not None:
+        result = np.subtract(x, y)
+        # Signed overflow occurred if the operands have different signs and the
+        # result has a different sign than the minuend.
+        if not np.any((x ^ y) & (x ^ result) < 0):
+            result.flags.writeable = False
+            return result
+    lhs, rhs = _python_operands(a, b)
+    return column([i - j for i, j in zip(lhs, rhs)])
+
+
+def scale(col: Column, scalar: int) -> Column:
+    """Return every element of `col` multiplied by `scalar`."""
+
+    # The scalar itself has to fit in 64 bits even if every element is zero.
+    if _is_array(col) and len(col) and _INT64_MIN < scalar <= _INT64_MAX:
+        largest = max(abs(int(col.max())), abs(int(col.min())))
+        if largest * abs(scalar) <= _INT64_MAX:
+            result = np.multiply(col, np.int64(scalar))
+            result.flags.writeable = False
+            return result
+    return column([scalar * i for i in to_ints(col)])
+
+
+def neg(col: Column) -> Column:
+    """Return every element of `col` negated."""
+
+    if _is_array(col) and (not len(col) or int(col.min()) != _INT64_MIN):
+        result = np.negative(col)
+        result.flags.writeable = False
+        return result
+    return column([-i for i in to_ints(col)])
+
+
+def dot(
+    columns: Sequence[Column], weights: Sequence[int], limit: int
+) -> list[int | None]:
+    """Return the dot product of each row of `columns` with `weights`.
+
+    Only rows where the sum of the absolute values of the products is at most `limit`
+    are calculated, and the result for all other rows is `None`, so that the caller can
+    compute those rows with a different method. `limit` must be at least `2**63`.
+
+    With the NumPy backend, rows whose products are guaranteed to fit in 64 bits are
+    calculated with `int64` arithmetic, and all other rows are calculated with exact
+    Python ints.
+    """
+
+    rows = len(columns[0]) if columns else 0
+    pairs = [(col, w) for col, w in zip(columns, weights) if w]
+    if not pairs:
+        return [0] * rows
+    if (
+        np is not None
+        and all([_is_array(col) for col, _ in pairs])
+        and all([abs(w) <= _INT64_MAX for _, w in pairs])
+    ):
+        bound = np.zeros(rows, dtype=np.float64)
+        total = np.zeros(rows, dtype=np.int64)
+        for col, w in pairs:
+            bound += np.abs(col.astype(np.float64)) * float(abs(w))
+            # Rows that overflow here are recalculated below.
+            total += col * np.int64(w)
+        safe = bound <= float(_DOT_BOUND)
+        results: list[int | None] = [
+            value if is_safe else None
+            for value, is_safe in zip(total.tolist(), safe.tolist())
+        ]
+        pending = np.flatnonzero(~safe)
+        if len(pending):
+            # Object arrays hold Python ints, so these products can't overflow.
+            exact_total = np.zeros(len(pending), dtype=object)
+            exact_bound = np.zeros(len(pending), dtype=object)
+            for col, w in pairs:
+                products = col[pending].astype(object) * w
+                exact_total += products
+                exact_bound += np.abs(products)
+            for idx, value, value_bound in zip(
+                pending.tolist(), exact_total.tolist(), exact_bound.tolist()
+            ):
+                if value_bound <= limit:
+                    results[idx] = value
+        return results
+    int_weights = [w for _, w in pairs]
+    results = []
+    for row in zip(*[to_ints(col) for col, _ in pairs]):
+        products = [i * w for i, w in zip(row, int_weights)]
+        if sum([abs(i) for i in products]) <= limit:
+            results.append(sum(products))
+        else:
+            results.append(None)
+    return results
+
+
+def float_column(values: Iterable[float]) -> Column:
+    """Return `values` packed into a column of floats.
+
+    If NumPy is installed, the column is a read-only `float64` array. Otherwise, it is
+    a tuple of Python floats.
+    """
+
+    values = values if isinstance(values, (list, tuple)) else list(values)
+    if np is not None:
+        arr = np.array(values, dtype=np.float64)
+        arr.flags.writeable = False
+        return arr
+    return tuple(values)
+
+
+def fixed_to_float(col: Column, places: int) -> Column:
+    """Return the fixed-point integers of `col` with `places` decimal places as a
+    column of floats.
+
+    Each value is within two roundings of the exact value.
+    """
+
+    if _is_array(col):
+        result = col.astype(np.float64) / (10.0**places)
+        result.flags.writeable = False
+        return result
+    # True division of Python ints is correctly rounded.
+    scale = 10**places
+    return float_column([i / scale for i in to_ints(col)])
+
+
+def float_dot(
+    columns: Sequence[Column], weights: Sequence[float]
+) -> tuple[list[float], list[float]]:
+    """Return the dot product of each row of the float `columns` with `weights` and
+    the sum of the absolute values of the products of each row.
+
+    The products of each row are accumulated from left to right with `float64`
+    arithmetic in both backends, so the rounding error of each result is within the
+    standard error bound of recursive summation.
+    """
+
+    rows = len(columns[0]) if columns else 0
+    if np is not None and all([_is_array(col) for col in columns]):
+        total = np.zeros(rows, dtype=np.float64)
+        abs_total = np.zeros(rows, dtype=np.float64)
+        for col, w in zip(columns, weights):
+            products = col * w
+            total += products
+            abs_total += np.abs(products)
+        return total.tolist(), abs_total.tolist()
+    totals = []
+    abs_totals = []
+    for row in zip(*columns):
+        row_total = 0.0
+        row_abs_total = 0.0
+        for i, w in zip(row, weights):
+            product = i * w
+            row_total += product
+            row_abs_total += abs(product)
+        totals.append(row_total)
+        abs_totals.append(row_abs_total)
+    return totals, abs_totals
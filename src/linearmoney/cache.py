@@ -1,5 +1,19 @@
 """This module provides access to the custom least recently used caching system used
-by functions in the linearmoney package."""
+by functions in the linearmoney package.
+
+By default, every thread has its own cache, so cached values are never shared between
+threads and the caches don't need any locking. Applications with many worker threads
+that call the same functions with the same arguments can use `set_scope("process")`
+to share a single thread-safe cache between all threads instead.
+
+Function caches evict the least recently used value by default. Other eviction
+policies can be chosen for all caches with `set_policy` or for the cache of a single
+function with the `policy` argument of `cached`.
+
+Function caches are bounded by a number of entries, and can additionally be bounded by
+an approximate number of bytes with the `max_bytes` argument of `cached`, while
+`set_max_bytes` bounds the bytes of all function caches together.
+"""
 
 from __future__ import annotations
 
@@ -14,29 +28,189 @@ __all__ = [
     "max_size",
     "get_base_size",
     "set_base_size",
+    "get_scope",
+    "set_scope",
+    "CacheStats",
+    "enable_stats",
+    "is_stats_enabled",
+    "stats",
+    "reset_stats",
+    "get_policy",
+    "set_policy",
+    "max_bytes",
+    "get_max_bytes",
+    "set_max_bytes",
+    "nbytes",
 ]
 
 import decimal
 import functools
+import itertools
 import logging
+import sys
 import threading
+import time
+import types
 from collections import OrderedDict
 from collections.abc import Callable, Hashable, Mapping
-from typing import Any, ParamSpec, SupportsInt, TypeVar
+from typing import Any, Literal, ParamSpec, SupportsInt, TypedDict, TypeVar
 
 from linearmoney.exceptions import CacheError
+from linearmoney.mixins import EqualityByHashMixin
 
 logger = logging.getLogger(__name__)
 
 _thread_local_data = threading.local()
 
 
+class CacheStats(TypedDict):
+    """The statistics of the cache of a single function.
+
+    The counters and times are only collected while statistics are enabled with
+    `enable_stats`, but `size` and `nbytes` are always the current number of cached
+    values and their approximate size.
+    """
+
+    hits: int
+    """The number of calls that returned a cached value."""
+    misses: int
+    """The number of calls that called the cached function."""
+    writes: int
+    """The number of values written to the cache."""
+    evictions: int
+    """The number of values removed from the cache to make room for new values."""
+    size: int
+    """The current number of cached values."""
+    nbytes: int
+    """The approximate number of bytes currently used by the cached values."""
+    key_time: float
+    """The total seconds spent building cache keys from the arguments."""
+    func_time: float
+    """The total seconds spent in the cached function on cache misses."""
+
+
+# Types whose instances don't reference other objects, so their size is just the
+# size of the object itself.
+_SCALAR_TYPES = frozenset([int, float, str, bool, bytes, type(None), decimal.Decimal])
+
+# Types of objects that live as long as the program instead of being created for a
+# cached value, so evicting a value referencing them never frees any memory.
+_PERMANENT_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+)
+
+
+_slot_names_by_class: dict[type, tuple[str, ...]] = {}
+
+
+def _slot_names(cls: type) -> tuple[str, ...]:
+    """Return the names of all slots of `cls` and its base classes."""
+
+    try:
+        return _slot_names_by_class[cls]
+    except KeyError:
+        pass
+    names: list[str] = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        names.extend([slots] if isinstance(slots, str) else slots)
+    return _slot_names_by_class.setdefault(cls, tuple(names))
+
+
+def _estimate_nbytes(value: Any, seen: set[int] | None = None) -> int:
+    """Return the approximate number of bytes used by `value` and the objects it
+    references.
+
+    The size of each object is estimated by type:
+
+    * `str`, `decimal.Decimal` and other scalars are the size of the object.
+    * Tuples, lists, sets and mappings are the size of the container and their
+      items.
+    * Objects from the linearmoney package, like `linearmoney.vector.MoneyVector` and
+      `linearmoney.data.DataMap`, are the size of the object and its attributes, so
+      e.g. the size of a vector grows with the number of its components.
+    * Classes, modules and functions are free, since they are never freed, and any
+      other object is the size of the object itself.
+
+    Objects referenced more than once by `value` are only counted once, but objects
+    shared between different values, like the axes of vectors in the same currency
+    space, are counted for every value, so the estimate errs on the side of too many
+    bytes.
+    """
+
+    cls = type(value)
+    if cls in _SCALAR_TYPES:
+        return sys.getsizeof(value)
+    if isinstance(value, _PERMANENT_TYPES):
+        return 0
+    if seen is None:
+        seen = set()
+    elif id(value) in seen:
+        return 0
+    seen.add(id(value))
+    nbytes = sys.getsizeof(value)
+    if cls.__module__.startswith("linearmoney."):
+        # Mappings from the package create new objects for nested values on access,
+        # so the attributes holding the actual data are measured instead.
+        attributes = getattr(value, "__dict__", None)
+        if attributes is not None:
+            nbytes += sys.getsizeof(attributes)
+            for i in attributes.values():
+                nbytes += _estimate_nbytes(i, seen)
+        for name in _slot_names(cls):
+            nbytes += _estimate_nbytes(getattr(value, name, None), seen)
+    elif isinstance(value, (tuple, list, set, frozenset)):
+        for i in value:
+            nbytes += _estimate_nbytes(i, seen)
+    elif isinstance(value, Mapping):
+        for k, v in value.items():
+            nbytes += _estimate_nbytes(k, seen) + _estimate_nbytes(v, seen)
+    return nbytes
+
+
+def _estimate_key_nbytes(key_part: Any) -> int:
+    """Return the approximate number of bytes used by a cache key or one of its parts.
+
+    Only the tuples and scalars of the key are counted. Any other objects in the key
+    are arguments of the cached call, which are usually still referenced by the
+    caller, like the locale passed to every call of a formatting function.
+    """
+
+    cls = type(key_part)
+    if cls is tuple:
+        return sys.getsizeof(key_part) + sum(
+            [_estimate_key_nbytes(i) for i in key_part]
+        )
+    if cls in _SCALAR_TYPES:
+        return sys.getsizeof(key_part)
+    return 0
+
+
+def _estimate_entry_nbytes(cache_key: tuple, value: Any) -> int:
+    """Return the approximate number of bytes used by a cache entry."""
+
+    return _estimate_key_nbytes(cache_key) + _estimate_nbytes(value)
+
+
 class _LRUFuncCache(OrderedDict):
     """OrderedDict representing the lru cache of a specific function."""
 
     __slots__ = [
         "_funcname",
         "_size_multiplier",
+        "_hits",
+        "_misses",
+        "_writes",
+        "_evictions",
+        "_key_time",
+        "_func_time",
+        "_max_bytes",
+        "_entry_nbytes",
+        "_nbytes",
+        "_cachedict",
     ]
 
     def __init__(
@@ -45,10 +219,21 @@ class _LRUFuncCache(OrderedDict):
         *,
         funcname: str,
         size_multiplier: int | float = 1,
+        max_bytes: int | None = None,
     ) -> None:
         super().__init__(from_store)
         self._funcname = funcname
         self._size_multiplier = size_multiplier
+        self._max_bytes = max_bytes
+        # The approximate size of each entry. `None` until the size of this funccache
+        # is bounded by bytes, so that unbounded caches don't pay for estimating the
+        # size of every value.
+        self._entry_nbytes: dict[tuple, int] | None = None
+        self._nbytes = 0
+        # The `cachedict` that keeps the total size of all of its function caches.
+        # Set by `_create_funccache`.
+        self._cachedict: _CacheDict | None = None
+        self.reset_stats()
 
     @property
     def max_size(self) -> int:
@@ -72,6 +257,69 @@ class _LRUFuncCache(OrderedDict):
 
         return len(self)
 
+    @property
+    def max_bytes(self) -> int | None:
+        """Read-only: the maximum approximate number of bytes of the cached values,
+        or `None` if the size of this funccache is only bounded by `max_size`."""
+
+        return self._max_bytes
+
+    @property
+    def nbytes(self) -> int:
+        """Read-only: the approximate number of bytes used by the values cached on
+        this instance."""
+
+        return self._current_nbytes()
+
+    def _current_nbytes(self) -> int:
+        if self._entry_nbytes is None:
+            return sum([_estimate_entry_nbytes(k, v) for k, v in self.items()])
+        return self._nbytes
+
+    def track_nbytes(self) -> None:
+        """Keep a running total of the size of this funccache from now on instead of
+        estimating it on demand."""
+
+        self._track_nbytes()
+
+    def _track_nbytes(self) -> None:
+        if self._entry_nbytes is None:
+            self._entry_nbytes = {
+                k: _estimate_entry_nbytes(k, v) for k, v in self.items()
+            }
+            self._add_nbytes(sum(self._entry_nbytes.values()))
+
+    def _add_nbytes(self, delta: int) -> None:
+        """Add `delta` to the size of this funccache and the total of its
+        `cachedict`."""
+
+        self._nbytes += delta
+        if self._cachedict is not None:
+            self._cachedict.add_nbytes(delta)
+
+    def _new_entry_nbytes(self, cache_key: tuple, value: Any) -> int | None:
+        """Return the approximate size of a new entry, or `None` if the size of this
+        funccache isn't tracked."""
+
+        if self._entry_nbytes is None:
+            if self._max_bytes is None and _max_bytes is None:
+                return None
+            self._track_nbytes()
+        return _estimate_entry_nbytes(cache_key, value)
+
+    def _fits(self, entry_nbytes: int | None) -> bool:
+        """Whether an entry of `entry_nbytes` fits into the byte budgets at all."""
+
+        return entry_nbytes is None or (
+            (self._max_bytes is None or entry_nbytes <= self._max_bytes)
+            and (_max_bytes is None or entry_nbytes <= _max_bytes)
+        )
+
+    def _store_nbytes(self, cache_key: tuple, entry_nbytes: int | None) -> None:
+        if self._entry_nbytes is not None and entry_nbytes is not None:
+            self._add_nbytes(entry_nbytes - self._entry_nbytes.get(cache_key, 0))
+            self._entry_nbytes[cache_key] = entry_nbytes
+
     @property
     def head(self) -> Any:
         """Read-only: the cached value at the current *head* (least recently used)
@@ -86,33 +334,134 @@ class _LRUFuncCache(OrderedDict):
 
         return self[next(iter(reversed(self)))]
 
+    @property
+    def stats(self) -> CacheStats:
+        """Read-only: the statistics collected for this funccache."""
+
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "writes": self._writes,
+            "evictions": self._evictions,
+            "size": len(self),
+            "nbytes": self._current_nbytes(),
+            "key_time": self._key_time,
+            "func_time": self._func_time,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset all statistics of this funccache to zero."""
+
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+        self._key_time = 0.0
+        self._func_time = 0.0
+
+    def record_hit(self, key_time: float) -> None:
+        """Add a cache hit that took `key_time` seconds to build the key to the
+        statistics of this funccache."""
+
+        self._hits += 1
+        self._key_time += key_time
+
+    def record_miss(self, key_time: float, func_time: float) -> None:
+        """Add a cache miss to the statistics of this funccache.
+
+        The values evicted to make room for the new value are counted when they are
+        evicted.
+
+        Args:
+            key_time
+                The seconds spent building the key.
+            func_time
+                The seconds spent in the cached function.
+        """
+
+        self._misses += 1
+        self._writes += 1
+        self._key_time += key_time
+        self._func_time += func_time
+
     def is_cached(self, cache_key: tuple) -> bool:
         return cache_key in self
 
-    def write(self, cache_key: tuple, value: Any) -> None:
+    def write(self, cache_key: tuple, value: Any) -> int:
         """Cache a new value to this store.
 
+        A value that is larger than the byte budget of this funccache or of the
+        whole cache is not cached at all, since it would evict every other value
+        and then itself.
+
         Args:
             cache_key
                 The tuple key used to lookup the value within this funccache.
             value
                 The value to be stored in this funccache.
+
+        Returns:
+            int
+
+            The number of values evicted from the head of this funccache to make room
+            for the new value.
         """
 
+        entry_nbytes = self._new_entry_nbytes(cache_key, value)
+        if not self._fits(entry_nbytes):
+            return 0
         self[cache_key] = value
         self.move_to_end(cache_key)
-        if self._overfull():
-            logger.warning(
-                f"{self._funcname}: \
-cache full on write(key={cache_key}, value={value})."
-            )
-            self._remove_head()
+        self._store_nbytes(cache_key, entry_nbytes)
+        evicted = 0
+        while self and self._overfull():
+            self._warn_full(cache_key, value)
+            self._evict_head()
+            evicted += 1
+        return evicted
+
+    def evict(self) -> int:
+        """Evict the head of this funccache to make room in the cache as a whole.
+
+        Returns:
+            int
+
+            The approximate number of bytes freed.
+        """
+
+        if not self:
+            return 0
+        logger.warning(f"{self._funcname}: cache over byte budget, evicting head.")
+        nbytes = self._current_nbytes()
+        self._evict_head()
+        return nbytes - self._current_nbytes()
+
+    def _warn_full(self, cache_key: tuple, value: Any) -> None:
+        logger.warning(f"{self._funcname}: \
+cache full on write(key={cache_key}, value={value}).")
 
     def _overfull(self) -> bool:
-        return len(self) > self.max_size
+        return len(self) > self.max_size or (
+            self._max_bytes is not None and self._nbytes > self._max_bytes
+        )
+
+    def _evict_head(self) -> None:
+        """Remove the head and count the eviction in the statistics."""
+
+        self._remove_head()
+        if _stats_enabled:
+            self._evictions += 1
 
     def _remove_head(self) -> None:
-        del self[next(iter(self))]
+        self._discard(next(iter(self)))
+
+    def _discard(self, cache_key: tuple) -> None:
+        """Remove the entry of `cache_key` from the cache and its size from the
+        total."""
+
+        del self[cache_key]
+        if self._entry_nbytes is not None:
+            self._add_nbytes(-self._entry_nbytes.pop(cache_key))
 
     def read(self, cache_key: tuple) -> Any:
         """Fetch a cached value from this store.
@@ -131,14 +480,466 @@ cache full on write(key={cache_key}, value={value})."
         self.move_to_end(cache_key)
         return read_value
 
+    def clear(self) -> None:
+        super().clear()
+        if self._entry_nbytes is not None:
+            self._entry_nbytes.clear()
+            self._add_nbytes(-self._nbytes)
+
+
+class _LFUFuncCache(_LRUFuncCache):
+    """Function cache that evicts the least frequently used value.
+
+    The number of reads of each value is counted, and the values with the same count
+    are kept in buckets in least recently used order, so the value with the lowest
+    count that was used least recently is evicted in constant time.
+    New values are written after evicting, so that a new value is never evicted
+    before it can be read again.
+
+    The *head* is the value that will be evicted next, and the *tail* is the most
+    recently used value like in the LRU cache.
+    """
+
+    __slots__ = ["_frequencies", "_buckets", "_min_frequency"]
+
+    def __init__(
+        self,
+        from_store: Mapping = {},
+        *,
+        funcname: str,
+        size_multiplier: int | float = 1,
+        max_bytes: int | None = None,
+    ) -> None:
+        super().__init__(
+            from_store,
+            funcname=funcname,
+            size_multiplier=size_multiplier,
+            max_bytes=max_bytes,
+        )
+        self._frequencies: dict[tuple, int] = dict.fromkeys(self, 1)
+        self._buckets: dict[int, OrderedDict[tuple, None]] = {
+            1: OrderedDict.fromkeys(self)
+        }
+        self._min_frequency = 1
+
+    @property
+    def head(self) -> Any:
+        return self[self._eviction_candidate()]
+
+    def _eviction_candidate(self) -> tuple:
+        if self._min_frequency not in self._buckets:
+            self._min_frequency = min(self._buckets)
+        return next(iter(self._buckets[self._min_frequency]))
+
+    def write(self, cache_key: tuple, value: Any) -> int:
+        entry_nbytes = self._new_entry_nbytes(cache_key, value)
+        if not self._fits(entry_nbytes):
+            return 0
+        if cache_key in self:
+            # Another thread sharing the cache already wrote the value.
+            self[cache_key] = value
+            self._store_nbytes(cache_key, entry_nbytes)
+            return 0
+        evicted = 0
+        while self and self._full(entry_nbytes or 0):
+            self._warn_full(cache_key, value)
+            self._evict_head()
+            evicted += 1
+        self[cache_key] = value
+        self._store_nbytes(cache_key, entry_nbytes)
+        self._frequencies[cache_key] = 1
+        self._buckets.setdefault(1, OrderedDict())[cache_key] = None
+        self._min_frequency = 1
+        return evicted
+
+    def _full(self, entry_nbytes: int) -> bool:
+        """Whether a new entry of `entry_nbytes` doesn't fit without evicting."""
+
+        return len(self) >= self.max_size or (
+            self._max_bytes is not None
+            and self._nbytes + entry_nbytes > self._max_bytes
+        )
+
+    def _remove_head(self) -> None:
+        cache_key = self._eviction_candidate()
+        bucket = self._buckets[self._min_frequency]
+        del bucket[cache_key]
+        if not bucket:
+            del self._buckets[self._min_frequency]
+        del self._frequencies[cache_key]
+        self._discard(cache_key)
+
+    def read(self, cache_key: tuple) -> Any:
+        read_value = super().read(cache_key)
+        frequency = self._frequencies[cache_key]
+        bucket = self._buckets[frequency]
+        del bucket[cache_key]
+        if not bucket:
+            del self._buckets[frequency]
+            if self._min_frequency == frequency:
+                self._min_frequency = frequency + 1
+        self._frequencies[cache_key] = frequency + 1
+        self._buckets.setdefault(frequency + 1, OrderedDict())[cache_key] = None
+        return read_value
+
+    def clear(self) -> None:
+        super().clear()
+        self._frequencies.clear()
+        self._buckets.clear()
+        self._min_frequency = 1
+
+
+class _TwoQueueFuncCache(_LRUFuncCache):
+    """Function cache with the scan-resistant 2Q eviction policy.
+
+    New values are written to a small FIFO queue that holds a quarter of the cache.
+    Values evicted from the FIFO queue are forgotten, but their keys are remembered
+    in a ghost queue the size of half of the cache. If a value is written again while
+    its key is in the ghost queue, it is written to the main LRU queue instead, and
+    only values in the main queue are moved when they are read.
+
+    Values that are only used once, like the values of a scan over many unique
+    arguments, pass through the FIFO queue without evicting the frequently used
+    values in the main queue.
+
+    The *head* is the value that will be evicted next, and the *tail* is the most
+    recently used value like in the LRU cache.
+    """
+
+    __slots__ = ["_a1in", "_am", "_a1out"]
+
+    def __init__(
+        self,
+        from_store: Mapping = {},
+        *,
+        funcname: str,
+        size_multiplier: int | float = 1,
+        max_bytes: int | None = None,
+    ) -> None:
+        super().__init__(
+            from_store,
+            funcname=funcname,
+            size_multiplier=size_multiplier,
+            max_bytes=max_bytes,
+        )
+        # FIFO queue of new values.
+        self._a1in: OrderedDict[tuple, None] = OrderedDict()
+        # LRU queue of values that were used again after leaving `_a1in`.
+        self._am: OrderedDict[tuple, None] = OrderedDict.fromkeys(self)
+        # Ghost queue of the keys evicted from `_a1in`.
+        self._a1out: OrderedDict[tuple, None] = OrderedDict()
+
+    @property
+    def head(self) -> Any:
+        return self[next(iter(self._eviction_queue()))]
+
+    def _eviction_queue(self) -> OrderedDict[tuple, None]:
+        if len(self._a1in) > max(self.max_size // 4, 1) or not self._am:
+            return self._a1in
+        return self._am
+
+    def write(self, cache_key: tuple, value: Any) -> int:
+        entry_nbytes = self._new_entry_nbytes(cache_key, value)
+        if not self._fits(entry_nbytes):
+            return 0
+        if cache_key in self:
+            # Another thread sharing the cache already wrote the value.
+            self[cache_key] = value
+            self._store_nbytes(cache_key, entry_nbytes)
+            return 0
+        self[cache_key] = value
+        self._store_nbytes(cache_key, entry_nbytes)
+        if cache_key in self._a1out:
+            del self._a1out[cache_key]
+            self._am[cache_key] = None
+        else:
+            self._a1in[cache_key] = None
+        evicted = 0
+        while self and self._overfull():
+            self._warn_full(cache_key, value)
+            self._evict_head()
+            evicted += 1
+        return evicted
+
+    def _remove_head(self) -> None:
+        queue = self._eviction_queue()
+        cache_key = next(iter(queue))
+        del queue[cache_key]
+        self._discard(cache_key)
+        if queue is self._a1in:
+            self._a1out[cache_key] = None
+            if len(self._a1out) > max(self.max_size // 2, 1):
+                del self._a1out[next(iter(self._a1out))]
+
+    def read(self, cache_key: tuple) -> Any:
+        read_value = super().read(cache_key)
+        if cache_key in self._am:
+            self._am.move_to_end(cache_key)
+        return read_value
+
+    def clear(self) -> None:
+        super().clear()
+        self._a1in.clear()
+        self._am.clear()
+        self._a1out.clear()
+
+
+class _SharedFuncCacheMixin(_LRUFuncCache):
+    """Makes a function cache safe to share between threads when it is combined with
+    the class of an eviction policy.
+
+    Every operation on the cache holds a lock, and each function has its own cache
+    with its own lock, so threads only contend when they hit the cache of the same
+    function at the same time. The function itself is never called while holding the
+    lock.
+
+    The `max_size` of a shared cache is always based on the `base_size` of the main
+    thread.
+    """
+
+    __slots__ = ()
+
+    # Each concrete class has its own `_lock` slot, since only one base class of a
+    # class can add slots.
+    _lock: threading.Lock
+
+    def __init__(
+        self,
+        from_store: Mapping = {},
+        *,
+        funcname: str,
+        size_multiplier: int | float = 1,
+        max_bytes: int | None = None,
+    ) -> None:
+        super().__init__(
+            from_store,
+            funcname=funcname,
+            size_multiplier=size_multiplier,
+            max_bytes=max_bytes,
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self) -> int:
+        return int(_base_size * self.size_multiplier)
+
+    @property
+    def head(self) -> Any:
+        with self._lock:
+            return super().head
+
+    @property
+    def tail(self) -> Any:
+        with self._lock:
+            return super().tail
+
+    def is_cached(self, cache_key: tuple) -> bool:
+        with self._lock:
+            return super().is_cached(cache_key)
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return super().stats
+
+    def reset_stats(self) -> None:
+        # Called by `_LRUFuncCache.__init__` before the lock is created.
+        lock = getattr(self, "_lock", None)
+        if lock is None:
+            super().reset_stats()
+            return
+        with lock:
+            super().reset_stats()
+
+    def record_hit(self, key_time: float) -> None:
+        with self._lock:
+            super().record_hit(key_time)
+
+    def record_miss(self, key_time: float, func_time: float) -> None:
+        with self._lock:
+            super().record_miss(key_time, func_time)
+
+    @property
+    def nbytes(self) -> int:
+        with self._lock:
+            return super().nbytes
+
+    def track_nbytes(self) -> None:
+        with self._lock:
+            super().track_nbytes()
+
+    def write(self, cache_key: tuple, value: Any) -> int:
+        with self._lock:
+            return super().write(cache_key, value)
+
+    def evict(self) -> int:
+        with self._lock:
+            return super().evict()
+
+    def read(self, cache_key: tuple) -> Any:
+        with self._lock:
+            return super().read(cache_key)
+
+    def clear(self) -> None:
+        with self._lock:
+            super().clear()
+
+
+class _SharedLRUFuncCache(_SharedFuncCacheMixin):
+    __slots__ = ["_lock"]
+
+
+class _SharedLFUFuncCache(_SharedFuncCacheMixin, _LFUFuncCache):
+    __slots__ = ["_lock"]
+
+
+class _SharedTwoQueueFuncCache(_SharedFuncCacheMixin, _TwoQueueFuncCache):
+    __slots__ = ["_lock"]
+
+
+_Policy = Literal["lru", "lfu", "2q"]
+
+# The function cache classes of each eviction policy for the thread and process
+# scopes.
+_policy_classes: dict[str, tuple[type[_LRUFuncCache], type[_LRUFuncCache]]] = {
+    "lru": (_LRUFuncCache, _SharedLRUFuncCache),
+    "lfu": (_LFUFuncCache, _SharedLFUFuncCache),
+    "2q": (_TwoQueueFuncCache, _SharedTwoQueueFuncCache),
+}
+
+_policy: _Policy = "lru"
+
+
+def get_policy() -> _Policy:
+    """The default eviction policy for new function caches."""
+
+    return _policy
+
+
+def set_policy(new_policy: _Policy) -> None:
+    """Set the default eviction policy for new function caches for the entire process.
+
+    The available policies are:
+
+    * `"lru"` (default): Evict the least recently used value.
+    * `"lfu"`: Evict the least frequently used value, and the least recently used of
+      those if several values are used equally often. Values that were used many
+      times stay cached even if they haven't been used for a while.
+    * `"2q"`: The scan-resistant 2Q policy. New values are kept in a small queue
+      and only promoted to the main LRU queue if they are used again soon after they
+      were evicted, so a scan over many unique arguments can't evict the frequently
+      used values.
+
+    The policy of a function cache is chosen when the cache is created by the first
+    call of the function, so this should be called before the cache is used, e.g.
+    when the application starts. A policy passed to the `cached` decorator takes
+    precedence over the default policy.
+
+    Raises:
+        ValueError:
+            If `new_policy` is not one of the available policies.
+    """
+
+    if new_policy not in _policy_classes:
+        raise ValueError(f"set_policy(): Expected one of {tuple(_policy_classes)}, \
+got {new_policy!r}")
+    global _policy
+    _policy = new_policy
+
+
+_Scope = Literal["thread", "process"]
+
+_scope: _Scope = "thread"
+
+
+class _CacheDict(dict[str, _LRUFuncCache]):
+    """The function caches of a thread, or of the whole process, by the qualified
+    name of their function.
 
-def _get_cachedict() -> dict[str, _LRUFuncCache]:
+    Keeps the running total of the approximate bytes of the function caches whose
+    sizes are tracked, so that the byte budget of the whole cache can be checked
+    without summing the sizes of all function caches.
+    """
+
+    __slots__ = ["_nbytes", "_lock", "_tracked_budget"]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._nbytes = 0
+        # Function caches of different threads can update the total of the process
+        # `cachedict` at the same time.
+        self._lock = threading.Lock()
+        # The number of the byte budget that the sizes of all function caches were
+        # last tracked for. See `_enforce_max_bytes`.
+        self._tracked_budget = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Read-only: the approximate number of bytes used by the function caches
+        whose sizes are tracked."""
+
+        return self._nbytes
+
+    def add_nbytes(self, delta: int) -> None:
+        """Add `delta` bytes to the total."""
+
+        with self._lock:
+            self._nbytes += delta
+
+
+# The `cachedict` shared by all threads when the scope is "process".
+_process_cachedict = _CacheDict()
+# Guards the creation of new function caches in `_process_cachedict`.
+_process_cachedict_lock = threading.Lock()
+
+
+def get_scope() -> _Scope:
+    """The current scope of the cache.
+
+    Either `"thread"` (default) if each thread has its own cache, or `"process"` if
+    all threads share a single cache.
+    """
+
+    return _scope
+
+
+def set_scope(new_scope: _Scope) -> None:
+    """Set the scope of the cache for the entire process.
+
+    With the `"thread"` scope (default), each thread has its own cache, so each thread
+    has to compute and store its own copy of every cached value.
+    With the `"process"` scope, all threads read and write a single thread-safe cache,
+    so a value computed by one thread is available to every other thread.
+
+    The caches of each scope are kept separately, so values cached before the scope
+    is changed are not available in the new scope.
+
+    In the `"process"` scope, the `max_size` of every function cache is based on the
+    `base_size` of the main thread, and `size`, `head`, `tail`, `max_size` and
+    `invalidate` operate on the shared cache from any thread.
+
+    Raises:
+        ValueError:
+            If `new_scope` is not `"thread"` or `"process"`.
+    """
+
+    if new_scope not in ("thread", "process"):
+        raise ValueError(
+            f"set_scope(): Expected 'thread' or 'process', got {new_scope!r}"
+        )
+    global _scope
+    _scope = new_scope
+
+
+def _get_cachedict() -> _CacheDict:
     """Return the `cachedict` for the calling thread."""
 
+    if _scope == "process":
+        return _process_cachedict
     global _thread_local_data
     ca = getattr(_thread_local_data, "cachedict", None)
     if ca is None:
-        _thread_local_data.cachedict = {}
+        _thread_local_data.cachedict = _CacheDict()
     return _thread_local_data.cachedict
 
 
@@ -158,6 +959,43 @@ def _get_funccache(cached_func: Callable) -> _LRUFuncCache:
         raise CacheError(f"Individual cache for: {funcname} not found.")
 
 
+def _create_funccache(
+    cached_func: Callable,
+    size_multiplier: int | float,
+    policy: _Policy | None,
+    max_bytes: int | None = None,
+) -> _LRUFuncCache:
+    """Create the cache for `cached_func` in the current `cachedict` and return it.
+
+    The cache uses the eviction `policy`, or the default policy if `policy` is
+    `None`, and is bounded by `max_bytes` in addition to its `max_size` if
+    `max_bytes` is not `None`. If another thread created the shared cache for
+    `cached_func` first, that cache is returned instead.
+    """
+
+    funcname = cached_func.__qualname__
+    thread_class, shared_class = _policy_classes[policy or _policy]
+    if _scope == "process":
+        with _process_cachedict_lock:
+            try:
+                return _process_cachedict[funcname]
+            except KeyError:
+                pass
+            _funccache: _LRUFuncCache = shared_class(
+                funcname=funcname, size_multiplier=size_multiplier, max_bytes=max_bytes
+            )
+            _funccache._cachedict = _process_cachedict
+            _process_cachedict[funcname] = _funccache
+            return _funccache
+    _cachedict = _get_cachedict()
+    _funccache = thread_class(
+        funcname=funcname, size_multiplier=size_multiplier, max_bytes=max_bytes
+    )
+    _funccache._cachedict = _cachedict
+    _cachedict[funcname] = _funccache
+    return _funccache
+
+
 def invalidate(cached_func: Callable | None = None) -> None:
     """Invalidate the cache.
 
@@ -236,10 +1074,8 @@ def set_base_size(new_base_size: int) -> None:
     """
 
     if not isinstance(new_base_size, SupportsInt):
-        raise TypeError(
-            f"set_base_size(): Expected `SupportsInt`, \
-got {type(new_base_size)}"
-        )
+        raise TypeError(f"set_base_size(): Expected `SupportsInt`, \
+got {type(new_base_size)}")
     if threading.current_thread() == threading.main_thread():
         global _base_size
         _base_size = int(new_base_size)
@@ -262,6 +1098,114 @@ def max_size(cached_func: Callable) -> int:
     return _get_funccache(cached_func).max_size
 
 
+_max_bytes: int | None = None
+# Counts the byte budgets set with `set_max_bytes`, so that each `cachedict` tracks
+# the sizes of all of its function caches once for each new budget.
+_budget_number = 0
+
+
+def get_max_bytes() -> int | None:
+    """The current maximum approximate number of bytes of the whole cache, or `None`
+    if the cache is only bounded by the `max_size` of each function cache."""
+
+    return _max_bytes
+
+
+def set_max_bytes(new_max_bytes: int | None) -> None:
+    """Set the maximum approximate number of bytes of the whole cache for the entire
+    process.
+
+    Whenever a new value makes the function caches use more bytes than
+    `new_max_bytes` together, values are evicted from the function cache that uses
+    the most bytes until the cache fits into the budget again. Like the rest of the
+    cache, the budget applies to the cache of each thread separately unless the
+    scope of the cache is `"process"`. See `set_scope`.
+
+    The size of each value is estimated from its type, e.g. the number of components
+    of a vector, so a budget bounds the memory used by the cache much more closely
+    than `set_base_size` when the cached values have very different sizes. Estimating
+    the sizes has a small cost on every cache miss while a budget is set.
+
+    Args:
+        new_max_bytes:
+            The new budget, or `None` (default) to only bound the cache by the
+            `max_size` of each function cache.
+    Raises:
+        TypeError:
+            If `new_max_bytes` is not `None` and doesn't support int.
+    """
+
+    if new_max_bytes is not None and not isinstance(new_max_bytes, SupportsInt):
+        raise TypeError(f"set_max_bytes(): Expected `SupportsInt` or `None`, \
+got {type(new_max_bytes)}")
+    global _max_bytes, _budget_number
+    _max_bytes = None if new_max_bytes is None else int(new_max_bytes)
+    _budget_number += 1
+    if _max_bytes is not None:
+        _enforce_max_bytes()
+
+
+def _enforce_max_bytes() -> None:
+    """Evict values from the function caches of the calling thread that use the most
+    bytes until the whole cache fits into the byte budget.
+
+    Function caches that are written while a budget is set track their sizes on
+    their own, so only the function caches created before the current budget have
+    to be tracked here, once per budget. After that, the budget is checked against
+    the running total of the `cachedict`, and the function caches are only compared
+    when values have to be evicted.
+    """
+
+    cachedict = _get_cachedict()
+    if cachedict._tracked_budget != _budget_number:
+        for funccache in list(cachedict.values()):
+            funccache.track_nbytes()
+        cachedict._tracked_budget = _budget_number
+    while _max_bytes is not None and cachedict.nbytes > _max_bytes:
+        largest = max(list(cachedict.values()), key=lambda funccache: funccache.nbytes)
+        if not largest.evict():
+            break
+
+
+def max_bytes(cached_func: Callable) -> int | None:
+    """Return the maximum approximate number of bytes for the cache of the
+    `cached_func`, or `None` if its size is only bounded by its `max_size`.
+
+    Raises:
+        `linearmoney.exceptions.CacheError`:
+            If `cached_func` isn't cached.
+            Individual caches are created dynamically, so this can happen if
+            `cached_func` has not been called yet, but this is very unlikely in most
+            applications.
+    """
+
+    return _get_funccache(cached_func).max_bytes
+
+
+def nbytes(cached_func: Callable | None = None) -> int:
+    """The approximate number of bytes used by the requested cache.
+
+    The sizes are kept up to date while the cache is bounded by bytes, and estimated
+    on demand otherwise. See `set_max_bytes` for how they are estimated.
+
+    Args:
+        cached_func:
+            If `None` (default) return the total combined bytes of all function
+            caches, else return the bytes of the cache of `cached_func`.
+    Raises:
+        `linearmoney.exceptions.CacheError`:
+            If `cached_func` is not `None` and the function is not cached.
+            Individual caches are created dynamically, so this can happen if
+            `cached_func` has not been called yet, but this is very unlikely in most
+            applications.
+    """
+
+    if cached_func is None:
+        return sum([funccache.nbytes for funccache in list(_get_cachedict().values())])
+    else:
+        return _get_funccache(cached_func).nbytes
+
+
 def size(cached_func: Callable | None = None) -> int:
     """The current size of the requested cache.
 
@@ -320,15 +1264,243 @@ def tail(cached_func: Callable) -> Any:
     return _get_funccache(cached_func).tail
 
 
+_stats_enabled = False
+
+
+def enable_stats(enable: bool) -> None:
+    """Enable/disable the collection of cache statistics for the entire process.
+
+    Statistics are disabled by default. While they are disabled, the only cost is a
+    single check of a global flag for each cached call.
+    """
+
+    global _stats_enabled
+    _stats_enabled = enable
+
+
+def is_stats_enabled() -> bool:
+    """Whether cache statistics are currently being collected."""
+
+    return _stats_enabled
+
+
+def stats(cached_func: Callable | None = None) -> dict[str, CacheStats] | CacheStats:
+    """The statistics of the requested cache.
+
+    Like the rest of the cache, the statistics are kept separately for each thread
+    unless the scope of the cache is `"process"`. See `set_scope`.
+
+    Args:
+        cached_func:
+            If `None` (default), return a dict of the qualified name of every cached
+            function that has been called to the statistics of its cache, else
+            return the statistics of the cache of `cached_func`.
+    Raises:
+        `linearmoney.exceptions.CacheError`:
+            If `cached_func` is not `None` and the function is not cached.
+            Individual caches are created dynamically, so this can happen if
+            `cached_func` has not been called yet, but this is very unlikely in most
+            applications.
+    """
+
+    if cached_func is None:
+        return {
+            funcname: funccache.stats
+            for funcname, funccache in list(_get_cachedict().items())
+        }
+    else:
+        return _get_funccache(cached_func).stats
+
+
+def reset_stats(cached_func: Callable | None = None) -> None:
+    """Reset the statistics of the requested cache to zero without invalidating any
+    cached values.
+
+    Args:
+        cached_func:
+            If `None` (default), reset the statistics of every function cache, else
+            reset the statistics of the cache of `cached_func`.
+    Raises:
+        `linearmoney.exceptions.CacheError`:
+            If `cached_func` is not `None` and the function is not cached.
+            Individual caches are created dynamically, so this can happen if
+            `cached_func` has not been called yet, but this is very unlikely in most
+            applications.
+    """
+
+    if cached_func is None:
+        for funccache in list(_get_cachedict().values()):
+            funccache.reset_stats()
+    else:
+        _get_funccache(cached_func).reset_stats()
+
+
 # Needed for type checking cache decorators.
 T = TypeVar("T")
 P = ParamSpec("P")
 
 
+# Types whose instances are only equal to instances of the same type if they have
+# exactly the same value, so they can be compared by value in cache keys.
+# Floats are handled separately, since 0.0 and -0.0 are equal but can produce
+# different results.
+_VALUE_TYPES = frozenset([int, str, bool, bytes, type(None)])
+
+# Containers whose items are encoded directly into cache keys.
+_CONTAINER_TYPES = frozenset([dict, list, tuple])
+
+# Separates the positional arguments from the keyword arguments in cache keys.
+_KWARGS_MARKER = object()
+
+# Whether the instances of each class seen in a cache key are compared by identity.
+_by_identity: dict[type, bool] = {}
+
+
+def _is_compared_by_identity(cls: type) -> bool:
+    """Whether instances of `cls` are compared by identity in cache keys.
+
+    Classes with `linearmoney.mixins.EqualityByHashMixin`, like
+    `linearmoney.vector.MoneyVector`, are equal whenever their hashes are equal, so
+    two different objects with colliding hashes would otherwise share a cache entry.
+    """
+
+    try:
+        return _by_identity[cls]
+    except KeyError:
+        return _by_identity.setdefault(cls, issubclass(cls, EqualityByHashMixin))
+
+
+def _extend_key(key: list[Any], value: Any) -> None:
+    """Append a flat encoding of the items of the mapping or sequence `value` to
+    `key`.
+
+    The encoding is the number of items followed by the items, and the key and value
+    of each item of a mapping. Strings and non-zero floats are appended as they are,
+    and every other item is appended as its type followed by a single part, or the
+    encoding of its items if it is a plain dict, list or tuple. Items are never types,
+    so the encoding is unambiguous without allocating a tuple for every item.
+    """
+
+    append = key.append
+    append(len(value))
+    if type(value) is dict or isinstance(value, Mapping):
+        value = itertools.chain.from_iterable(value.items())
+    for i in value:
+        cls = type(i)
+        if cls is str or (cls is float and i):
+            append(i)
+            continue
+        append(cls)
+        if cls in _VALUE_TYPES:
+            append(i)
+        elif cls in _CONTAINER_TYPES:
+            _extend_key(key, i)
+        elif cls is decimal.Decimal:
+            append(str(i))
+        elif _is_compared_by_identity(cls):
+            append((i, id(i)))
+        else:
+            append(_value_part(i))
+
+
+def _value_part(value: Any) -> Hashable:
+    """Return the part of a cache key representing `value` by value.
+
+    Strings are their own part, and every other part is a tuple starting with the type
+    of the value, so parts of different types can never be equal.
+    `decimal.Decimal`s are represented by their string, so that decimals with the
+    same value but different exponents are different. Objects compared by identity
+    are represented by themselves and their `id`, which can't be reused while the
+    object is kept in the key. Mappings and sequences are represented by the
+    encoding of `_extend_key`, sets by the parts of their items, and any other values
+    by themselves if they are hashable or by their `repr` otherwise.
+    """
+
+    cls = type(value)
+    if cls is str:
+        return value
+    if cls is decimal.Decimal:
+        return (cls, str(value))
+    if cls is float:
+        # 0.0 and -0.0 are equal, but can produce different results.
+        return (cls, value) if value else (cls, repr(value))
+    if cls in _VALUE_TYPES:
+        return (cls, value)
+    if _is_compared_by_identity(cls):
+        # `_make_key` and `_extend_key` append the type and `(value, id(value))`
+        # directly, so this is only reached for the items of sets.
+        return (cls, value, id(value))
+    parts: list[Any] = [cls]
+    if cls in _CONTAINER_TYPES or isinstance(value, (Mapping, list, tuple)):
+        _extend_key(parts, value)
+    elif isinstance(value, (set, frozenset)):
+        parts.append(frozenset([_value_part(i) for i in value]))
+    elif cls.__hash__ is not None:
+        return (cls, value)
+    else:
+        parts.append(repr(value))
+    return tuple(parts)
+
+
+def _make_key(args: tuple, kwargs: dict[str, Any]) -> tuple:
+    """Return the cache key for a call with `args` and `kwargs`.
+
+    The key is a flat tuple with the type of each argument followed by a single part
+    representing the argument, or the flat encoding of its items for plain dicts,
+    lists and tuples, and the keyword arguments encoded like the items of a dict, so
+    that most calls only allocate the key itself.
+
+    Positional and keyword arguments are compared the same way:
+
+    * `int`, `str`, `bool`, `bytes` and `None` are compared by value.
+    * `float`s are compared by value, except that 0.0 and -0.0 are different.
+    * `decimal.Decimal`s are compared by their string, so that precision is taken
+      into account. E.g. a rounding function that takes a decimal quantizer as an
+      argument does not give the same result for decimals with different numbers of
+      trailing zeros but the same actual value.
+    * Objects like `linearmoney.vector.MoneyVector` that use their hash for equality
+      are compared by identity, so two different objects with colliding hashes
+      can't share a cache entry.
+    * Mappings, sequences and sets, hashable or not, are compared by their items,
+      where each item is compared like an argument.
+    * Other hashable values are compared by value, and other unhashable values by
+      their `repr`.
+
+    Including the type of every argument also distinguishes numbers of different
+    types with equal values, so that e.g. an unsupported numeric type passed to an
+    operator doesn't share a cache entry with a supported type.
+    """
+
+    key: list[Any] = []
+    append = key.append
+    for i in args:
+        cls = type(i)
+        append(cls)
+        if cls in _VALUE_TYPES:
+            append(i)
+        elif cls is decimal.Decimal:
+            append(str(i))
+        elif _is_compared_by_identity(cls):
+            # The most common arguments after scalars, so they skip `_value_part`.
+            # The check registers the class, so that the first key for a class has
+            # the same shape as every later key.
+            append((i, id(i)))
+        elif cls in _CONTAINER_TYPES:
+            _extend_key(key, i)
+        else:
+            append(_value_part(i))
+    if kwargs:
+        append(_KWARGS_MARKER)
+        _extend_key(key, kwargs)
+    return tuple(key)
+
+
 def _hit(
     func: Callable[P, T],
     *args,
     size_multiplier: int | float,
+    policy: _Policy | None,
+    max_bytes: int | None = None,
     **kwargs,
 ) -> T:
     """Hit the cache.
@@ -339,66 +1511,98 @@ def _hit(
     If `func` has not been called yet at all, create a new _LRUFuncCache for `func`
     and cache the value of the current call.
 
-    The argument parsing portion of this function includes a check for numeric types
-    like `decimal.Decimal` that makes sure that precision is taken into account when
-    hashing arguments, so that for example, a rounding function that takes a decimal
-    quantizer as an argument does not give the same result for decimals with different
-    numbers of trailing zeros but the same actual value.
+    See `_make_key` for how the arguments are compared.
     """
 
     _funccache: _LRUFuncCache
     try:
         _funccache = _get_funccache(func)
     except CacheError:
-        _funccache = _LRUFuncCache(
-            funcname=func.__qualname__, size_multiplier=size_multiplier
-        )
-        _get_cachedict()[func.__qualname__] = _funccache
-    key_accumulator: list[Hashable] = []
-    if args:
-        for i in args:
-            if isinstance(i, Hashable):
-                if isinstance(i, decimal.Decimal):
-                    # Ensure Decimals of different precision are treated separately.
-                    key_accumulator.append(str(i))
-                else:
-                    # Other supported numeric types need to be distinguished from
-                    # unsupported numeric types with the same value.
-                    # `id` is included to avoid natural hash collisions between numbers
-                    # of the same type but different values. E.g. -1 and -2
-                    key_accumulator.append((type(i), i, id(i)))
-            else:
-                key_accumulator.append(repr(i))
-    if kwargs:
-        for k, v in kwargs.items():
-            if isinstance(v, Hashable):
-                if isinstance(v, decimal.Decimal):
-                    # Ensure Decimals of different precision are treated separately.
-                    key_accumulator.append((k, str(v)))
-                else:
-                    # Other supported numeric types need to be distinguished from
-                    # unsupported numeric types with the same value.
-                    key_accumulator.append((k, type(v), v))
-            else:
-                key_accumulator.append((k, repr(v)))
-    cache_key = tuple(key_accumulator)
-    if not _funccache.is_cached(cache_key):
-        value = func(*args, **kwargs)
-        _funccache.write(cache_key, value)
-        return value
-    else:
+        _funccache = _create_funccache(func, size_multiplier, policy, max_bytes)
+    if _stats_enabled:
+        return _hit_with_stats(_funccache, func, args, kwargs)
+    cache_key = _make_key(args, kwargs)
+    # A single lookup instead of `is_cached` and `read`, so that another thread
+    # sharing the cache can't evict the value between the two calls.
+    try:
         return _funccache.read(cache_key)
+    except KeyError:
+        pass
+    value = func(*args, **kwargs)
+    _funccache.write(cache_key, value)
+    if _max_bytes is not None:
+        _enforce_max_bytes()
+    return value
+
+
+def _hit_with_stats(
+    funccache: _LRUFuncCache,
+    func: Callable[P, T],
+    args: tuple,
+    kwargs: dict[str, Any],
+) -> T:
+    """Same as the lookup of `_hit`, but records the statistics of the call in
+    `funccache`."""
+
+    started = time.perf_counter()
+    cache_key = _make_key(args, kwargs)
+    key_time = time.perf_counter() - started
+    try:
+        value = funccache.read(cache_key)
+    except KeyError:
+        pass
+    else:
+        funccache.record_hit(key_time)
+        return value
+    started = time.perf_counter()
+    value = func(*args, **kwargs)
+    func_time = time.perf_counter() - started
+    funccache.write(cache_key, value)
+    funccache.record_miss(key_time, func_time)
+    if _max_bytes is not None:
+        _enforce_max_bytes()
+    return value
 
 
 def cached(
     size_multiplier: int | float = 1,
+    policy: _Policy | None = None,
+    max_bytes: int | None = None,
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:  # pragma: no cover
     """Used just like the `functools.lru_cache` decorator, but it allows unhashable
     types and has some special handling for numeric types, and in particular
     `decimal.Decimal` that takes precision into account, so that e.g. a rounding
     function that expects a decimal as an argument to be used in a
     `decimal.Decimal.quantize()` call will not treat two `decimal.Decimal`s with
-    different trailing zeros as the same argument even if they have the same value."""
+    different trailing zeros as the same argument even if they have the same value.
+
+    `policy` is the eviction policy of the function's cache. If it is `None`
+    (default), the default policy when the cache is created is used.
+    See `set_policy` for the available policies.
+
+    `max_bytes` is the maximum approximate number of bytes of the function's cache.
+    If it is not `None`, the least valuable values according to the eviction policy
+    are evicted whenever the cached values use more bytes, even if the cache has
+    fewer than `max_size` entries. See `set_max_bytes` for how the sizes are
+    estimated.
+
+    Raises:
+        ValueError:
+            If `policy` is not `None` or one of the available policies.
+        TypeError:
+            If `max_bytes` is not `None` and doesn't support int.
+    """
+
+    if policy is not None and policy not in _policy_classes:
+        raise ValueError(
+            f"cached(): Expected one of {tuple(_policy_classes)}, got {policy!r}"
+        )
+    if max_bytes is not None:
+        if not isinstance(max_bytes, SupportsInt):
+            raise TypeError(
+                f"cached(): Expected `SupportsInt` or `None`, got {type(max_bytes)}"
+            )
+        max_bytes = int(max_bytes)
 
     def _outer_wrapper(func: Callable[P, T]) -> Callable[P, T]:
         @functools.wraps(func)
@@ -407,6 +1611,8 @@ def cached(
                 return _hit(
                     func,
                     size_multiplier=size_multiplier,
+                    policy=policy,
+                    max_bytes=max_bytes,
                     *args,
                     **kwargs,
                 )
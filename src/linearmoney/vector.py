@@ -5,27 +5,70 @@ from __future__ import annotations
 __all__: list[str] = [
     "asset",
     "forex",
+    "update_forex",
+    "triangulate",
     "basis_vector",
     "space",
     "gamma",
     "dot",
     "evaluate",
+    "evaluate_many",
     "convert",
+    "convert_many",
+    "ApproxEvaluator",
+    "evaluate_approx",
+    "nlargest",
+    "nsmallest",
+    "argsort",
+    "cross_rates",
+    "evaluate_all",
     "store",
     "restore",
+    "matrix",
+    "asset_matrix",
+    "sum",
+    "group_sum",
+    "lazy",
+    "fixed_space",
+    "to_sparse",
+    "to_dense",
+    "to_fixed",
+    "project",
     "MoneyVector",
+    "SparseMoneyVector",
+    "FixedMoneyVector",
     "ForexVector",
+    "LazyMoneyVector",
+    "MoneyMatrix",
+    "FixedMoneyMatrix",
+    "Evaluator",
+    "ForexHistory",
+    "CrossRates",
+    "Portfolio",
+    "GroupAccumulator",
     "CurrencySpace",
     "RatesDict",
 ]
 
+import bisect
+import builtins
 import copy
 import decimal
-from collections.abc import Iterator
-from typing import TYPE_CHECKING, TypeAlias, TypedDict, TypeVar
-
-from linearmoney import _utils, cache
-from linearmoney.exceptions import IntegrityError, SpaceError
+import heapq
+import itertools
+import threading
+from collections.abc import (
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from typing import TYPE_CHECKING, Any, TypeAlias, TypedDict, TypeVar
+
+from linearmoney import _kernels, _utils, cache, data
+from linearmoney.exceptions import IntegrityError, SpaceError, UnknownDataError
 from linearmoney.mixins import EqualityByHashMixin, ImmutableDeduplicationMixin
 
 if TYPE_CHECKING:
@@ -38,27 +81,78 @@ _ONE = decimal.Decimal(1)
 
 # TypeVar needed for typechecking subclasses returned in place of base class.
 V = TypeVar("V", bound="MoneyVector")
+T = TypeVar("T")
+
+
+# Maps of ISO codes to axis indices by the id of the axes tuple they were built for.
+# Vectors share the axes tuple of their space, so looking up the map by identity takes
+# constant time regardless of the number of axes. Each entry keeps its axes tuple
+# alive, so the id can't be reused by another tuple while the entry exists.
+_INDEX_MAPS: dict[int, tuple[tuple[str, ...], dict[str, int]]] = {}
+# The oldest maps are dropped once there are more maps than this, so that processes
+# creating many ad-hoc spaces don't keep a map for every axes tuple they have seen.
+_MAX_INDEX_MAPS = 256
+_index_maps_lock = threading.Lock()
+
+
+def _index_map(axes: tuple[str, ...]) -> dict[str, int]:
+    """Return the mapping of the ISO codes in `axes` to their indices."""
+
+    entry = _INDEX_MAPS.get(id(axes))
+    if entry is not None and entry[0] is axes:
+        return entry[1]
+    indices = {axis: idx for idx, axis in enumerate(axes)}
+    with _index_maps_lock:
+        while len(_INDEX_MAPS) >= _MAX_INDEX_MAPS:
+            del _INDEX_MAPS[next(iter(_INDEX_MAPS))]
+        _INDEX_MAPS[id(axes)] = (axes, indices)
+    return indices
 
 
 class CurrencySpace(ImmutableDeduplicationMixin, EqualityByHashMixin):
     """Represents the currency space of a `MoneyVector`."""
 
-    __slots__ = ["_axes", "_currencies", "_hash"]
+    __slots__ = ["_axes", "_currencies", "_indices", "_places", "_hash"]
 
-    def __init__(self, axes: tuple[str, ...]) -> None:
+    def __init__(
+        self, axes: tuple[str, ...], places: int | tuple[int, ...] | None = None
+    ) -> None:
         """
         Args:
             axes:
                 A tuple of ISO 4217 currency codes representing the euclidean axes of the
                 vector space.
+            places:
+                If not `None`, asset vectors created in this space use the fixed-point
+                integer backend (`FixedMoneyVector`) with this many decimal places.
+                Either a single number of places for all axes or a tuple with the
+                number of places for each axis. See `fixed_space`.
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If `places` is a tuple that is not the same length as `axes`.
+            ValueError:
+                If any of the `places` are negative.
         """
 
+        if isinstance(places, int):
+            places = tuple([places for _ in axes])
+        if places is not None:
+            if len(places) != len(axes):
+                raise SpaceError("Must have the same number of places as axes.")
+            if any([p < 0 for p in places]):
+                raise ValueError("Fixed-point places must not be negative.")
         self._axes = axes
         self._currencies = set(axes)
-        self._hash = hash((axes, repr(self._currencies)))
+        self._indices = _index_map(axes)
+        self._places = places
+        self._hash = hash((axes, repr(self._currencies), places))
 
     def __repr__(self) -> str:
-        return "".join(["CurrencySpace", str(self.axes)])
+        if self._places is None:
+            return "".join(["CurrencySpace", str(self.axes)])
+        return "".join(
+            ["CurrencySpace", str(self.axes), ", places=", str(self._places)]
+        )
 
     @property
     def axes(self) -> tuple[str, ...]:
@@ -83,6 +177,67 @@ class CurrencySpace(ImmutableDeduplicationMixin, EqualityByHashMixin):
 
         return self._currencies
 
+    def index(self, iso_code: str) -> int:
+        """Return the index of the axis `iso_code` in this currency space.
+
+        The indices are precomputed, so this takes constant time regardless of the
+        number of axes.
+
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If `iso_code` is not an axis of this currency space.
+
+        Example:
+            >>> import linearmoney as lm
+            >>> fo = lm.vector.forex({"base": "usd", "rates": {"jpy": 100}})
+            >>> lm.vector.space(fo).index("usd")
+            1
+        """
+
+        try:
+            return self._indices[iso_code.upper()]
+        except KeyError:
+            raise SpaceError(f"{iso_code.upper()} is not part of {self}")
+
+    @property
+    def places(self) -> tuple[int, ...] | None:
+        """The number of fixed-point decimal places for each axis, or `None` if this
+        space uses `decimal.Decimal` components."""
+
+        return self._places
+
+    def union(self, *others: CurrencySpace) -> CurrencySpace:
+        """Return a new `CurrencySpace` whose axes are the currencies of this space and
+        all of the `others` in sorted order.
+
+        The union only uses fixed-point components if every space does, in which case
+        each axis keeps its places. Vectors from any of the spaces can be moved into
+        the union with `project`.
+
+        Raises:
+            ValueError:
+                If two of the spaces use different fixed-point places for the same
+                axis.
+
+        Example:
+            >>> import linearmoney as lm
+            >>> sp1 = lm.vector.CurrencySpace(("JPY", "USD"))
+            >>> sp2 = lm.vector.CurrencySpace(("EUR", "USD"))
+            >>> sp1.union(sp2)
+            CurrencySpace('EUR', 'JPY', 'USD')
+        """
+
+        spaces = (self, *others)
+        axes = tuple(sorted(set().union(*[i._currencies for i in spaces])))
+        if any([i._places is None for i in spaces]):
+            return CurrencySpace(axes)
+        places: dict[str, int] = {}
+        for i in spaces:
+            for axis, p in zip(i._axes, i._places):  # type: ignore[arg-type]
+                if places.setdefault(axis, p) != p:
+                    raise ValueError(f"{axis} has different places in {self} and {i}.")
+        return CurrencySpace(axes, tuple([places[axis] for axis in axes]))
+
     def __hash__(self) -> int:
         return self._hash
 
@@ -113,19 +268,49 @@ class MoneyVector(ImmutableDeduplicationMixin, EqualityByHashMixin):
         if len(decimal_vector) != len(axes):
             raise SpaceError("Must have the same number of components as axes.")
         self._vector = decimal_vector
-        self._v_repr = str(tuple([str(component) for component in decimal_vector]))
         self._axes = axes
-        self._hash = hash((self._vector, self._axes))
+        # The repr and hash are only computed when they are first used.
+        self._v_repr: str | None = None
+        self._hash: int | None = None
+
+    @classmethod
+    def _from_trusted(
+        cls, decimal_vector: DecimalVector, axes: tuple[str, ...]
+    ) -> Self:
+        """Create a new vector without validating the arguments.
+
+        Only for the results of operations on vectors that are already known to be
+        valid, so that intermediate results don't pay for validation.
+        """
+
+        vec = cls.__new__(cls)
+        vec._vector = decimal_vector
+        vec._axes = axes
+        vec._v_repr = None
+        vec._hash = None
+        return vec
 
     def __str__(self) -> str:
         return self.__repr__()
 
     def __repr__(self) -> str:
+        v_repr = self._v_repr
+        if v_repr is None:
+            v_repr = self._v_repr = self._format_components()
+        return f"{self.__class__.__name__}{v_repr}"
+
+    def _format_components(self) -> str:
         # Preserve precision of Decimals
-        return f"{self.__class__.__name__}{self._v_repr}"
+        return str(tuple([str(component) for component in self._vector]))
 
     def __hash__(self) -> int:
-        return self._hash
+        _hash = self._hash
+        if _hash is None:
+            _hash = self._hash = self._hash_value()
+        return _hash
+
+    def _hash_value(self) -> int:
+        return _hash_components(enumerate(self._vector), self._axes)
 
     def __getitem__(self, idx: int) -> decimal.Decimal:
         return self._vector[idx]
@@ -136,6 +321,28 @@ class MoneyVector(ImmutableDeduplicationMixin, EqualityByHashMixin):
     def __len__(self) -> int:
         return len(self._vector)
 
+    def component(self, iso_code: str) -> decimal.Decimal:
+        """Return the component of this vector along the axis `iso_code`.
+
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If `iso_code` is not an axis of this vector's currency space.
+
+        Example:
+            >>> import linearmoney as lm
+            >>> fo = lm.vector.forex({"base": "usd", "rates": {"jpy": 100}})
+            >>> sp = lm.vector.space(fo)
+            >>> (lm.vector.asset(10, "usd", sp) + lm.vector.asset(5, "jpy", sp)).component("jpy")
+            Decimal('5')
+        """
+
+        iso_code = iso_code.upper()
+        try:
+            idx = _index_map(self._axes)[iso_code]
+        except KeyError:
+            raise SpaceError(f"{iso_code} is not an axis of {self}")
+        return self[idx]
+
     @cache.cached()
     def __add__(self, other: MoneyVector) -> Self:
         # Raises `SpaceError` if the two vectors are not part of the same currency
@@ -144,11 +351,11 @@ class MoneyVector(ImmutableDeduplicationMixin, EqualityByHashMixin):
         if not isinstance(other, MoneyVector):
             return NotImplemented
 
-        if self.axes != other.axes:
+        if self._axes != other._axes:
             raise SpaceError("MoneyVectors must be in the same space.")
 
-        new_vector = tuple([self[i] + other[i] for i in range(self.dim)])
-        return self.__class__(new_vector, self.axes)
+        new_vector = tuple([i + j for i, j in zip(self._vector, other)])
+        return self.__class__._from_trusted(new_vector, self._axes)
 
     @cache.cached()
     def __radd__(self, other: MoneyVector) -> Self:
@@ -164,11 +371,11 @@ class MoneyVector(ImmutableDeduplicationMixin, EqualityByHashMixin):
         if not isinstance(other, MoneyVector):
             return NotImplemented
 
-        if self.axes != other.axes:
+        if self._axes != other._axes:
             raise SpaceError("MoneyVectors must be in the same space.")
 
-        new_vector = tuple([self[i] - other[i] for i in range(self.dim)])
-        return self.__class__(new_vector, self.axes)
+        new_vector = tuple([i - j for i, j in zip(self._vector, other)])
+        return self.__class__._from_trusted(new_vector, self._axes)
 
     @cache.cached()
     def __rsub__(self, other: V) -> V:
@@ -182,7 +389,9 @@ class MoneyVector(ImmutableDeduplicationMixin, EqualityByHashMixin):
             scalar = _utils.coerce_decimal(scalar)
         except NotImplementedError:
             return NotImplemented
-        return self.__class__(tuple([scalar * i for i in self]), self.axes)
+        return self.__class__._from_trusted(
+            tuple([scalar * i for i in self._vector]), self._axes
+        )
 
     @cache.cached()
     def __rmul__(self, scalar: decimal.Decimal | int | float | str) -> Self:
@@ -202,7 +411,9 @@ class MoneyVector(ImmutableDeduplicationMixin, EqualityByHashMixin):
 
     @cache.cached()
     def __neg__(self) -> Self:
-        return self.__class__(tuple([-i for i in self]), self.axes)
+        return self.__class__._from_trusted(
+            tuple([-i for i in self._vector]), self._axes
+        )
 
     @property
     @cache.cached()
@@ -220,290 +431,3358 @@ class MoneyVector(ImmutableDeduplicationMixin, EqualityByHashMixin):
         return self._axes
 
 
-class ForexVector(MoneyVector):
-    """A [forex vector](/linearmoney/glossary.html#forex-vector) in the
-    [linear money model](/linear_money_model.html)."""
+def _hash_components(
+    components: Iterable[tuple[int, decimal.Decimal]], axes: tuple[str, ...]
+) -> int:
+    """Hash the (index, component) pairs of a vector in the space given by `axes`.
 
-    @cache.cached()
-    def __neg__(self) -> Self:
-        raise (IntegrityError("Forex vectors can not have negative-valued components."))
+    Only non-zero components contribute to the hash, so that equal dense and sparse
+    vectors hash the same, and a sparse vector can be hashed in time proportional
+    to its number of non-zero components.
+    """
 
+    return hash((axes, tuple([(idx, v) for idx, v in components if v])))
+
+
+class SparseMoneyVector(MoneyVector):
+    """A money vector that only stores its non-zero components.
+
+    Most vectors in a large currency space only have a few non-zero components.
+    E.g. an [*Asset Vector*](/linearmoney/glossary.html#asset-vector) in a space of
+    every supported currency has one non-zero component and hundreds of zeros.
+    A `SparseMoneyVector` behaves exactly like a `MoneyVector` with the same
+    components, and it compares equal to one, but addition, subtraction, scalar
+    multiplication, hashing, `dot` and `evaluate` only take time proportional to the
+    number of non-zero components.
+
+    Operations between a sparse vector and a dense vector return a dense
+    `MoneyVector` since the result generally has non-zero components along every axis
+    anyway.
+
+    Zero-valued components are not stored, so unlike a dense vector, a sparse vector
+    does not preserve the precision (trailing zeros) of zero components.
+
+    Example:
+        >>> import linearmoney as lm
+        >>> fo = lm.vector.forex({"base": "usd", "rates": {"jpy": 100, "eur": 0.5}})
+        >>> sp = lm.vector.space(fo)
+        >>> sv = lm.vector.asset(10, "usd", sp, sparse=True)
+        >>> sv
+        SparseMoneyVector{'USD': '10'}
+        >>> tuple(sv)
+        (Decimal('0'), Decimal('0'), Decimal('10'))
+        >>> sv == lm.vector.asset(10, "usd", sp)
+        True
+        >>> sv + lm.vector.asset(5, "eur", sp, sparse=True)
+        SparseMoneyVector{'EUR': '5', 'USD': '10'}
+    """
 
-@cache.cached()
-def basis_vector(currency_space: CurrencySpace, axis: str) -> MoneyVector:
-    """Return the Euclidean basis vector corresponding to `axis` in `currency_space`.
+    __slots__ = ["_components"]
 
-    Raises:
-        `linearmoney.exceptions.SpaceError`:
-            If `axis` is not part of `currency_space`.
-    """
+    def __init__(
+        self, components: Mapping[int, decimal.Decimal], axes: tuple[str, ...]
+    ) -> None:
+        """
+        Args:
+            components:
+                A mapping of axis indices to the components of the vector along those
+                axes. Components that are not included are zero.
+            axes:
+                The ISO 4217 currency codes that correspond to the axes of the vector's
+                currency space.
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If any of the indices in `components` are not valid indices of `axes`.
+        """
 
-    axis = axis.upper()
+        dim = len(axes)
+        for idx in components:
+            if not 0 <= idx < dim:
+                raise SpaceError(f"Component index {idx} is not an axis of {axes}.")
+        self._components = {
+            idx: components[idx] for idx in sorted(components) if components[idx]
+        }
+        self._axes = axes
+        self._v_repr = None
+        self._hash = None
 
-    if axis not in currency_space.currencies:
-        raise SpaceError(
-            f"Currency {axis} is not part of currency space {currency_space}"
+    def _format_components(self) -> str:
+        axes = self._axes
+        return str(
+            {axes[idx]: str(component) for idx, component in self._components.items()}
         )
-    _vector = tuple([_ONE if i == axis else _ZERO for i in currency_space.axes])
-    return MoneyVector(_vector, currency_space.axes)
 
+    def _hash_value(self) -> int:
+        return _hash_components(self._components.items(), self._axes)
 
-@cache.cached()
-def dot(vec1: MoneyVector, vec2: MoneyVector) -> decimal.Decimal:
-    """Calculate and return the dot product of vectors `vec1` and `vec2`.
+    def __getitem__(self, idx: int) -> decimal.Decimal:
+        if isinstance(idx, slice):
+            return tuple(self)[idx]
+        dim = len(self._axes)
+        if idx < 0:
+            idx += dim
+        if not 0 <= idx < dim:
+            raise IndexError("SparseMoneyVector index out of range")
+        return self._components.get(idx, _ZERO)
 
-    Raises:
-        `linearmoney.exceptions.SpaceError`:
-            If the two vectors are not part of the same currency space.
-    """
+    def __iter__(self) -> Iterator:
+        get = self._components.get
+        return iter([get(idx, _ZERO) for idx in range(len(self._axes))])
 
-    if vec1.axes != vec2.axes:
-        raise SpaceError("MoneyVectors must be in the same space.")
+    def __len__(self) -> int:
+        return len(self._axes)
 
-    product = decimal.Decimal(
-        str(sum([vec1[idx] * vec2[idx] for idx in range(vec1.dim)]))
-    )
-    return product
+    @cache.cached()
+    def __add__(self, other: MoneyVector) -> MoneyVector:  # type: ignore[override]
+        # Raises `SpaceError` if the two vectors are not part of the same currency
+        # space.
 
+        if not isinstance(other, MoneyVector):
+            return NotImplemented
 
-@cache.cached()
-def space(vec: MoneyVector) -> CurrencySpace:
-    """Create and return a new `CurrencySpace` representing the space that `vec`
-    belongs to."""
+        if self._axes != other._axes:
+            raise SpaceError("MoneyVectors must be in the same space.")
 
-    return CurrencySpace(vec.axes)
+        if isinstance(other, SparseMoneyVector):
+            new_components = dict(self._components)
+            for idx, component in other._components.items():
+                if idx in new_components:
+                    new_components[idx] = new_components[idx] + component
+                else:
+                    new_components[idx] = component
+            return self.__class__(new_components, self._axes)
+        return MoneyVector._from_trusted(
+            tuple([i + j for i, j in zip(self, other)]), self._axes
+        )
 
+    @cache.cached()
+    def __sub__(self, other: MoneyVector) -> MoneyVector:  # type: ignore[override]
+        # Raises `SpaceError` if the two vectors are not part of the same currency
+        # space.
 
-@cache.cached(size_multiplier=16)
-def asset(
-    amount: int | float | decimal.Decimal, iso_code: str, currency_space: CurrencySpace
-) -> MoneyVector:
-    """Create a new [*Asset Vector*](/linearmoney/glossary.html#asset-vector) in `currency_space`
-    with `amount` of `iso_code` as it's only non-zero component.
+        if not isinstance(other, MoneyVector):
+            return NotImplemented
 
-    Raises:
-        `linearmoney.exceptions.SpaceError`:
-            If `iso_code` is not part of `currency_space`.
-    """
+        if self._axes != other._axes:
+            raise SpaceError("MoneyVectors must be in the same space.")
 
-    iso_code = iso_code.upper()
+        if isinstance(other, SparseMoneyVector):
+            new_components = dict(self._components)
+            for idx, component in other._components.items():
+                if idx in new_components:
+                    new_components[idx] = new_components[idx] - component
+                else:
+                    new_components[idx] = _ZERO - component
+            return self.__class__(new_components, self._axes)
+        return MoneyVector._from_trusted(
+            tuple([i - j for i, j in zip(self, other)]), self._axes
+        )
 
-    if iso_code not in currency_space.currencies:
-        raise SpaceError(f"{iso_code} is not part of {currency_space}")
+    @cache.cached()
+    def __mul__(self, scalar: decimal.Decimal | int | float | str) -> Self:
+        try:
+            scalar = _utils.coerce_decimal(scalar)
+        except NotImplementedError:
+            return NotImplemented
+        return self.__class__(
+            {idx: scalar * i for idx, i in self._components.items()}, self._axes
+        )
 
-    try:
-        _amount = _utils.coerce_decimal(amount)
-    except NotImplementedError:
-        raise TypeError(f"Unsupported type for argument `amount`: {type(amount)}")
+    @cache.cached()
+    def __neg__(self) -> Self:
+        return self.__class__(
+            {idx: -i for idx, i in self._components.items()}, self._axes
+        )
 
-    _vector = tuple([_amount if i == iso_code else _ZERO for i in currency_space.axes])
-    return MoneyVector(_vector, currency_space.axes)
 
+def to_sparse(vec: MoneyVector) -> SparseMoneyVector:
+    """Return a `SparseMoneyVector` with the same components as `vec`."""
 
-_DecimalRates: TypeAlias = dict[str, decimal.Decimal]
-_NumericRates: TypeAlias = dict[str, int | float | decimal.Decimal]
+    if isinstance(vec, SparseMoneyVector):
+        return vec
+    return SparseMoneyVector(
+        {idx: component for idx, component in enumerate(vec) if component}, vec._axes
+    )
 
 
-class RatesDict(TypedDict):
-    """A dictionary representing forex rates ***from*** `base` ***to*** each of the
-    keys in `rates`.
+def to_dense(vec: MoneyVector) -> MoneyVector:
+    """Return a dense `MoneyVector` with `decimal.Decimal` components that are the same
+    as the components of `vec`."""
 
-    The key names of this dict are chosen to match the most common structure returned
-    by public HTTP APIs for forex data since that is how most applications
-    will source their forex rates, so this allows passing the results of e.g.
-    `json.load(api_response)` directly to any function that accepts this type.
-    """
+    if isinstance(vec, (SparseMoneyVector, FixedMoneyVector)):
+        return MoneyVector._from_trusted(tuple(vec), vec._axes)
+    return vec
 
-    base: str
-    rates: _NumericRates
 
+def _to_fixed(amount: decimal.Decimal, places: int) -> int:
+    """Return `amount` as an integer number of `10 ** -places` units.
 
-@cache.cached()
-def _coerce_decimal_rates(numeric_rates: _NumericRates) -> _DecimalRates:
-    """Coerce the values of `numeric_rates` to `decimal.Decimal` and force all keys
-    to uppercase."""
+    Raises:
+        ValueError:
+            If `amount` can't be represented exactly with `places` decimal places.
+    """
 
-    return {k.upper(): _utils.coerce_decimal(v) for k, v in numeric_rates.items()}
+    numerator, denominator = amount.as_integer_ratio()
+    scaled, remainder = divmod(numerator * 10**places, denominator)
+    if remainder:
+        raise ValueError(f"{amount} can't be represented with {places} decimal places.")
+    return scaled
+
+
+def _from_fixed(value: int, places: int) -> decimal.Decimal:
+    """Return the `decimal.Decimal` represented by the fixed-point integer `value`."""
+
+    # Parsing the scientific notation string is exact regardless of the context.
+    return decimal.Decimal(f"{value}E-{places}")
+
+
+class FixedMoneyVector(MoneyVector):
+    """A money vector whose components are stored as integers scaled to a fixed number
+    of decimal places per axis.
+
+    Fixed-point vectors are created by calling `asset` with a currency space created
+    by `fixed_space` (or a `CurrencySpace` created with `places`).
+
+    Addition and subtraction of two fixed-point vectors with the same places,
+    negation, and multiplication by an `int` only use integer arithmetic, and the
+    components are only converted to `decimal.Decimal` when they are read.
+    The components that are read out always have exactly the number of decimal places
+    of their axis, but they have exactly the same values as the components of the
+    equivalent `decimal.Decimal` vectors, and fixed-point vectors compare equal to
+    `MoneyVector`s with the same values.
+
+    All other operations, such as multiplication by a non-integer scalar or division,
+    or addition of a fixed-point vector and a vector that does not use the same places,
+    fall back to the `decimal.Decimal` implementation and return a `MoneyVector`.
+
+    Example:
+        >>> import linearmoney as lm
+        >>> fo = lm.vector.forex({"base": "usd", "rates": {"jpy": 100}})
+        >>> sp = lm.vector.fixed_space(lm.vector.space(fo))
+        >>> sp.places
+        (0, 2)
+        >>> fv = lm.vector.asset("10.5", "usd", sp) + lm.vector.asset(25, "jpy", sp)
+        >>> fv
+        FixedMoneyVector('25', '10.50')
+        >>> fv * 3
+        FixedMoneyVector('75', '31.50')
+        >>> fv / 2
+        MoneyVector('12.5', '5.250')
+    """
 
+    __slots__ = ["_ints", "_places"]
 
-@cache.cached()
-def _merge_rates(base_rates: _DecimalRates, overrides: _DecimalRates) -> _DecimalRates:
-    """Override values in `base_rates` with corresponding values in `overrides`.
-    Any keys in `overrides` not present in `base_rates` will be merged into `base_rates
-    as well."""
+    def __init__(
+        self, ints: tuple[int, ...], places: tuple[int, ...], axes: tuple[str, ...]
+    ) -> None:
+        """
+        Args:
+            ints:
+                The components of the vector as integer numbers of the smallest unit of
+                each axis. E.g. `1050` with `2` places represents `Decimal("10.50")`.
+            places:
+                The number of decimal places for each axis.
+            axes:
+                The ISO 4217 currency codes that correspond to the axes of the vector's
+                currency space.
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If `ints`, `places` and `axes` are not all the same length.
+        """
 
-    r = {k: v for k, v in base_rates.items()}
-    r.update(overrides)
-    return r
+        if len(ints) != len(axes) or len(places) != len(axes):
+            raise SpaceError("Must have the same number of components as axes.")
+        self._ints = ints
+        self._places = places
+        self._axes = axes
+        self._v_repr = None
+        self._hash = None
+
+    @classmethod
+    def _from_trusted(  # type: ignore[override]
+        cls, ints: tuple[int, ...], places: tuple[int, ...], axes: tuple[str, ...]
+    ) -> Self:
+        vec = cls.__new__(cls)
+        vec._ints = ints
+        vec._places = places
+        vec._axes = axes
+        vec._v_repr = None
+        vec._hash = None
+        return vec
+
+    def _format_components(self) -> str:
+        return str(tuple([str(component) for component in self]))
+
+    def _hash_value(self) -> int:
+        return _hash_components(enumerate(self), self._axes)
 
+    def __getitem__(self, idx: int) -> decimal.Decimal:
+        if isinstance(idx, slice):
+            return tuple(self)[idx]
+        return _from_fixed(self._ints[idx], self._places[idx])
 
-@cache.cached()
-def _invert_rates(rates: _DecimalRates) -> _DecimalRates:
-    """Invert the forex rates given by `rates`.
+    def __iter__(self) -> Iterator:
+        return iter([_from_fixed(i, p) for i, p in zip(self._ints, self._places)])
 
-    Input forex rates are assumed to represent the rates from
-    Quote Currency -> All Currencies. This function inverts them to represent the
-    rates from All Currencies -> Quote Currency.
+    def __len__(self) -> int:
+        return len(self._ints)
 
-    E.g. (EUR -> EUR, EUR -> JPY, EUR -> USD) becomes
-    (EUR -> EUR, JPY -> EUR, USD -> EUR).
-    """
+    @cache.cached()
+    def __add__(self, other: MoneyVector) -> MoneyVector:  # type: ignore[override]
+        # Raises `SpaceError` if the two vectors are not part of the same currency
+        # space.
 
-    return {k: (_ONE / v) for k, v in rates.items()}
+        if not isinstance(other, MoneyVector):
+            return NotImplemented
 
+        if self._axes != other._axes:
+            raise SpaceError("MoneyVectors must be in the same space.")
 
-@cache.cached()
-def forex(
-    forex_rates: RatesDict, **overrides: int | float | decimal.Decimal
-) -> ForexVector:
-    r"""Construct a new `ForexVector` suitable for use in the `gamma` function.
+        if isinstance(other, FixedMoneyVector) and self._places == other._places:
+            return self.__class__._from_trusted(
+                tuple([i + j for i, j in zip(self._ints, other._ints)]),
+                self._places,
+                self._axes,
+            )
+        return MoneyVector._from_trusted(
+            tuple([i + j for i, j in zip(self, other)]), self._axes
+        )
 
-    Args:
-        forex_rates:
-            A mapping where each of the values in `forex_rates["rates"]` specifies
-            the rate ***from*** `forex_rates["base"]` ***to*** the value's
-            corresponding key.
-            `forex_rates["base"]` and all keys in `forex_rates["rates"]` are treated as
-            case-insensitive, and all numeric rate values are forced to
-            `decimal.Decimal`, so `{"base": "eur", "rates": {"usd": 0.1}}` and
-            `{"base": "EUR", "rates": {"USD": decimal.Decimal("0.1")}}` are treated as
-            equivalent.
-            If the `rates` key of `forex_rates` is an empty dictionary, then
-            we create a forex vector with only one rate, which is `base -> base = 1`.
-            This makes it clear that a forex vector is intended to force
-            [single-currency](/user_guide/recipes.html#single-currency-application) calculations.
-        \*\*overrides:
-            Additional kwargs interpreted as ISO 4217 currency codes that should be
-            manually overriden with the value provided or added to the set of
-            exchange rates if the code is not already present in
-            `forex_rates["rates"]`.
-            Any rates passed as kwargs are interpreted in
-            the same way as if they had been included in the `forex_rates["rates"]`
-            nested mapping, so they should represent the exchange rates ***from***
-            `forex_rates["base"]` ***to*** the currency represented by the name of
-            the kwarg. All kwargs are case-insensitive, so passing `usd=0.1` will
-            result in the rate
-            `forex_rates["base"] -> "USD" = decimal.Decimal("0.1")`.
-    Returns:
-        The newly created `ForexVector`.
+    @cache.cached()
+    def __sub__(self, other: MoneyVector) -> MoneyVector:  # type: ignore[override]
+        # Raises `SpaceError` if the two vectors are not part of the same currency
+        # space.
 
-        Its [`axes`](#MoneyVector.axes) tuple will be the set of all
-        currencies provided via `forex_rates["rates"]` and `overrides` along with
-        the `forex_rates["base"]`.
-    Raises:
-        `linearmoney.exceptions.IntegrityError`:
-            If the `forex_rates["rates"]` dictionary contains any values that are less
-            than or equal to 0.
-    """
+        if not isinstance(other, MoneyVector):
+            return NotImplemented
 
-    _rates: _DecimalRates = _coerce_decimal_rates(forex_rates["rates"])
-    _iso_code: str = forex_rates["base"].upper()
+        if self._axes != other._axes:
+            raise SpaceError("MoneyVectors must be in the same space.")
 
-    if overrides:
-        _rates = _merge_rates(_rates, _coerce_decimal_rates(overrides))
+        if isinstance(other, FixedMoneyVector) and self._places == other._places:
+            return self.__class__._from_trusted(
+                tuple([i - j for i, j in zip(self._ints, other._ints)]),
+                self._places,
+                self._axes,
+            )
+        return MoneyVector._from_trusted(
+            tuple([i - j for i, j in zip(self, other)]), self._axes
+        )
 
-    for r in _rates.values():
-        if r <= 0:
-            raise IntegrityError("All components of a ForexVector must be > 0.")
+    @cache.cached()
+    def __mul__(  # type: ignore[override]
+        self, scalar: decimal.Decimal | int | float | str
+    ) -> MoneyVector:
+        if type(scalar) is int:
+            return self.__class__._from_trusted(
+                tuple([scalar * i for i in self._ints]), self._places, self._axes
+            )
+        try:
+            scalar = _utils.coerce_decimal(scalar)
+        except NotImplementedError:
+            return NotImplemented
+        return MoneyVector._from_trusted(tuple([scalar * i for i in self]), self._axes)
 
-    # We copy here to prevent mutating rates returned from the cache
+    @cache.cached()
+    def __neg__(self) -> Self:
+        return self.__class__._from_trusted(
+            tuple([-i for i in self._ints]), self._places, self._axes
+        )
+
+    @property
+    def ints(self) -> tuple[int, ...]:
+        """The fixed-point integer components of this vector."""
+
+        return self._ints
+
+    @property
+    def places(self) -> tuple[int, ...]:
+        """The number of decimal places of each axis of this vector."""
+
+        return self._places
+
+
+def to_fixed(vec: MoneyVector, currency_space: CurrencySpace) -> FixedMoneyVector:
+    """Return a `FixedMoneyVector` with the same components as `vec` using the
+    fixed-point places of `currency_space`.
+
+    Raises:
+        `linearmoney.exceptions.SpaceError`:
+            If `vec` is not part of `currency_space`.
+        ValueError:
+            If `currency_space` does not define fixed-point places or any component
+            of `vec` can't be represented exactly with the places of its axis.
+    """
+
+    places = currency_space.places
+    if places is None:
+        raise ValueError(f"{currency_space} does not use fixed-point components.")
+    if vec._axes != currency_space.axes:
+        raise SpaceError("MoneyVectors must be in the same space.")
+    if isinstance(vec, FixedMoneyVector) and vec._places == places:
+        return vec
+    return FixedMoneyVector._from_trusted(
+        tuple([_to_fixed(i, p) for i, p in zip(vec, places)]), places, vec._axes
+    )
+
+
+class ForexVector(MoneyVector):
+    """A [forex vector](/linearmoney/glossary.html#forex-vector) in the
+    [linear money model](/linear_money_model.html)."""
+
+    @cache.cached()
+    def __neg__(self) -> Self:
+        raise (IntegrityError("Forex vectors can not have negative-valued components."))
+
+
+class MoneyMatrix(ImmutableDeduplicationMixin):
+    """A batch of money vectors in one currency space stored as column arrays.
+
+    Each row of a `MoneyMatrix` is a money vector, but the rows are not stored as
+    individual `MoneyVector` objects. Instead, the matrix holds one tuple of
+    `decimal.Decimal`s per axis of the currency space, so holding a large number of
+    vectors does not require a Python object (with its own repr and hash) per vector.
+    Individual rows are only built as `MoneyVector`s when they are requested through
+    indexing or iteration.
+
+    The arithmetic operators have the same semantics as the corresponding
+    `MoneyVector` operators applied row-wise. The right-hand operand of `+` and `-` can
+    be either another `MoneyMatrix` with the same number of rows or a single
+    `MoneyVector`, which is applied to every row.
+
+    Unlike `MoneyVector`, a `MoneyMatrix` is not hashable and its operators are not
+    cached since keeping references to entire batches of vectors in the cache would
+    defeat the purpose of the columnar storage. Matrices are compared for equality by
+    their components and axes.
+
+    Example:
+        >>> import linearmoney as lm
+        >>> fo = lm.vector.forex({"base": "usd", "rates": {"jpy": 100}})
+        >>> sp = lm.vector.space(fo)
+        >>> mat = lm.vector.asset_matrix([10, 20, 30], ["usd", "jpy", "usd"], sp)
+        >>> len(mat)
+        3
+        >>> mat.column("usd")
+        (Decimal('10'), Decimal('0'), Decimal('30'))
+        >>> (mat * 2)[1]
+        MoneyVector('40', '0')
+    """
+
+    __slots__ = ["_columns", "_axes", "_rows"]
+
+    def __init__(
+        self, columns: tuple[DecimalVector, ...], axes: tuple[str, ...]
+    ) -> None:
+        """
+        Args:
+            columns:
+                One tuple of components per axis. Every column must have the same
+                length, which is the number of rows in the matrix.
+            axes:
+                The ISO 4217 currency codes that correspond to the axes of the currency
+                space of the matrix's rows.
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If `columns` and `axes` are not the same length.
+            ValueError:
+                If the columns are not all the same length.
+        """
+
+        if len(columns) != len(axes):
+            raise SpaceError("Must have the same number of columns as axes.")
+        rows = len(columns[0]) if columns else 0
+        for col in columns:
+            if len(col) != rows:
+                raise ValueError("All columns must have the same number of rows.")
+        self._columns = columns
+        self._axes = axes
+        self._rows = rows
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(rows={self._rows}, axes={self._axes})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MoneyMatrix):
+            return NotImplemented
+        return self._axes == other._axes and self.columns == other.columns
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def __getitem__(self, idx: int) -> MoneyVector:
+        return MoneyVector._from_trusted(
+            tuple([col[idx] for col in self._columns]), self._axes
+        )
+
+    def __iter__(self) -> Iterator[MoneyVector]:
+        axes = self._axes
+        for row in zip(*self._columns, strict=True):
+            yield MoneyVector._from_trusted(row, axes)
+
+    def _check_operand(self, other: MoneyMatrix | MoneyVector) -> None:
+        # Raises `SpaceError` if `other` is not part of the same currency space and
+        # `ValueError` if `other` is a matrix with a different number of rows.
+
+        if self._axes != other._axes:
+            raise SpaceError("MoneyVectors must be in the same space.")
+        if isinstance(other, MoneyMatrix) and len(other) != self._rows:
+            raise ValueError("MoneyMatrix operands must have the same number of rows.")
+
+    def __add__(self, other: MoneyMatrix | MoneyVector) -> Self:
+        if not isinstance(other, (MoneyMatrix, MoneyVector)):
+            return NotImplemented
+        self._check_operand(other)
+        if isinstance(other, MoneyMatrix):
+            new_columns = tuple(
+                [
+                    tuple([i + j for i, j in zip(lhs, rhs)])
+                    for lhs, rhs in zip(self._columns, other.columns)
+                ]
+            )
+        else:
+            new_columns = tuple(
+                [
+                    tuple([i + component for i in lhs])
+                    for lhs, component in zip(self._columns, other)
+                ]
+            )
+        return self.__class__(new_columns, self._axes)
+
+    def __radd__(self, other: MoneyVector) -> Self:
+        if other == 0:
+            return self
+        if not isinstance(other, MoneyVector):
+            return NotImplemented
+        self._check_operand(other)
+        new_columns = tuple(
+            [
+                tuple([component + i for i in rhs])
+                for rhs, component in zip(self._columns, other)
+            ]
+        )
+        return self.__class__(new_columns, self._axes)
+
+    def __sub__(self, other: MoneyMatrix | MoneyVector) -> Self:
+        if not isinstance(other, (MoneyMatrix, MoneyVector)):
+            return NotImplemented
+        self._check_operand(other)
+        if isinstance(other, MoneyMatrix):
+            new_columns = tuple(
+                [
+                    tuple([i - j for i, j in zip(lhs, rhs)])
+                    for lhs, rhs in zip(self._columns, other.columns)
+                ]
+            )
+        else:
+            new_columns = tuple(
+                [
+                    tuple([i - component for i in lhs])
+                    for lhs, component in zip(self._columns, other)
+                ]
+            )
+        return self.__class__(new_columns, self._axes)
+
+    def __rsub__(self, other: MoneyVector) -> Self:
+        if not isinstance(other, MoneyVector):
+            return NotImplemented
+        self._check_operand(other)
+        new_columns = tuple(
+            [
+                tuple([component - i for i in rhs])
+                for rhs, component in zip(self._columns, other)
+            ]
+        )
+        return self.__class__(new_columns, self._axes)
+
+    def __mul__(self, scalar: decimal.Decimal | int | float | str) -> Self:
+        try:
+            scalar = _utils.coerce_decimal(scalar)
+        except NotImplementedError:
+            return NotImplemented
+        new_columns = tuple([tuple([scalar * i for i in col]) for col in self._columns])
+        return self.__class__(new_columns, self._axes)
+
+    def __rmul__(self, scalar: decimal.Decimal | int | float | str) -> Self:
+        return self.__mul__(scalar)
+
+    def __truediv__(self, scalar: decimal.Decimal | int | float | str) -> Self:
+        try:
+            scalar = _utils.coerce_decimal(scalar)
+        except NotImplementedError:
+            return NotImplemented
+        return self * (decimal.Decimal(1) / scalar)
+
+    def __pos__(self) -> Self:
+        return self
+
+    def __neg__(self) -> Self:
+        new_columns = tuple([tuple([-i for i in col]) for col in self._columns])
+        return self.__class__(new_columns, self._axes)
+
+    @property
+    def dim(self) -> int:
+        """The dimension of the vectors in this `MoneyMatrix`."""
+
+        return len(self._axes)
+
+    @property
+    def axes(self) -> tuple[str, ...]:
+        """Tuple of the ISO 4217 alpha currency codes representing the axes of the
+        vectors in this `MoneyMatrix`."""
+
+        return self._axes
+
+    @property
+    def columns(self) -> tuple[DecimalVector, ...]:
+        """The component arrays of this `MoneyMatrix`, one per axis."""
+
+        return self._columns
+
+    def column(self, iso_code: str) -> DecimalVector:
+        """Return the components of every row along the axis `iso_code`.
+
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If `iso_code` is not an axis of this matrix.
+        """
+
+        return self._columns[self._axis_index(iso_code)]
+
+    def _axis_index(self, iso_code: str) -> int:
+        # Raises `SpaceError` if `iso_code` is not an axis of this matrix.
+
+        iso_code = iso_code.upper()
+        try:
+            return _index_map(self._axes)[iso_code]
+        except KeyError:
+            raise SpaceError(f"{iso_code} is not an axis of {self}")
+
+
+class FixedMoneyMatrix(MoneyMatrix):
+    """A `MoneyMatrix` whose rows are `FixedMoneyVector`s.
+
+    Fixed-point matrices are created by calling `matrix` or `asset_matrix` with a
+    currency space that defines fixed-point `places`.
+
+    The columns are stored as fixed-point integers, and addition and subtraction of
+    matrices or `FixedMoneyVector`s with the same places, negation, and multiplication
+    by an `int` are run as batch kernels over entire columns.
+    If [NumPy](https://numpy.org) is installed, the kernels use `int64` array
+    arithmetic. Otherwise, they fall back to pure Python. Overflow is always detected,
+    and any column that overflows is recomputed with exact Python ints, so the results
+    are exactly the same as applying the `FixedMoneyVector` operators to each row.
+
+    `Evaluator.many` and `evaluate_many` also use a batch kernel for the dot products
+    of a fixed-point matrix. Rows whose products might not fit in 64 bits are evaluated
+    with the `decimal.Decimal` implementation instead, so the results are exactly the
+    same as the results of `evaluate` for each row.
+
+    All other operations fall back to the `decimal.Decimal` implementation and return a
+    `MoneyMatrix`.
+
+    Example:
+        >>> import linearmoney as lm
+        >>> fo = lm.vector.forex({"base": "usd", "rates": {"jpy": 100}})
+        >>> sp = lm.vector.fixed_space(lm.vector.space(fo))
+        >>> mat = lm.vector.asset_matrix(["10.5", 20, 30], ["usd", "jpy", "usd"], sp)
+        >>> mat
+        FixedMoneyMatrix(rows=3, axes=('JPY', 'USD'))
+        >>> (mat * 2)[0]
+        FixedMoneyVector('0', '21.00')
+        >>> lm.vector.evaluate_many(mat, "usd", fo)
+        [Decimal('10.5'), Decimal('0.2'), Decimal('3E+1')]
+    """
+
+    __slots__ = ["_ints", "_places"]
+
+    def __init__(
+        self,
+        ints: tuple[Iterable[int], ...],
+        places: tuple[int, ...],
+        axes: tuple[str, ...],
+    ) -> None:
+        """
+        Args:
+            ints:
+                One sequence of fixed-point integer components per axis. Every column
+                must have the same length, which is the number of rows in the matrix.
+            places:
+                The number of decimal places for each axis.
+            axes:
+                The ISO 4217 currency codes that correspond to the axes of the currency
+                space of the matrix's rows.
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If `ints`, `places` and `axes` are not all the same length.
+            ValueError:
+                If the columns are not all the same length.
+        """
+
+        if len(ints) != len(axes) or len(places) != len(axes):
+            raise SpaceError("Must have the same number of columns as axes.")
+        packed = tuple([_kernels.column(col) for col in ints])
+        rows = len(packed[0]) if packed else 0
+        for col in packed:
+            if len(col) != rows:
+                raise ValueError("All columns must have the same number of rows.")
+        self._ints = packed
+        self._places = places
+        self._axes = axes
+        self._rows = rows
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FixedMoneyMatrix) and other._places == self._places:
+            return self._axes == other._axes and self.ints == other.ints
+        return super().__eq__(other)
+
+    def __getitem__(self, idx: int) -> FixedMoneyVector:
+        return FixedMoneyVector._from_trusted(
+            tuple([int(col[idx]) for col in self._ints]), self._places, self._axes
+        )
+
+    def __iter__(self) -> Iterator[FixedMoneyVector]:
+        places = self._places
+        axes = self._axes
+        for row in zip(*[_kernels.to_ints(col) for col in self._ints], strict=True):
+            yield FixedMoneyVector._from_trusted(row, places, axes)
+
+    def _decimal_matrix(self) -> MoneyMatrix:
+        # The equivalent matrix with `decimal.Decimal` components used for the
+        # operations that can't be done with fixed-point integers.
+
+        return MoneyMatrix(self.columns, self._axes)
+
+    def __add__(  # type: ignore[override]
+        self, other: MoneyMatrix | MoneyVector
+    ) -> MoneyMatrix:
+        if not isinstance(other, (MoneyMatrix, MoneyVector)):
+            return NotImplemented
+        self._check_operand(other)
+        if isinstance(other, FixedMoneyMatrix) and other._places == self._places:
+            new_ints = tuple(
+                [_kernels.add(lhs, rhs) for lhs, rhs in zip(self._ints, other._ints)]
+            )
+        elif isinstance(other, FixedMoneyVector) and other._places == self._places:
+            new_ints = tuple(
+                [_kernels.add(lhs, i) for lhs, i in zip(self._ints, other._ints)]
+            )
+        else:
+            return self._decimal_matrix() + other
+        return self.__class__(new_ints, self._places, self._axes)
+
+    def __radd__(self, other: MoneyVector) -> MoneyMatrix:  # type: ignore[override]
+        if other == 0:
+            return self
+        if not isinstance(other, MoneyVector):
+            return NotImplemented
+        self._check_operand(other)
+        if isinstance(other, FixedMoneyVector) and other._places == self._places:
+            new_ints = tuple(
+                [_kernels.add(i, rhs) for rhs, i in zip(self._ints, other._ints)]
+            )
+            return self.__class__(new_ints, self._places, self._axes)
+        return self._decimal_matrix().__radd__(other)
+
+    def __sub__(  # type: ignore[override]
+        self, other: MoneyMatrix | MoneyVector
+    ) -> MoneyMatrix:
+        if not isinstance(other, (MoneyMatrix, MoneyVector)):
+            return NotImplemented
+        self._check_operand(other)
+        if isinstance(other, FixedMoneyMatrix) and other._places == self._places:
+            new_ints = tuple(
+                [_kernels.sub(lhs, rhs) for lhs, rhs in zip(self._ints, other._ints)]
+            )
+        elif isinstance(other, FixedMoneyVector) and other._places == self._places:
+            new_ints = tuple(
+                [_kernels.sub(lhs, i) for lhs, i in zip(self._ints, other._ints)]
+            )
+        else:
+            return self._decimal_matrix() - other
+        return self.__class__(new_ints, self._places, self._axes)
+
+    def __rsub__(self, other: MoneyVector) -> MoneyMatrix:  # type: ignore[override]
+        if not isinstance(other, MoneyVector):
+            return NotImplemented
+        self._check_operand(other)
+        if isinstance(other, FixedMoneyVector) and other._places == self._places:
+            new_ints = tuple(
+                [_kernels.sub(i, rhs) for rhs, i in zip(self._ints, other._ints)]
+            )
+            return self.__class__(new_ints, self._places, self._axes)
+        return self._decimal_matrix().__rsub__(other)
+
+    def __mul__(  # type: ignore[override]
+        self, scalar: decimal.Decimal | int | float | str
+    ) -> MoneyMatrix:
+        if type(scalar) is int:
+            new_ints = tuple([_kernels.scale(col, scalar) for col in self._ints])
+            return self.__class__(new_ints, self._places, self._axes)
+        return self._decimal_matrix() * scalar
+
+    def __neg__(self) -> Self:
+        new_ints = tuple([_kernels.neg(col) for col in self._ints])
+        return self.__class__(new_ints, self._places, self._axes)
+
+    @property
+    def columns(self) -> tuple[DecimalVector, ...]:
+        """The component arrays of this `MoneyMatrix`, one per axis."""
+
+        return tuple([self._decimal_column(idx) for idx in range(len(self._axes))])
+
+    def column(self, iso_code: str) -> DecimalVector:
+        return self._decimal_column(self._axis_index(iso_code))
+
+    def _decimal_column(self, idx: int) -> DecimalVector:
+        places = self._places[idx]
+        return tuple(
+            [_from_fixed(i, places) for i in _kernels.to_ints(self._ints[idx])]
+        )
+
+    @property
+    def ints(self) -> tuple[tuple[int, ...], ...]:
+        """The fixed-point integer columns of this matrix, one per axis."""
+
+        return tuple([tuple(_kernels.to_ints(col)) for col in self._ints])
+
+    @property
+    def places(self) -> tuple[int, ...]:
+        """The number of decimal places of each axis of this matrix."""
+
+        return self._places
+
+
+@cache.cached()
+def basis_vector(currency_space: CurrencySpace, axis: str) -> MoneyVector:
+    """Return the Euclidean basis vector corresponding to `axis` in `currency_space`.
+
+    Raises:
+        `linearmoney.exceptions.SpaceError`:
+            If `axis` is not part of `currency_space`.
+    """
+
+    axis = axis.upper()
+
+    try:
+        idx = currency_space._indices[axis]
+    except KeyError:
+        raise SpaceError(
+            f"Currency {axis} is not part of currency space {currency_space}"
+        )
+    _vector = _place_component(_ONE, idx, len(currency_space.axes), _ZERO)
+    return MoneyVector._from_trusted(_vector, currency_space.axes)
+
+
+def _place_component(value: T, idx: int, dim: int, zero: T) -> tuple[T, ...]:
+    """Return a tuple of length `dim` with `value` at `idx` and `zero` everywhere else.
+
+    The tuple is built by repeating and concatenating tuples instead of comparing each
+    axis with the ISO code, so no Python code runs per axis.
+    """
+
+    return (zero,) * idx + (value,) + (zero,) * (dim - idx - 1)
+
+
+@cache.cached()
+def dot(vec1: MoneyVector, vec2: MoneyVector) -> decimal.Decimal:
+    """Calculate and return the dot product of vectors `vec1` and `vec2`.
+
+    Raises:
+        `linearmoney.exceptions.SpaceError`:
+            If the two vectors are not part of the same currency space.
+    """
+
+    if vec1.axes != vec2.axes:
+        raise SpaceError("MoneyVectors must be in the same space.")
+
+    if isinstance(vec1, SparseMoneyVector):
+        product = decimal.Decimal(str(_sparse_dot_components(vec1, vec2)))
+    elif isinstance(vec2, SparseMoneyVector):
+        product = decimal.Decimal(str(_sparse_dot_components(vec2, vec1)))
+    else:
+        product = decimal.Decimal(str(_dot_components(vec1, vec2)))
+    return product
+
+
+def _dot_components(
+    components1: Iterable[decimal.Decimal], components2: Iterable[decimal.Decimal]
+) -> decimal.Decimal:
+    """Return the sum of the products of `components1` and `components2`.
+
+    This is the uncached core of `dot` that is shared with the batch functions, so
+    that both paths accumulate the products in exactly the same order.
+    """
+
+    products = [i * j for i, j in zip(components1, components2)]
+    return builtins.sum(products)  # type: ignore[return-value]
+
+
+def _sparse_dot_components(
+    sparse_vec: SparseMoneyVector, components: MoneyVector | DecimalVector
+) -> decimal.Decimal:
+    """Return the dot product of `sparse_vec` and `components` by only visiting the
+    non-zero components of `sparse_vec`.
+
+    The products are accumulated in the same order as `_dot_components`, so the
+    result has the same value as the dense dot product.
+    """
+
+    # Start from a Decimal zero, so that vectors without any non-zero components
+    # still produce a Decimal. This is equivalent to the implicit int zero
+    # start of the dense sum.
+    return builtins.sum(
+        [i * components[idx] for idx, i in sparse_vec._components.items()], _ZERO
+    )
+
+
+@cache.cached()
+def space(vec: MoneyVector) -> CurrencySpace:
+    """Create and return a new `CurrencySpace` representing the space that `vec`
+    belongs to.
+
+    If `vec` is a `FixedMoneyVector`, the space uses the same fixed-point places as
+    `vec`.
+    """
+
+    if isinstance(vec, FixedMoneyVector):
+        return CurrencySpace(vec._axes, vec._places)
+    return CurrencySpace(vec.axes)
+
+
+def fixed_space(
+    currency_space: CurrencySpace, places: int | tuple[int, ...] | None = None
+) -> CurrencySpace:
+    """Return a new `CurrencySpace` with the same axes as `currency_space` that uses
+    the fixed-point integer backend for asset vectors.
+
+    Args:
+        currency_space:
+            The currency space to convert.
+        places:
+            The number of decimal places to use for each axis. If `None` (default),
+            the `places` of each currency from `linearmoney.data.currency` is used.
+    Raises:
+        `linearmoney.exceptions.UnknownDataError`:
+            If `places` is `None` and there is no denominational data for one of the
+            currencies in `currency_space`.
+    """
+
+    if places is None:
+        places = tuple(
+            [max(data.currency(i).data["places"], 0) for i in currency_space.axes]
+        )
+    return CurrencySpace(currency_space.axes, places)
+
+
+@cache.cached()
+def _remap(
+    source_axes: tuple[str, ...], target_axes: tuple[str, ...]
+) -> tuple[tuple[int | None, ...], tuple[int | None, ...], tuple[int, ...]]:
+    """Return the index remap tables for projecting from `source_axes` to
+    `target_axes`.
+
+    The cache compares the axes by value, so vectors from equal spaces share the
+    tables even if their axes are different tuples.
+
+    The tables are:
+        * The source index of each target axis or `None` if the axis is not part of
+          the source, so that projecting dense components is a single gather.
+        * The target index of each source axis or `None` if the axis is not part of
+          the target, which is used to move the components of sparse vectors.
+        * The source indices of the axes that are not part of the target.
+    """
+
+    source = _index_map(source_axes)
+    target = _index_map(target_axes)
+    gather = tuple([source.get(axis) for axis in target_axes])
+    scatter = tuple([target.get(axis) for axis in source_axes])
+    dropped = tuple([idx for idx, i in enumerate(scatter) if i is None])
+    return gather, scatter, dropped
+
+
+def project(vec: V | MoneyMatrix, target_space: CurrencySpace) -> V | MoneyMatrix:
+    """Return `vec` re-projected into `target_space`.
+
+    `vec` can be a single money vector or a `MoneyMatrix` of vectors. Components along
+    the axes of `target_space` that are not part of the space of `vec` are zero, so
+    vectors from different currency spaces can be combined after projecting them into
+    a common space created with `CurrencySpace.union`.
+
+    The index remap table for each pair of source and target axes is computed once and
+    cached, so projecting a vector or a matrix is a single gather of its existing
+    components or columns.
+
+    Sparse vectors stay sparse, forex vectors stay forex vectors and all other vectors
+    are projected to dense vectors. If `target_space` defines fixed-point `places`, the
+    result uses the fixed-point backend like the assets created in `target_space`.
+
+    Raises:
+        `linearmoney.exceptions.SpaceError`:
+            If `vec` has a non-zero component along an axis that is not part of
+            `target_space`.
+        `linearmoney.exceptions.IntegrityError`:
+            If `vec` is a `ForexVector` and `target_space` has axes that are not part
+            of the space of `vec`, since that would create zero-valued rates.
+        ValueError:
+            If `target_space` defines fixed-point places and any component of `vec`
+            can't be represented exactly with the places of its axis.
+        TypeError:
+            If `vec` is not a `MoneyVector` or `MoneyMatrix`.
+
+    Example:
+        >>> import linearmoney as lm
+        >>> sp1 = lm.vector.CurrencySpace(("JPY", "USD"))
+        >>> sp2 = lm.vector.CurrencySpace(("EUR", "USD"))
+        >>> union = sp1.union(sp2)
+        >>> v1 = lm.vector.project(lm.vector.asset(10, "usd", sp1), union)
+        >>> v2 = lm.vector.project(lm.vector.asset(5, "eur", sp2), union)
+        >>> v1 + v2
+        MoneyVector('5', '0', '10')
+    """
+
+    if isinstance(vec, MoneyMatrix):
+        return _project_matrix(vec, target_space)
+    if not isinstance(vec, MoneyVector):
+        raise TypeError(f"Cannot project type {type(vec)} into a currency space.")
+    axes = target_space.axes
+    places = target_space.places
+    gather, scatter, dropped = _remap(vec._axes, axes)
+    if isinstance(vec, SparseMoneyVector):
+        if any([scatter[idx] is None for idx in vec._components]):
+            raise SpaceError(f"{vec} has non-zero components outside of {target_space}")
+        if places is None:
+            # None of the indices are dropped after the check above.
+            moved = {scatter[idx]: i for idx, i in vec._components.items()}
+            return SparseMoneyVector(moved, axes)  # type: ignore[arg-type,return-value]
+    elif isinstance(vec, FixedMoneyVector):
+        if any([vec._ints[idx] for idx in dropped]):
+            raise SpaceError(f"{vec} has non-zero components outside of {target_space}")
+        if places is not None and all(
+            [i is None or vec._places[i] == p for i, p in zip(gather, places)]
+        ):
+            return FixedMoneyVector._from_trusted(  # type: ignore[return-value]
+                tuple([0 if i is None else vec._ints[i] for i in gather]), places, axes
+            )
+    elif any([vec._vector[idx] for idx in dropped]):
+        raise SpaceError(f"{vec} has non-zero components outside of {target_space}")
+    if isinstance(vec, ForexVector) and None in gather:
+        raise IntegrityError("Forex vectors can not have zero-valued components.")
+    components = vec._vector if type(vec) in (MoneyVector, ForexVector) else tuple(vec)
+    projected = tuple([_ZERO if i is None else components[i] for i in gather])
+    if places is not None:
+        return FixedMoneyVector._from_trusted(  # type: ignore[return-value]
+            tuple([_to_fixed(i, p) for i, p in zip(projected, places)]), places, axes
+        )
+    if isinstance(vec, ForexVector):
+        return ForexVector._from_trusted(projected, axes)  # type: ignore[return-value]
+    return MoneyVector._from_trusted(projected, axes)  # type: ignore[return-value]
+
+
+def _project_matrix(mat: MoneyMatrix, target_space: CurrencySpace) -> MoneyMatrix:
+    """Return `mat` re-projected into `target_space` by gathering its columns."""
+
+    axes = target_space.axes
+    places = target_space.places
+    gather, _, dropped = _remap(mat._axes, axes)
+    rows = len(mat)
+    columns: list[DecimalVector] = []
+    if isinstance(mat, FixedMoneyMatrix):
+        if any([any(_kernels.to_ints(mat._ints[idx])) for idx in dropped]):
+            raise SpaceError(f"{mat} has non-zero components outside of {target_space}")
+        if places is not None and all(
+            [i is None or mat._places[i] == p for i, p in zip(gather, places)]
+        ):
+            zero_ints = _kernels.column([0] * rows)
+            return FixedMoneyMatrix(
+                tuple([zero_ints if i is None else mat._ints[i] for i in gather]),
+                places,
+                axes,
+            )
+        zero = (_ZERO,) * rows
+        columns = [zero if i is None else mat._decimal_column(i) for i in gather]
+    else:
+        if any([any(mat._columns[idx]) for idx in dropped]):
+            raise SpaceError(f"{mat} has non-zero components outside of {target_space}")
+        zero = (_ZERO,) * rows
+        columns = [zero if i is None else mat._columns[i] for i in gather]
+    if places is not None:
+        return FixedMoneyMatrix(
+            tuple([[_to_fixed(i, p) for i in col] for col, p in zip(columns, places)]),
+            places,
+            axes,
+        )
+    return MoneyMatrix(tuple(columns), axes)
+
+
+@cache.cached(size_multiplier=16)
+def asset(
+    amount: int | float | decimal.Decimal,
+    iso_code: str,
+    currency_space: CurrencySpace,
+    *,
+    sparse: bool = False,
+) -> MoneyVector:
+    """Create a new [*Asset Vector*](/linearmoney/glossary.html#asset-vector) in `currency_space`
+    with `amount` of `iso_code` as it's only non-zero component.
+
+    If `sparse` is True, the asset is created as a `SparseMoneyVector`.
+    If `currency_space` defines fixed-point `places`, the asset is created as a
+    `FixedMoneyVector`.
+
+    Raises:
+        `linearmoney.exceptions.SpaceError`:
+            If `iso_code` is not part of `currency_space`.
+        ValueError:
+            If `currency_space` uses fixed-point components and `amount` can't be
+            represented exactly with the places of `iso_code`, or if `sparse` is
+            requested for a fixed-point space.
+    """
+
+    iso_code = iso_code.upper()
+
+    try:
+        idx = currency_space._indices[iso_code]
+    except KeyError:
+        raise SpaceError(f"{iso_code} is not part of {currency_space}")
+
+    try:
+        _amount = _utils.coerce_decimal(amount)
+    except NotImplementedError:
+        raise TypeError(f"Unsupported type for argument `amount`: {type(amount)}")
+
+    if currency_space.places is not None:
+        if sparse:
+            raise ValueError("Fixed-point currency spaces don't support sparse assets.")
+        places = currency_space.places
+        _ints = _place_component(_to_fixed(_amount, places[idx]), idx, len(places), 0)
+        return FixedMoneyVector._from_trusted(_ints, places, currency_space.axes)
+    if sparse:
+        return SparseMoneyVector({idx: _amount}, currency_space.axes)
+    _vector = _place_component(_amount, idx, len(currency_space.axes), _ZERO)
+    return MoneyVector._from_trusted(_vector, currency_space.axes)
+
+
+def matrix(
+    vectors: Iterable[MoneyVector], currency_space: CurrencySpace | None = None
+) -> MoneyMatrix:
+    """Pack `vectors` into a new `MoneyMatrix` with one row per vector.
+
+    `vectors` is consumed in a single pass, so it can be a generator.
+
+    If the currency space of the matrix defines fixed-point `places`, a
+    `FixedMoneyMatrix` is returned.
+
+    Args:
+        vectors:
+            The money vectors to use as the rows of the matrix.
+        currency_space:
+            The currency space of the matrix. If `None` (default), the space of the
+            first vector in `vectors` is used.
+    Raises:
+        `linearmoney.exceptions.SpaceError`:
+            If any of the vectors are not part of the currency space of the matrix.
+        ValueError:
+            If `vectors` is empty and no `currency_space` is provided, or if the
+            matrix uses fixed-point components and any component of `vectors` can't be
+            represented exactly with the places of its axis.
+    """
+
+    axes = None if currency_space is None else currency_space.axes
+    places = None if currency_space is None else currency_space.places
+    column_lists: list[list] = []
+    if axes is not None:
+        column_lists = [[] for _ in axes]
+    for vec in vectors:
+        if axes is None:
+            axes = vec._axes
+            places = vec._places if isinstance(vec, FixedMoneyVector) else None
+            column_lists = [[] for _ in axes]
+        elif vec._axes != axes:
+            raise SpaceError("MoneyVectors must be in the same space.")
+        components: Iterable[decimal.Decimal | int] = vec
+        if places is not None:
+            if isinstance(vec, FixedMoneyVector) and vec._places == places:
+                components = vec._ints
+            else:
+                components = [_to_fixed(i, p) for i, p in zip(vec, places)]
+        for col, component in zip(column_lists, components):
+            col.append(component)
+    if axes is None:
+        raise ValueError("Cannot infer the currency space of an empty matrix.")
+    if places is not None:
+        return FixedMoneyMatrix(tuple(column_lists), places, axes)
+    return MoneyMatrix(tuple([tuple(col) for col in column_lists]), axes)
+
+
+def asset_matrix(
+    amounts: Iterable[int | float | decimal.Decimal],
+    iso_codes: Iterable[str] | str,
+    currency_space: CurrencySpace,
+) -> MoneyMatrix:
+    """Create a new `MoneyMatrix` whose rows are
+    [*Asset Vectors*](/linearmoney/glossary.html#asset-vector) without building an
+    individual vector for each asset.
+
+    Row `n` of the result is equivalent to
+    `asset(amounts[n], iso_codes[n], currency_space)`, so if `currency_space` defines
+    fixed-point `places`, a `FixedMoneyMatrix` is returned.
+
+    Args:
+        amounts:
+            The amount of each asset.
+        iso_codes:
+            The currency of each asset. If a single `str` is provided, all
+            assets are created in that currency.
+    Raises:
+        `linearmoney.exceptions.SpaceError`:
+            If any of the `iso_codes` are not part of `currency_space`.
+        ValueError:
+            If `amounts` and `iso_codes` are not the same length, or if
+            `currency_space` uses fixed-point components and any amount can't be
+            represented exactly with the places of its currency.
+    """
+
+    axes = currency_space.axes
+    places = currency_space.places
+    indices = currency_space._indices
+    zero = _ZERO if places is None else 0
+    column_lists: list[list] = [[] for _ in axes]
+    if isinstance(iso_codes, str):
+        codes: Iterable[str] = itertools.repeat(iso_codes)
+    else:
+        codes = iso_codes
+    for amount, iso_code in zip(amounts, codes, strict=not isinstance(iso_codes, str)):
+        try:
+            idx = indices[iso_code.upper()]
+        except KeyError:
+            raise SpaceError(f"{iso_code.upper()} is not part of {currency_space}")
+        try:
+            _amount = _utils.coerce_decimal(amount)
+        except NotImplementedError:
+            raise TypeError(f"Unsupported type for argument `amount`: {type(amount)}")
+        for col in column_lists:
+            col.append(zero)
+        if places is None:
+            column_lists[idx][-1] = _amount
+        else:
+            column_lists[idx][-1] = _to_fixed(_amount, places[idx])
+    if places is not None:
+        return FixedMoneyMatrix(tuple(column_lists), places, axes)
+    return MoneyMatrix(tuple([tuple(col) for col in column_lists]), axes)
+
+
+class _VectorAccumulator:
+    """Running per-axis totals of a sequence of money vectors in one currency space.
+
+    Adding a vector only updates the totals, so summing any number of vectors only
+    creates a single result vector. The totals are accumulated in the same order with
+    the same operations as chained vector addition, so the result has exactly the same
+    value as the builtin `sum` of the same vectors.
+    """
+
+    __slots__ = ["_axes", "_totals", "_ints", "_places", "_result_class"]
+
+    def __init__(self, axes: tuple[str, ...]) -> None:
+        self._axes = axes
+        # Only one of `_totals` or `_ints` is used at a time. Fixed-point vectors are
+        # accumulated as ints until a vector that isn't fixed-point with the same
+        # places is added.
+        self._totals: list[decimal.Decimal] = []
+        self._ints: list[int] | None = None
+        self._places: tuple[int, ...] = ()
+        self._result_class: type[MoneyVector] | None = None
+
+    def add(self, vec: MoneyVector) -> None:
+        """Add the components of `vec` to the totals.
+
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If `vec` is not part of the currency space of the accumulator.
+            TypeError:
+                If `vec` is not a `MoneyVector`.
+        """
+
+        if not isinstance(vec, MoneyVector):
+            raise TypeError(f"Unsupported type for summation: {type(vec)}")
+        if vec._axes != self._axes:
+            raise SpaceError("MoneyVectors must be in the same space.")
+        if self._result_class is None:
+            self._result_class = type(vec)
+            if isinstance(vec, FixedMoneyVector):
+                self._ints = list(vec._ints)
+                self._places = vec._places
+            else:
+                self._totals = list(vec)
+            return
+        if self._ints is not None:
+            if isinstance(vec, FixedMoneyVector) and vec._places == self._places:
+                self._ints = [i + j for i, j in zip(self._ints, vec._ints)]
+                return
+            places = self._places
+            self._totals = [_from_fixed(i, p) for i, p in zip(self._ints, places)]
+            self._ints = None
+            self._result_class = MoneyVector
+        totals = self._totals
+        if isinstance(vec, SparseMoneyVector):
+            for idx, component in vec._components.items():
+                totals[idx] += component
+        else:
+            self._totals = [i + j for i, j in zip(totals, vec)]
+            if self._result_class is SparseMoneyVector:
+                self._result_class = MoneyVector
+
+    @property
+    def empty(self) -> bool:
+        """Whether no vectors have been added yet."""
+
+        return self._result_class is None
+
+    def result(self) -> MoneyVector:
+        """Return a new vector with the current totals as its components.
+
+        Raises:
+            ValueError:
+                If no vectors have been added yet.
+        """
+
+        if self._result_class is None:
+            raise ValueError("Cannot build the result of an empty sum.")
+        if self._ints is not None:
+            return FixedMoneyVector._from_trusted(
+                tuple(self._ints), self._places, self._axes
+            )
+        totals = self._totals
+        if self._result_class is SparseMoneyVector:
+            return SparseMoneyVector(dict(enumerate(totals)), self._axes)
+        return self._result_class._from_trusted(tuple(totals), self._axes)
+
+
+def sum(
+    vectors: Iterable[MoneyVector], currency_space: CurrencySpace | None = None
+) -> MoneyVector:
+    """Return the sum of `vectors`.
+
+    The result has exactly the same value as the builtin `sum` of `vectors`, but the
+    builtin `sum` creates, hashes, and caches a new intermediate vector for each
+    addition. This function only keeps a running total for each axis and creates a
+    single result vector, and none of the additions go through the cache.
+
+    `vectors` is consumed in a single pass, so it can be a generator.
+
+    If all of the `vectors` are `FixedMoneyVector`s with the same places, the totals are
+    accumulated as integers and the result is a `FixedMoneyVector`. If all of the
+    `vectors` are `SparseMoneyVector`s, the result is a `SparseMoneyVector`.
+
+    Args:
+        vectors:
+            The money vectors to add together.
+        currency_space:
+            The currency space of the vectors. If `None` (default), the space of the
+            first vector in `vectors` is used. If `vectors` is empty, the zero vector
+            of `currency_space` is returned.
+    Raises:
+        `linearmoney.exceptions.SpaceError`:
+            If any of the vectors are not part of the same currency space.
+        TypeError:
+            If any of the `vectors` are not `MoneyVector`s.
+        ValueError:
+            If `vectors` is empty and no `currency_space` is provided.
+
+    Example:
+        >>> import linearmoney as lm
+        >>> fo = lm.vector.forex({"base": "usd", "rates": {"jpy": 100}})
+        >>> sp = lm.vector.space(fo)
+        >>> lm.vector.sum(lm.vector.asset(i, "usd", sp) for i in range(1, 101))
+        MoneyVector('0', '5050')
+        >>> lm.vector.sum([], sp)
+        MoneyVector('0', '0')
+    """
+
+    accumulator = None
+    if currency_space is not None:
+        accumulator = _VectorAccumulator(currency_space.axes)
+    for vec in vectors:
+        if accumulator is None:
+            if not isinstance(vec, MoneyVector):
+                raise TypeError(f"Unsupported type for summation: {type(vec)}")
+            accumulator = _VectorAccumulator(vec._axes)
+        accumulator.add(vec)
+    if accumulator is None:
+        raise ValueError("Cannot infer the currency space of an empty sum.")
+    if accumulator.empty:
+        places = currency_space.places  # type: ignore[union-attr]
+        axes = accumulator._axes
+        if places is not None:
+            return FixedMoneyVector._from_trusted(
+                tuple([0 for _ in axes]), places, axes
+            )
+        return MoneyVector._from_trusted(tuple([_ZERO for _ in axes]), axes)
+    return accumulator.result()
+
+
+class GroupAccumulator:
+    """Running totals of money vectors grouped by arbitrary hashable keys.
+
+    Each group keeps mutable per-axis totals like `sum`, so adding a vector to a group
+    does not create, hash or cache an intermediate vector, and a single frozen vector
+    is only created for each group when the results are requested. The total of each
+    group has exactly the same value as the builtin `sum` of the vectors added to it.
+
+    All groups must be part of the same currency space.
+
+    Example:
+        >>> import linearmoney as lm
+        >>> fo = lm.vector.forex({"base": "usd", "rates": {"jpy": 100}})
+        >>> sp = lm.vector.space(fo)
+        >>> groups = lm.vector.GroupAccumulator(sp)
+        >>> groups.add("desk1", lm.vector.asset(10, "usd", sp))
+        >>> groups.add("desk2", lm.vector.asset(500, "jpy", sp))
+        >>> groups.add("desk1", lm.vector.asset(100, "jpy", sp))
+        >>> groups.result()
+        {'desk1': MoneyVector('100', '10'), 'desk2': MoneyVector('500', '0')}
+        >>> groups.evaluate(lm.vector.Evaluator(fo, "usd"))
+        {'desk1': Decimal('11'), 'desk2': Decimal('5')}
+    """
+
+    __slots__ = ["_axes", "_groups"]
+
+    def __init__(self, currency_space: CurrencySpace | None = None) -> None:
+        """
+        Args:
+            currency_space:
+                The currency space of the vectors. If `None` (default), the space of
+                the first vector that is added is used.
+        """
+
+        self._axes = None if currency_space is None else currency_space.axes
+        self._groups: dict[Hashable, _VectorAccumulator] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(groups={len(self._groups)})"
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._groups
+
+    def add(self, key: Hashable, vec: MoneyVector) -> None:
+        """Add `vec` to the group `key`.
+
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If `vec` is not part of the currency space of the groups.
+            TypeError:
+                If `vec` is not a `MoneyVector`.
+        """
+
+        try:
+            accumulator = self._groups[key]
+        except KeyError:
+            if self._axes is None:
+                if not isinstance(vec, MoneyVector):
+                    raise TypeError(f"Unsupported type for summation: {type(vec)}")
+                self._axes = vec._axes
+            accumulator = _VectorAccumulator(self._axes)
+            accumulator.add(vec)
+            self._groups[key] = accumulator
+            return
+        accumulator.add(vec)
+
+    def update(self, pairs: Iterable[tuple[Hashable, MoneyVector]]) -> None:
+        """Add each `(key, vector)` pair in `pairs` to its group.
+
+        `pairs` is consumed in a single pass, so it can be a generator.
+
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If any of the vectors are not part of the currency space of the groups.
+            TypeError:
+                If any of the vectors are not `MoneyVector`s.
+        """
+
+        add = self.add
+        for key, vec in pairs:
+            add(key, vec)
+
+    def result(self) -> dict[Hashable, MoneyVector]:
+        """Return the current total of each group in the order the groups were first
+        added."""
+
+        return {key: i.result() for key, i in self._groups.items()}
+
+    def evaluate(self, evaluator: Evaluator) -> dict[Hashable, decimal.Decimal]:
+        """[Evaluate](/linearmoney/glossary.html#evaluation) the current total of each
+        group with `evaluator`.
+
+        The value of each group is exactly the same as the result of `evaluate` for
+        its total.
+
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If the groups are not part of the currency space of `evaluator`.
+        """
+
+        return {key: evaluator(i.result()) for key, i in self._groups.items()}
+
+
+def group_sum(
+    pairs: Iterable[tuple[Hashable, MoneyVector]],
+    currency_space: CurrencySpace | None = None,
+    *,
+    evaluator: Evaluator | None = None,
+) -> dict[Hashable, MoneyVector] | dict[Hashable, decimal.Decimal]:
+    """Return the sum of the vectors of each key in `pairs`.
+
+    This is a shortcut for adding `pairs` to a `GroupAccumulator` and returning its
+    result.
+
+    Args:
+        pairs:
+            An iterable of `(key, vector)` pairs. The keys can be any hashable values.
+            `pairs` is consumed in a single pass, so it can be a generator.
+        currency_space:
+            The currency space of the vectors. If `None` (default), the space of the
+            first vector in `pairs` is used.
+        evaluator:
+            If not `None`, the total of each group is evaluated with this `Evaluator`,
+            and the values are returned instead of the totals.
+    Returns:
+        A dict of each key to the total of its vectors or their value if `evaluator`
+        is provided, in the order the keys first appear in `pairs`.
+    Raises:
+        `linearmoney.exceptions.SpaceError`:
+            If any of the vectors are not part of the same currency space.
+        TypeError:
+            If any of the vectors are not `MoneyVector`s.
+
+    Example:
+        >>> import linearmoney as lm
+        >>> fo = lm.vector.forex({"base": "usd", "rates": {"jpy": 100}})
+        >>> sp = lm.vector.space(fo)
+        >>> trades = [("a", 10, "usd"), ("b", 500, "jpy"), ("a", 5, "usd")]
+        >>> lm.vector.group_sum((k, lm.vector.asset(x, c, sp)) for k, x, c in trades)
+        {'a': MoneyVector('0', '15'), 'b': MoneyVector('500', '0')}
+    """
+
+    groups = GroupAccumulator(currency_space)
+    groups.update(pairs)
+    if evaluator is not None:
+        return groups.evaluate(evaluator)
+    return groups.result()
+
+
+# Opcodes of the compiled programs of lazy vectors.
+_LEAF = 0
+_ADD = 1
+_SUB = 2
+_MUL = 3
+_NEG = 4
+
+_LazyInstruction: TypeAlias = tuple[int, int, "int | decimal.Decimal | None"]
+
+
+class LazyMoneyVector:
+    """A deferred money vector expression created by `lazy`.
+
+    The arithmetic operators of a lazy vector don't calculate anything. Instead, they
+    record the operation as a node of an expression graph, and the whole expression is
+    only calculated when `materialize` or `evaluate` is called. The expression is
+    calculated in a single pass over the components, so no intermediate `MoneyVector`s
+    are created, hashed or cached, and the currency space of all of the vectors in the
+    expression is only checked once. Subexpressions that appear more than once, either
+    because the same lazy vector is used multiple times or because the same operations
+    are applied to the same operands, are only calculated once per component.
+
+    Lazy vectors support `+` and `-` with other lazy vectors or `MoneyVector`s, and
+    `*` and `/` with scalars, with the same semantics as the `MoneyVector` operators,
+    so the result has exactly the same value as the eager expression.
+
+    Example:
+        >>> import linearmoney as lm
+        >>> fo = lm.vector.forex({"base": "usd", "rates": {"jpy": 100}})
+        >>> sp = lm.vector.space(fo)
+        >>> a = lm.vector.asset(10, "usd", sp)
+        >>> b = lm.vector.asset(500, "jpy", sp)
+        >>> expr = (lm.vector.lazy(a) + b - a * 2) * "1.5" / 2
+        >>> expr.materialize()
+        MoneyVector('375.00', '-7.50')
+        >>> expr.materialize() == (a + b - a * 2) * "1.5" / 2
+        True
+        >>> expr.evaluate("usd", fo)
+        Decimal('-3.75')
+    """
+
+    __slots__ = ["_op", "_operands", "_value", "_program"]
+
+    def __init__(
+        self,
+        op: int,
+        operands: tuple[LazyMoneyVector, ...],
+        value: MoneyVector | decimal.Decimal | None = None,
+    ) -> None:
+        self._op = op
+        self._operands = operands
+        self._value = value
+        self._program: (
+            tuple[tuple[_LazyInstruction, ...], tuple[MoneyVector, ...], int] | None
+        ) = None
+
+    def __repr__(self) -> str:
+        if self._op == _LEAF:
+            return f"{self.__class__.__name__}({self._value!r})"
+        return f"{self.__class__.__name__}(<expression>)"
+
+    def __add__(self, other: LazyMoneyVector | MoneyVector) -> LazyMoneyVector:
+        if isinstance(other, MoneyVector):
+            other = lazy(other)
+        if not isinstance(other, LazyMoneyVector):
+            return NotImplemented
+        return LazyMoneyVector(_ADD, (self, other))
+
+    def __radd__(self, other: LazyMoneyVector | MoneyVector) -> LazyMoneyVector:
+        if other == 0:
+            return self
+        if not isinstance(other, MoneyVector):
+            return NotImplemented
+        return LazyMoneyVector(_ADD, (lazy(other), self))
+
+    def __sub__(self, other: LazyMoneyVector | MoneyVector) -> LazyMoneyVector:
+        if isinstance(other, MoneyVector):
+            other = lazy(other)
+        if not isinstance(other, LazyMoneyVector):
+            return NotImplemented
+        return LazyMoneyVector(_SUB, (self, other))
+
+    def __rsub__(self, other: MoneyVector) -> LazyMoneyVector:
+        if not isinstance(other, MoneyVector):
+            return NotImplemented
+        return LazyMoneyVector(_SUB, (lazy(other), self))
+
+    def __mul__(self, scalar: decimal.Decimal | int | float | str) -> LazyMoneyVector:
+        try:
+            _scalar = _utils.coerce_decimal(scalar)
+        except NotImplementedError:
+            return NotImplemented
+        return LazyMoneyVector(_MUL, (self,), _scalar)
+
+    def __rmul__(self, scalar: decimal.Decimal | int | float | str) -> LazyMoneyVector:
+        return self.__mul__(scalar)
+
+    def __truediv__(
+        self, scalar: decimal.Decimal | int | float | str
+    ) -> LazyMoneyVector:
+        try:
+            _scalar = _utils.coerce_decimal(scalar)
+        except NotImplementedError:
+            return NotImplemented
+        # Same as `MoneyVector.__truediv__`.
+        return LazyMoneyVector(_MUL, (self,), decimal.Decimal(1) / _scalar)
+
+    def __pos__(self) -> LazyMoneyVector:
+        return self
+
+    def __neg__(self) -> LazyMoneyVector:
+        return LazyMoneyVector(_NEG, (self,))
+
+    def materialize(self) -> MoneyVector:
+        """Calculate the expression and return the result as a dense `MoneyVector`.
+
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If the vectors in the expression are not all part of the same currency
+                space.
+        """
+
+        axes, components = self._run()
+        return MoneyVector._from_trusted(components, axes)
+
+    def evaluate(self, iso_code: str, forex_vec: ForexVector) -> decimal.Decimal:
+        """Calculate the expression and [evaluate](/linearmoney/glossary.html#evaluation)
+        the result to `iso_code` using the rates defined by `forex_vec` without
+        creating the result vector.
+
+        The result is exactly the same as the result of `evaluate` for the
+        materialized vector.
+
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If the vectors in the expression are not all part of the same currency
+                space as `forex_vec` or `iso_code` is not part of that space.
+        """
+
+        axes, components = self._run()
+        gamma_vec = gamma(forex_vec, iso_code)
+        if gamma_vec._axes != axes:
+            raise SpaceError("MoneyVectors must be in the same space.")
+        return _round_evaluation(_dot_components(components, gamma_vec._vector))
+
+    def _compile(
+        self,
+    ) -> tuple[tuple[_LazyInstruction, ...], tuple[MoneyVector, ...], int]:
+        # Flatten the expression graph into a list of instructions in dependency order.
+        # Each instruction is an opcode, the index of its first operand (the index of
+        # a leaf vector for `_LEAF`) and the index of its second operand or its scalar.
+        # Nodes with the same operation and operands share an instruction.
+        # The graph is traversed without recursion, so long chains of operations
+        # don't hit the recursion limit.
+
+        if self._program is not None:
+            return self._program
+        instructions: list[_LazyInstruction] = []
+        leaves: list[MoneyVector] = []
+        slots: dict[int, int] = {}
+        keys: dict[tuple, int] = {}
+        stack: list[tuple[LazyMoneyVector, bool]] = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in slots:
+                continue
+            if not expanded and node._operands:
+                stack.append((node, True))
+                stack.extend([(i, False) for i in reversed(node._operands)])
+                continue
+            operands = [slots[id(i)] for i in node._operands]
+            instruction: _LazyInstruction
+            if node._op == _LEAF:
+                key: tuple = (_LEAF, id(node._value))
+            elif node._op == _MUL:
+                key = (_MUL, operands[0], str(node._value))
+            else:
+                key = (node._op, *operands)
+            slot = keys.get(key)
+            if slot is None:
+                if node._op == _LEAF:
+                    instruction = (_LEAF, len(leaves), None)
+                    leaves.append(node._value)  # type: ignore[arg-type]
+                elif node._op == _MUL:
+                    instruction = (_MUL, operands[0], node._value)  # type: ignore[assignment]
+                elif node._op == _NEG:
+                    instruction = (_NEG, operands[0], None)
+                else:
+                    instruction = (node._op, operands[0], operands[1])
+                slot = len(instructions)
+                instructions.append(instruction)
+                keys[key] = slot
+            slots[id(node)] = slot
+        self._program = (tuple(instructions), tuple(leaves), slots[id(self)])
+        return self._program
+
+    def _run(self) -> tuple[tuple[str, ...], DecimalVector]:
+        # Return the axes and the components of the result of the expression.
+
+        instructions, leaves, result_slot = self._compile()
+        axes = leaves[0]._axes
+        for vec in leaves:
+            if vec._axes != axes:
+                raise SpaceError("MoneyVectors must be in the same space.")
+        leaf_components = [
+            vec._vector if type(vec) in (MoneyVector, ForexVector) else tuple(vec)
+            for vec in leaves
+        ]
+        components = []
+        for idx in range(len(axes)):
+            values: list[decimal.Decimal] = []
+            append = values.append
+            # Same operations and operand order as the `MoneyVector` operators.
+            for op, a, b in instructions:
+                if op == _LEAF:
+                    append(leaf_components[a][idx])
+                elif op == _ADD:
+                    append(values[a] + values[b])  # type: ignore[index]
+                elif op == _SUB:
+                    append(values[a] - values[b])  # type: ignore[index]
+                elif op == _MUL:
+                    append(b * values[a])  # type: ignore[operator]
+                else:
+                    append(-values[a])
+            components.append(values[result_slot])
+        return axes, tuple(components)
+
+
+def lazy(vec: MoneyVector | LazyMoneyVector) -> LazyMoneyVector:
+    """Return a `LazyMoneyVector` that records operations on `vec` instead of
+    calculating them.
+
+    Raises:
+        TypeError:
+            If `vec` is not a `MoneyVector`.
+    """
+
+    if isinstance(vec, LazyMoneyVector):
+        return vec
+    if not isinstance(vec, MoneyVector):
+        raise TypeError(f"Unsupported type for a lazy vector: {type(vec)}")
+    return LazyMoneyVector(_LEAF, (), vec)
+
+
+_DecimalRates: TypeAlias = dict[str, decimal.Decimal]
+_NumericRates: TypeAlias = dict[str, int | float | decimal.Decimal]
+
+
+class RatesDict(TypedDict):
+    """A dictionary representing forex rates ***from*** `base` ***to*** each of the
+    keys in `rates`.
+
+    The key names of this dict are chosen to match the most common structure returned
+    by public HTTP APIs for forex data since that is how most applications
+    will source their forex rates, so this allows passing the results of e.g.
+    `json.load(api_response)` directly to any function that accepts this type.
+    """
+
+    base: str
+    rates: _NumericRates
+
+
+@cache.cached()
+def _coerce_decimal_rates(numeric_rates: _NumericRates) -> _DecimalRates:
+    """Coerce the values of `numeric_rates` to `decimal.Decimal` and force all keys
+    to uppercase."""
+
+    return {k.upper(): _utils.coerce_decimal(v) for k, v in numeric_rates.items()}
+
+
+@cache.cached()
+def _merge_rates(base_rates: _DecimalRates, overrides: _DecimalRates) -> _DecimalRates:
+    """Override values in `base_rates` with corresponding values in `overrides`.
+    Any keys in `overrides` not present in `base_rates` will be merged into `base_rates
+    as well."""
+
+    r = {k: v for k, v in base_rates.items()}
+    r.update(overrides)
+    return r
+
+
+@cache.cached()
+def _invert_rates(rates: _DecimalRates) -> _DecimalRates:
+    """Invert the forex rates given by `rates`.
+
+    Input forex rates are assumed to represent the rates from
+    Quote Currency -> All Currencies. This function inverts them to represent the
+    rates from All Currencies -> Quote Currency.
+
+    E.g. (EUR -> EUR, EUR -> JPY, EUR -> USD) becomes
+    (EUR -> EUR, JPY -> EUR, USD -> EUR).
+    """
+
+    return {k: (_ONE / v) for k, v in rates.items()}
+
+
+@cache.cached()
+def forex(
+    forex_rates: RatesDict, **overrides: int | float | decimal.Decimal
+) -> ForexVector:
+    r"""Construct a new `ForexVector` suitable for use in the `gamma` function.
+
+    Args:
+        forex_rates:
+            A mapping where each of the values in `forex_rates["rates"]` specifies
+            the rate ***from*** `forex_rates["base"]` ***to*** the value's
+            corresponding key.
+            `forex_rates["base"]` and all keys in `forex_rates["rates"]` are treated as
+            case-insensitive, and all numeric rate values are forced to
+            `decimal.Decimal`, so `{"base": "eur", "rates": {"usd": 0.1}}` and
+            `{"base": "EUR", "rates": {"USD": decimal.Decimal("0.1")}}` are treated as
+            equivalent.
+            If the `rates` key of `forex_rates` is an empty dictionary, then
+            we create a forex vector with only one rate, which is `base -> base = 1`.
+            This makes it clear that a forex vector is intended to force
+            [single-currency](/user_guide/recipes.html#single-currency-application) calculations.
+        \*\*overrides:
+            Additional kwargs interpreted as ISO 4217 currency codes that should be
+            manually overriden with the value provided or added to the set of
+            exchange rates if the code is not already present in
+            `forex_rates["rates"]`.
+            Any rates passed as kwargs are interpreted in
+            the same way as if they had been included in the `forex_rates["rates"]`
+            nested mapping, so they should represent the exchange rates ***from***
+            `forex_rates["base"]` ***to*** the currency represented by the name of
+            the kwarg. All kwargs are case-insensitive, so passing `usd=0.1` will
+            result in the rate
+            `forex_rates["base"] -> "USD" = decimal.Decimal("0.1")`.
+    Returns:
+        The newly created `ForexVector`.
+
+        Its [`axes`](#MoneyVector.axes) tuple will be the set of all
+        currencies provided via `forex_rates["rates"]` and `overrides` along with
+        the `forex_rates["base"]`.
+    Raises:
+        `linearmoney.exceptions.IntegrityError`:
+            If the `forex_rates["rates"]` dictionary contains any values that are less
+            than or equal to 0.
+    """
+
+    _rates: _DecimalRates = _coerce_decimal_rates(forex_rates["rates"])
+    _iso_code: str = forex_rates["base"].upper()
+
+    if overrides:
+        _rates = _merge_rates(_rates, _coerce_decimal_rates(overrides))
+
+    for r in _rates.values():
+        if r <= 0:
+            raise IntegrityError("All components of a ForexVector must be > 0.")
+
+    # We copy here to prevent mutating rates returned from the cache
     _rates = {k: v for k, v in _rates.items()}
     _rates[_iso_code] = decimal.Decimal("1.0")
 
-    _rates = _invert_rates(_rates)
-    _sorted_rates = dict(sorted(_rates.items()))
-    return ForexVector(tuple(_sorted_rates.values()), tuple(_sorted_rates))
+    _rates = _invert_rates(_rates)
+    _sorted_rates = dict(sorted(_rates.items()))
+    return ForexVector(tuple(_sorted_rates.values()), tuple(_sorted_rates))
+
+
+def update_forex(
+    forex_vec: ForexVector, **changes: int | float | decimal.Decimal
+) -> ForexVector:
+    r"""Return a new `ForexVector` with some of the rates of `forex_vec` replaced.
+
+    Only the changed rates are coerced and inverted, and the result reuses the axes
+    of `forex_vec`, so it is part of the same currency space. This makes it much
+    cheaper than building a new vector with `forex` for every rate tick, and since
+    the function is not cached, a stream of updates does not fill the cache with
+    short-lived vectors.
+
+    The result is exactly the same as the result of `forex` with the original rates
+    and `changes` passed as overrides.
+
+    Args:
+        forex_vec:
+            The forex vector to update.
+        \*\*changes:
+            The new rates interpreted in the same way as the overrides of `forex`,
+            i.e. as the rates ***from*** the base currency of `forex_vec` ***to***
+            the case-insensitive currency code of each kwarg. The rate of the base
+            currency itself must not be changed.
+    Raises:
+        `linearmoney.exceptions.SpaceError`:
+            If any of the currencies in `changes` are not part of the currency space
+            of `forex_vec`. Use `forex` to create a vector in a different space.
+        `linearmoney.exceptions.IntegrityError`:
+            If any of the new rates are less than or equal to 0.
+        ValueError:
+            If `changes` change the rate of the base currency of `forex_vec`. The base
+            currency is the currency with a rate of 1, so this includes any other
+            currency with a rate of exactly 1, since it can't be told apart from the
+            base. Use `forex` to create a vector with a different base.
+
+    Example:
+        >>> import linearmoney as lm
+        >>> fo = lm.vector.forex({"base": "usd", "rates": {"jpy": 100, "eur": 0.5}})
+        >>> new_fo = lm.vector.update_forex(fo, jpy=125)
+        >>> new_fo
+        ForexVector('2', '0.008', '1')
+        >>> new_fo == lm.vector.forex(
+        ...     {"base": "usd", "rates": {"jpy": 100, "eur": 0.5}}, jpy=125
+        ... )
+        True
+    """
+
+    indices = _index_map(forex_vec._axes)
+    original = forex_vec._vector
+    components = list(original)
+    for iso_code, rate in changes.items():
+        iso_code = iso_code.upper()
+        try:
+            idx = indices[iso_code]
+        except KeyError:
+            raise SpaceError(f"{iso_code} is not an axis of {forex_vec}")
+        _rate = _utils.coerce_decimal(rate)
+        if _rate <= 0:
+            raise IntegrityError("All components of a ForexVector must be > 0.")
+        components[idx] = _ONE / _rate
+        if original[idx] == _ONE and components[idx] != _ONE:
+            raise ValueError("The rate of the base currency must not be changed.")
+    return ForexVector._from_trusted(tuple(components), forex_vec._axes)
+
+
+_TriangulationStep: TypeAlias = tuple[str, str, tuple[str, str], bool]
+
+
+@cache.cached()
+def _triangulation_plan(
+    pairs: tuple[tuple[str, str], ...], base: str
+) -> tuple[tuple[str, ...], tuple[_TriangulationStep, ...]]:
+    """Return the sorted axes and the steps to calculate the rate from `base` to every
+    currency in the quote graph given by `pairs`.
+
+    Each step is a tuple of the currency, the currency whose rate it is calculated
+    from, the quoted pair that connects them and whether the quote is inverted.
+    The steps are found with a breadth-first search from `base`, so every rate is
+    calculated along a path with the fewest quotes, and the steps are in the order
+    they have to be calculated.
+
+    Raises:
+        `linearmoney.exceptions.UnknownDataError`:
+            If any of the currencies in `pairs` are not connected to `base`.
+    """
+
+    adjacent: dict[str, list[tuple[str, tuple[str, str], bool]]] = {base: []}
+    # The quotes are added in their quoted direction first, so that a quote from a
+    # currency is used instead of the inverse of a quote to it whenever possible.
+    for pair in pairs:
+        from_iso_code, to_iso_code = pair
+        adjacent.setdefault(from_iso_code, []).append((to_iso_code, pair, False))
+    for pair in pairs:
+        from_iso_code, to_iso_code = pair
+        adjacent.setdefault(to_iso_code, []).append((from_iso_code, pair, True))
+    steps: list[_TriangulationStep] = []
+    visited = {base}
+    queue = [base]
+    for iso_code in queue:
+        for neighbor, pair, inverted in adjacent[iso_code]:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append(neighbor)
+                steps.append((neighbor, iso_code, pair, inverted))
+    if len(visited) != len(adjacent):
+        unreachable = sorted(set(adjacent) - visited)
+        raise UnknownDataError(
+            f"There are no quotes connecting {base} to {unreachable}"
+        )
+    return tuple(sorted(visited)), tuple(steps)
+
+
+def triangulate(
+    quotes: Mapping[tuple[str, str], int | float | decimal.Decimal], base: str
+) -> ForexVector:
+    """Construct a new `ForexVector` with rates from `base` by triangulating a set of
+    currency pair quotes.
+
+    Each quote is the rate of a currency pair, e.g. `{("EUR", "USD"): "1.08"}` means
+    that 1 EUR is 1.08 USD. The quotes form a graph of currencies, and the rate from
+    `base` to each currency is the product of the quotes (or their inverses) along
+    the path with the fewest quotes between them. If there are multiple such paths,
+    the same path is always used for the same set of pairs.
+
+    The path plan for each set of quoted pairs and `base` is cached, so building a
+    vector from fresh quotes for the same pairs only recalculates the rates along the
+    paths. Rates quoted directly from `base` are used as-is, so if every currency is
+    quoted from `base`, the result is exactly the same as the result of `forex`.
+
+    Args:
+        quotes:
+            A mapping of `(from, to)` pairs of case-insensitive ISO 4217 currency
+            codes to the rate ***from*** the first currency ***to*** the second.
+        base:
+            The currency to calculate the rates from.
+    Raises:
+        `linearmoney.exceptions.IntegrityError`:
+            If any of the quotes are less than or equal to 0.
+        `linearmoney.exceptions.UnknownDataError`:
+            If any of the quoted currencies are not connected to `base` by the quotes.
+
+    Example:
+        >>> import linearmoney as lm
+        >>> quotes = {("eur", "usd"): "1.25", ("usd", "jpy"): 100, ("gbp", "eur"): 2}
+        >>> fo = lm.vector.triangulate(quotes, "usd")
+        >>> fo.axes
+        ('EUR', 'GBP', 'JPY', 'USD')
+        >>> fo.component("gbp")  # 1 GBP = 2 EUR = 2.5 USD
+        Decimal('2.5')
+    """
+
+    rates = {}
+    for pair, rate in quotes.items():
+        _rate = _utils.coerce_decimal(rate)
+        if _rate <= 0:
+            raise IntegrityError("All components of a ForexVector must be > 0.")
+        rates[(pair[0].upper(), pair[1].upper())] = _rate
+    base = base.upper()
+    axes, steps = _triangulation_plan(tuple(sorted(rates)), base)
+    base_rates = {base: decimal.Decimal("1.0")}
+    for iso_code, parent, pair, inverted in steps:
+        if inverted:
+            base_rates[iso_code] = base_rates[parent] / rates[pair]
+        else:
+            base_rates[iso_code] = base_rates[parent] * rates[pair]
+    return ForexVector._from_trusted(tuple([_ONE / base_rates[i] for i in axes]), axes)
+
+
+class ForexHistory:
+    """A time series of forex rates that answers which rates were in effect at a
+    given time.
+
+    Each snapshot is stored as a tuple of the `decimal.Decimal` rates in sorted axis
+    order, and snapshots with the same currencies share a single axes tuple, so a
+    history of many years of rates only holds one small tuple per snapshot.
+    The snapshots are kept sorted by their timestamps, and `as_of` finds the latest
+    snapshot at or before a timestamp with a binary search.
+
+    The `ForexVector` of a snapshot is only built the first time it is requested and
+    is then kept by the history, so repeated lookups don't build the vector again and
+    don't depend on the cache. The vectors are exactly the same as the result of
+    `forex` for the same rates.
+
+    The timestamps can be any values that can be compared with each other, such as
+    `datetime.datetime`s, `datetime.date`s or POSIX timestamps, but all timestamps in
+    one history must be of the same kind.
+
+    Example:
+        >>> import datetime
+        >>> import linearmoney as lm
+        >>> history = lm.vector.ForexHistory(
+        ...     [
+        ...         (datetime.date(2024, 1, 1), {"base": "usd", "rates": {"jpy": 140}}),
+        ...         (datetime.date(2024, 2, 1), {"base": "usd", "rates": {"jpy": 150}}),
+        ...     ]
+        ... )
+        >>> history.as_of(datetime.date(2024, 1, 15))
+        ForexVector('0.007142857142857142857142857143', '1')
+        >>> history.as_of(datetime.date(2024, 2, 1)) == lm.vector.forex(
+        ...     {"base": "usd", "rates": {"jpy": 150}}
+        ... )
+        True
+    """
+
+    __slots__ = ["_timestamps", "_snapshots", "_vectors", "_interned_axes"]
+
+    def __init__(self, snapshots: Iterable[tuple[Any, RatesDict]] = ()) -> None:
+        """
+        Args:
+            snapshots:
+                Pairs of timestamps and the rates in effect from that time on.
+                See `load`.
+        Raises:
+            `linearmoney.exceptions.IntegrityError`:
+                If any of the rates are less than or equal to 0.
+        """
+
+        self._timestamps: list[Any] = []
+        self._snapshots: list[tuple[tuple[str, ...], DecimalVector]] = []
+        self._vectors: list[ForexVector | None] = []
+        self._interned_axes: dict[tuple[str, ...], tuple[str, ...]] = {}
+        self.load(snapshots)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(snapshots={len(self._timestamps)})"
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def add(self, timestamp: Any, forex_rates: RatesDict) -> None:
+        """Add the rates in effect from `timestamp` on to the history.
+
+        If the history already has a snapshot at `timestamp`, it is replaced.
+
+        Raises:
+            `linearmoney.exceptions.IntegrityError`:
+                If any of the rates are less than or equal to 0.
+        """
+
+        snapshot = self._compact(forex_rates)
+        idx = bisect.bisect_left(self._timestamps, timestamp)
+        if idx < len(self._timestamps) and self._timestamps[idx] == timestamp:
+            self._snapshots[idx] = snapshot
+            self._vectors[idx] = None
+        else:
+            self._timestamps.insert(idx, timestamp)
+            self._snapshots.insert(idx, snapshot)
+            self._vectors.insert(idx, None)
+
+    def load(
+        self,
+        snapshots: Iterable[tuple[Any, RatesDict]] | Iterable[RatesDict],
+        key: Callable[[RatesDict], Any] | None = None,
+    ) -> None:
+        """Add many snapshots to the history at once.
+
+        The snapshots don't need to be in order, and the history is only sorted once
+        after all of them are added, so this is much faster than calling `add` for
+        each snapshot. If there are multiple snapshots with the same timestamp, the
+        last one is kept.
+
+        Args:
+            snapshots:
+                Pairs of timestamps and `RatesDict`s, or `RatesDict`s if `key` is
+                provided. `snapshots` is consumed in a single pass, so it can be a
+                generator.
+            key:
+                A function that returns the timestamp of a `RatesDict`. E.g.
+                `lambda rates: rates["date"]` for API responses that include the date
+                of the rates.
+        Raises:
+            `linearmoney.exceptions.IntegrityError`:
+                If any of the rates are less than or equal to 0.
+        """
+
+        entries = list(zip(self._timestamps, self._snapshots, self._vectors))
+        pairs: Iterable[tuple[Any, RatesDict]]
+        if key is None:
+            pairs = snapshots  # type: ignore[assignment]
+        else:
+            pairs = [(key(i), i) for i in snapshots]  # type: ignore[arg-type,misc]
+        for timestamp, forex_rates in pairs:
+            entries.append((timestamp, self._compact(forex_rates), None))
+        # The sort is stable, so the last of the snapshots with equal timestamps wins.
+        entries.sort(key=lambda entry: entry[0])
+        timestamps: list[Any] = []
+        compacted: list[tuple[tuple[str, ...], DecimalVector]] = []
+        vectors: list[ForexVector | None] = []
+        for timestamp, snapshot, vec in entries:
+            if timestamps and timestamps[-1] == timestamp:
+                compacted[-1] = snapshot
+                vectors[-1] = vec
+            else:
+                timestamps.append(timestamp)
+                compacted.append(snapshot)
+                vectors.append(vec)
+        self._timestamps = timestamps
+        self._snapshots = compacted
+        self._vectors = vectors
+
+    def as_of(self, timestamp: Any) -> ForexVector:
+        """Return the `ForexVector` of the latest snapshot at or before `timestamp`.
+
+        Raises:
+            `linearmoney.exceptions.UnknownDataError`:
+                If `timestamp` is before the first snapshot in the history.
+        """
+
+        idx = bisect.bisect_right(self._timestamps, timestamp) - 1
+        if idx < 0:
+            raise UnknownDataError(f"No forex rates are known as of {timestamp}.")
+        vec = self._vectors[idx]
+        if vec is None:
+            axes, rates = self._snapshots[idx]
+            # Same inversion as `forex`, so the vector is exactly the same.
+            vec = ForexVector._from_trusted(tuple([_ONE / r for r in rates]), axes)
+            self._vectors[idx] = vec
+        return vec
+
+    @property
+    def timestamps(self) -> tuple[Any, ...]:
+        """The timestamps of the snapshots in this history in ascending order."""
+
+        return tuple(self._timestamps)
+
+    def _compact(self, forex_rates: RatesDict) -> tuple[tuple[str, ...], DecimalVector]:
+        # Return the axes and the rates from the base currency in axis order.
+        # Raises `IntegrityError` if any rates are less than or equal to 0.
+
+        rates = {
+            k.upper(): _utils.coerce_decimal(v) for k, v in forex_rates["rates"].items()
+        }
+        for r in rates.values():
+            if r <= 0:
+                raise IntegrityError("All components of a ForexVector must be > 0.")
+        rates[forex_rates["base"].upper()] = decimal.Decimal("1.0")
+        axes = tuple(sorted(rates))
+        axes = self._interned_axes.setdefault(axes, axes)
+        return axes, tuple([rates[i] for i in axes])
+
+
+@cache.cached()
+def _round_forex(vec: ForexVector, quantizer: decimal.Decimal) -> ForexVector:
+    """Return a new `ForexVector` with all components of `vec` rounded based on
+    `quantizer`."""
+
+    return ForexVector._from_trusted(
+        tuple([r.quantize(quantizer) for r in vec._vector]), vec._axes
+    )
+
+
+@cache.cached()
+def gamma(r: ForexVector, iso_code: str, decimal_places: int = 17) -> ForexVector:
+    """Return a new `ForexVector` representing the rates ***from*** all different
+    currencies in the currency space of `r` ***to*** `iso_code`.
+
+    Args:
+        r:
+            The forex vector to calculate the gamma vector from.
+            Corresponds to the `r` of the [linear money model's](/linear_money_model.html)
+            gamma function.
+        iso_code:
+            The ISO 4217 currency code that the resulting gamma vector will represent
+            the rates ***to***.
+        decimal_places:
+            The number of decimal places the rates in the resulting gamma vector will
+            use.
+            This should be large enough to support the precise exchange rates between
+            the most valuable and least valuable currencies in the currency space.
+            This is NOT the decimal *precision*. It specifies the exact number of
+            digits *after* the decimal separator, not the total digits of the entire
+            number.
+    Raises:
+        `linearmoney.exceptions.SpaceError`:
+            If `iso_code` is not part of the currency space of `r`.
+    """
+
+    _quantizer = decimal.Decimal("1.0") ** decimal_places
+
+    iso_code = iso_code.upper()
+
+    _space = space(r)
+    if iso_code not in _space.currencies:
+        raise SpaceError(f"{iso_code} is not an axis in currency space {_space}.")
+
+    ek = basis_vector(_space, iso_code)
+    conversion_factor = _ONE / dot(r, ek)
+    new_rates_vector = r * conversion_factor
+    return _round_forex(new_rates_vector, _quantizer)
+
+
+_EVALUATION_QUANTIZER = decimal.Decimal("10") ** decimal.Decimal("-12")
+
+
+@cache.cached()
+def evaluate(
+    asset_vec: MoneyVector, iso_code: str, forex_vec: ForexVector
+) -> decimal.Decimal:
+    """[Evaluate](/linearmoney/glossary.html#evaluation) `asset_vec` to `iso_code` using rates
+    defined by `forex_vec`."""
+
+    result = dot(asset_vec, gamma(forex_vec, iso_code))
+    return _round_evaluation(result)
+
+
+def _round_evaluation(result: decimal.Decimal) -> decimal.Decimal:
+    """Round and normalize the raw dot product `result` of an evaluation."""
+
+    # Eliminate intermediate rounding errors.
+    rounded_result = result.quantize(_EVALUATION_QUANTIZER)
+    # Normalize to improve consistency and improve testability.
+    normalized_result = rounded_result.normalize()
+    return normalized_result
+
+
+@cache.cached()
+def convert(
+    asset_vec: MoneyVector, iso_code: str, forex_vec: ForexVector
+) -> MoneyVector:
+    """[Convert](/linearmoney/glossary.html#conversion) `asset_vec` to `iso_code` using the rates
+    defined by `forex_vec`.
+
+    Returns a [*Rudimentary Asset*](/linearmoney/glossary.html#rudimentary-asset).
+    """
+
+    return evaluate(asset_vec, iso_code, forex_vec) * basis_vector(
+        space(asset_vec), iso_code
+    )
+
+
+class Evaluator(ImmutableDeduplicationMixin):
+    """A precompiled [evaluation](/linearmoney/glossary.html#evaluation) to a single
+    currency using the rates of a single forex vector.
+
+    The gamma vector for `iso_code` is calculated once when the `Evaluator` is created,
+    and calling the `Evaluator` does not go through the cache at all, so the cost of
+    each evaluation is only the dot product with the precomputed gamma vector.
+    This is useful when many assets need to be evaluated with the same rates over a
+    period of time, since each call has a predictable cost and does not evict other
+    values from the cache.
+
+    With the default `decimal_places`, the results are exactly the same as the results
+    of `evaluate` for the same arguments.
+
+    Example:
+        >>> import linearmoney as lm
+        >>> fo = lm.vector.forex({"base": "usd", "rates": {"jpy": 100}})
+        >>> sp = lm.vector.space(fo)
+        >>> to_usd = lm.vector.Evaluator(fo, "usd")
+        >>> to_usd(lm.vector.asset(500, "jpy", sp))
+        Decimal('5')
+        >>> to_usd.many([lm.vector.asset(10, "usd", sp), lm.vector.asset(1, "jpy", sp)])
+        [Decimal('1E+1'), Decimal('0.01')]
+    """
+
+    __slots__ = ["_forex_vec", "_iso_code", "_gamma_vec", "_gamma", "_axes"]
+
+    def __init__(
+        self, forex_vec: ForexVector, iso_code: str, decimal_places: int = 17
+    ) -> None:
+        """
+        Args:
+            forex_vec:
+                The forex vector defining the rates used for evaluation.
+            iso_code:
+                The ISO 4217 currency code to evaluate assets to.
+            decimal_places:
+                The number of decimal places of the precomputed gamma vector.
+                See `gamma` for details.
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If `iso_code` is not part of the currency space of `forex_vec`.
+        """
+
+        self._forex_vec = forex_vec
+        self._iso_code = iso_code.upper()
+        self._gamma_vec = gamma(forex_vec, iso_code, decimal_places)
+        self._gamma = tuple(self._gamma_vec)
+        self._axes = self._gamma_vec._axes
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._forex_vec!r}, {self._iso_code!r})"
+
+    def __call__(self, asset_vec: MoneyVector) -> decimal.Decimal:
+        """Evaluate `asset_vec`.
+
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If `asset_vec` is not part of the currency space of the forex vector.
+        """
+
+        if asset_vec._axes != self._axes:
+            raise SpaceError("MoneyVectors must be in the same space.")
+        if isinstance(asset_vec, SparseMoneyVector):
+            return _round_evaluation(_sparse_dot_components(asset_vec, self._gamma))
+        return _round_evaluation(_dot_components(asset_vec, self._gamma))
+
+    def many(
+        self, assets: Iterable[MoneyVector] | MoneyMatrix
+    ) -> list[decimal.Decimal]:
+        """Evaluate each of the `assets`.
+
+        Args:
+            assets:
+                An iterable of asset vectors or a `MoneyMatrix`.
+                `assets` is consumed in a single pass, so it can be a generator.
+        Returns:
+            The evaluated value of each asset in the same order as `assets`.
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If any of the `assets` are not part of the currency space of the forex
+                vector.
+        """
+
+        if isinstance(assets, FixedMoneyMatrix):
+            return self._many_fixed(assets)
+        gamma_components = self._gamma
+        quantizer = _EVALUATION_QUANTIZER
+        # Same operations as `_dot_components` and `_round_evaluation`, but inlined to
+        # avoid the function call overhead for each row.
+        return [
+            (
+                _sparse_dot_components(row, gamma_components)
+                if isinstance(row, SparseMoneyVector)
+                else builtins.sum([i * j for i, j in zip(row, gamma_components)])
+            )
+            .quantize(quantizer)
+            .normalize()
+            for row in _asset_rows(assets, self._axes)
+        ]
+
+    def _many_fixed(self, assets: FixedMoneyMatrix) -> list[decimal.Decimal]:
+        # Evaluate a fixed-point matrix with the batch dot product kernel.
+        #
+        # The gamma components are scaled to integers with the fewest decimal places
+        # that represent all of them exactly, and each weight is scaled further, so
+        # that every product has the same number of decimal places. As long as the
+        # integer products and partial sums have no more digits than the precision of
+        # the decimal context, the `decimal.Decimal` products and sums are exact too,
+        # so both paths produce the same value before rounding. The rows that exceed
+        # this limit are calculated with `decimal.Decimal`s instead.
+
+        if assets._axes != self._axes:
+            raise SpaceError("MoneyVectors must be in the same space.")
+        gamma_places = max(
+            [max(-int(g.normalize().as_tuple().exponent), 0) for g in self._gamma]
+        )
+        max_places = max(assets._places)
+        weights = [
+            _to_fixed(g, gamma_places) * 10 ** (max_places - p)
+            for g, p in zip(self._gamma, assets._places)
+        ]
+        result_places = max_places + gamma_places
+        limit = 10 ** decimal.getcontext().prec - 1
+        results = []
+        for idx, total in enumerate(_kernels.dot(assets._ints, weights, limit)):
+            if total is None:
+                raw = _dot_components(assets[idx], self._gamma)
+            else:
+                # `total` has no more digits than the context precision, so scaling
+                # is exact and faster than `_from_fixed`.
+                raw = decimal.Decimal(total).scaleb(-result_places)
+            results.append(_round_evaluation(raw))
+        return results
+
+    @property
+    def forex_vec(self) -> ForexVector:
+        """The forex vector this `Evaluator` was created from."""
+
+        return self._forex_vec
+
+    @property
+    def iso_code(self) -> str:
+        """The ISO 4217 currency code this `Evaluator` evaluates to."""
+
+        return self._iso_code
+
+    @property
+    def gamma_vec(self) -> ForexVector:
+        """The precomputed gamma vector used for evaluation."""
+
+        return self._gamma_vec
 
 
-@cache.cached()
-def _round_forex(vec: ForexVector, quantizer: decimal.Decimal) -> ForexVector:
-    """Return a new `ForexVector` with all components of `vec` rounded based on
-    `quantizer`."""
+def _asset_rows(
+    assets: Iterable[MoneyVector] | MoneyMatrix, axes: tuple[str, ...]
+) -> Iterator[Iterable[decimal.Decimal]]:
+    """Yield the components of each asset in `assets` after checking that it is part
+    of the currency space given by `axes`.
 
-    return ForexVector(tuple([r.quantize(quantizer) for r in vec]), vec.axes)
+    Raises:
+        `linearmoney.exceptions.SpaceError`:
+            If any of the assets are not part of the currency space.
+    """
 
+    if isinstance(assets, MoneyMatrix):
+        if assets._axes != axes:
+            raise SpaceError("MoneyVectors must be in the same space.")
+        yield from zip(*assets.columns)
+        return
+    for vec in assets:
+        if vec._axes != axes:
+            raise SpaceError("MoneyVectors must be in the same space.")
+        yield vec
 
-@cache.cached()
-def gamma(r: ForexVector, iso_code: str, decimal_places: int = 17) -> ForexVector:
-    """Return a new `ForexVector` representing the rates ***from*** all different
-    currencies in the currency space of `r` ***to*** `iso_code`.
+
+def evaluate_many(
+    assets: Iterable[MoneyVector] | MoneyMatrix,
+    iso_code: str,
+    forex_vec: ForexVector,
+) -> list[decimal.Decimal]:
+    """[Evaluate](/linearmoney/glossary.html#evaluation) each of the `assets` to
+    `iso_code` using rates defined by `forex_vec`.
+
+    The result for each asset is exactly the same as the result of `evaluate` for that
+    asset, but the gamma vector is only calculated once for the entire batch, and the
+    individual evaluations do not go through the cache.
+
+    This is a shortcut for `Evaluator(forex_vec, iso_code).many(assets)`.
 
     Args:
-        r:
-            The forex vector to calculate the gamma vector from.
-            Corresponds to the `r` of the [linear money model's](/linear_money_model.html)
-            gamma function.
-        iso_code:
-            The ISO 4217 currency code that the resulting gamma vector will represent
-            the rates ***to***.
-        decimal_places:
-            The number of decimal places the rates in the resulting gamma vector will
-            use.
-            This should be large enough to support the precise exchange rates between
-            the most valuable and least valuable currencies in the currency space.
-            This is NOT the decimal *precision*. It specifies the exact number of
-            digits *after* the decimal separator, not the total digits of the entire
-            number.
+        assets:
+            An iterable of asset vectors or a `MoneyMatrix`.
+            `assets` is consumed in a single pass, so it can be a generator.
+    Returns:
+        The evaluated value of each asset in the same order as `assets`.
     Raises:
         `linearmoney.exceptions.SpaceError`:
-            If `iso_code` is not part of the currency space of `r`.
+            If `iso_code` is not part of the currency space of `forex_vec` or any of
+            the `assets` are not part of the same currency space as `forex_vec`.
+
+    Example:
+        >>> import linearmoney as lm
+        >>> fo = lm.vector.forex({"base": "usd", "rates": {"jpy": 100}})
+        >>> sp = lm.vector.space(fo)
+        >>> assets = [lm.vector.asset(10, "usd", sp), lm.vector.asset(500, "jpy", sp)]
+        >>> lm.vector.evaluate_many(assets, "usd", fo)
+        [Decimal('1E+1'), Decimal('5')]
     """
 
-    _quantizer = decimal.Decimal("1.0") ** decimal_places
+    return Evaluator(forex_vec, iso_code).many(assets)
 
-    iso_code = iso_code.upper()
 
-    _space = space(r)
-    if iso_code not in _space.currencies:
-        raise SpaceError(f"{iso_code} is not an axis in currency space {_space}.")
+def convert_many(
+    assets: Iterable[MoneyVector] | MoneyMatrix,
+    iso_code: str,
+    forex_vec: ForexVector,
+) -> MoneyMatrix:
+    """[Convert](/linearmoney/glossary.html#conversion) each of the `assets` to
+    `iso_code` using the rates defined by `forex_vec`.
 
-    ek = basis_vector(_space, iso_code)
-    conversion_factor = _ONE / dot(r, ek)
-    new_rates_vector = r * conversion_factor
-    return _round_forex(new_rates_vector, _quantizer)
+    Each row of the returned `MoneyMatrix` is exactly the same as the result of
+    `convert` for the corresponding asset, and like `evaluate_many`, the gamma
+    vector is only calculated once for the entire batch.
 
+    Raises:
+        `linearmoney.exceptions.SpaceError`:
+            If `iso_code` is not part of the currency space of `forex_vec` or any of
+            the `assets` are not part of the same currency space as `forex_vec`.
+    """
 
-_EVALUATION_QUANTIZER = decimal.Decimal("10") ** decimal.Decimal("-12")
+    values = Evaluator(forex_vec, iso_code).many(assets)
+    ek = basis_vector(space(forex_vec), iso_code)
+    return MoneyMatrix(
+        tuple([tuple([value * i for value in values]) for i in ek]), ek._axes
+    )
 
 
-@cache.cached()
-def evaluate(
-    asset_vec: MoneyVector, iso_code: str, forex_vec: ForexVector
-) -> decimal.Decimal:
-    """[Evaluate](/linearmoney/glossary.html#evaluation) `asset_vec` to `iso_code` using rates
-    defined by `forex_vec`."""
+# Unit roundoff of IEEE 754 double precision floats.
+_FLOAT_UNIT_ROUNDOFF = 2.0**-53
 
-    result = dot(asset_vec, gamma(forex_vec, iso_code))
-    # Eliminate intermediate rounding errors.
-    rounded_result = result.quantize(_EVALUATION_QUANTIZER)
-    # Normalize to improve consistency and improve testability.
-    normalized_result = rounded_result.normalize()
-    return normalized_result
+# The largest error introduced by rounding the exact evaluation to 12 decimal places.
+_EVALUATION_ROUNDING_ERROR = 0.5e-12
 
 
-@cache.cached()
-def convert(
-    asset_vec: MoneyVector, iso_code: str, forex_vec: ForexVector
-) -> MoneyVector:
-    """[Convert](/linearmoney/glossary.html#conversion) `asset_vec` to `iso_code` using the rates
-    defined by `forex_vec`.
+def _approx_error_coefficients(dim: int) -> tuple[float, float]:
+    """Return the coefficients `(a, b)` such that the error of an approximate
+    evaluation with `dim` components is at most `a * abs_total + b`, where `abs_total`
+    is the float sum of the absolute values of the float products.
 
-    Returns a [*Rudimentary Asset*](/linearmoney/glossary.html#rudimentary-asset).
+    The bound is the sum of:
+
+    * The error of the float dot product, including the conversion of the components
+      and gamma components to floats (up to two roundings for fixed-point
+      components), which is within `gamma(dim + 4)` relative to the exact sum of the
+      absolute values of the products.
+    * The error of the `decimal.Decimal` dot product used by `evaluate`, which is
+      within `gamma(dim)` of the decimal context relative to the same sum.
+    * The error of rounding the exact evaluation to 12 decimal places.
+
+    The exact sum of the absolute values is at most `(1 + gamma(dim + 2))` times the
+    float `abs_total`, and both coefficients are scaled up by a few more units of
+    roundoff so that rounding while calculating the bound can't make it too small.
     """
 
-    return evaluate(asset_vec, iso_code, forex_vec) * basis_vector(
-        space(asset_vec), iso_code
+    u = _FLOAT_UNIT_ROUNDOFF
+    float_error = (dim + 4) * u / (1 - (dim + 4) * u)
+    decimal_u = 0.5 * 10.0 ** (1 - decimal.getcontext().prec)
+    decimal_error = dim * decimal_u / (1 - dim * decimal_u)
+    abs_total_error = (dim + 2) * u / (1 - (dim + 2) * u)
+    slack = 1 + 8 * u
+    return (
+        (float_error + decimal_error) * (1 + abs_total_error) * slack,
+        _EVALUATION_ROUNDING_ERROR * slack,
     )
 
 
+class ApproxEvaluator(ImmutableDeduplicationMixin):
+    """A precompiled approximate [evaluation](/linearmoney/glossary.html#evaluation)
+    to a single currency using the rates of a single forex vector.
+
+    This is the float counterpart of `Evaluator` for analytics that value very large
+    numbers of assets and can tolerate a small, known error. The gamma vector is
+    converted to `float`s once, and each evaluation is a `float64` dot product, which
+    uses NumPy for matrices if it is installed.
+
+    Each result is a `(value, error_bound)` pair, where `error_bound` is a rigorous
+    upper bound on the absolute difference between `value` and the exact result of
+    `evaluate` for the same asset. The bound accounts for the conversion of the
+    components to floats, the rounding of the float and `decimal.Decimal` dot products,
+    and the rounding of the exact result to 12 decimal places, so it is never smaller
+    than 0.5E-12. The bound is only valid for the default `decimal_places`.
+
+    Example:
+        >>> import linearmoney as lm
+        >>> fo = lm.vector.forex({"base": "usd", "rates": {"jpy": 100}})
+        >>> sp = lm.vector.space(fo)
+        >>> to_usd = lm.vector.ApproxEvaluator(fo, "usd")
+        >>> value, error_bound = to_usd(lm.vector.asset(500, "jpy", sp))
+        >>> value
+        5.0
+        >>> error_bound < 1E-11
+        True
+    """
+
+    __slots__ = ["_forex_vec", "_iso_code", "_gamma", "_axes"]
+
+    def __init__(
+        self, forex_vec: ForexVector, iso_code: str, decimal_places: int = 17
+    ) -> None:
+        """
+        Args:
+            forex_vec:
+                The forex vector defining the rates used for evaluation.
+            iso_code:
+                The ISO 4217 currency code to evaluate assets to.
+            decimal_places:
+                The number of decimal places of the precomputed gamma vector.
+                See `gamma` for details.
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If `iso_code` is not part of the currency space of `forex_vec`.
+        """
+
+        self._forex_vec = forex_vec
+        self._iso_code = iso_code.upper()
+        gamma_vec = gamma(forex_vec, iso_code, decimal_places)
+        self._gamma = tuple([float(i) for i in gamma_vec])
+        self._axes = gamma_vec._axes
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._forex_vec!r}, {self._iso_code!r})"
+
+    def __call__(self, asset_vec: MoneyVector) -> tuple[float, float]:
+        """Approximately evaluate `asset_vec`.
+
+        Returns:
+            The approximate value and the bound on its error.
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If `asset_vec` is not part of the currency space of the forex vector.
+        """
+
+        if asset_vec._axes != self._axes:
+            raise SpaceError("MoneyVectors must be in the same space.")
+        gamma_components = self._gamma
+        if isinstance(asset_vec, SparseMoneyVector):
+            products = [
+                float(value) * gamma_components[idx]
+                for idx, value in asset_vec._components.items()
+            ]
+        else:
+            products = [float(i) * j for i, j in zip(asset_vec, gamma_components)]
+        total = 0.0
+        abs_total = 0.0
+        for product in products:
+            total += product
+            abs_total += abs(product)
+        a, b = _approx_error_coefficients(len(gamma_components))
+        return total, a * abs_total + b
+
+    def many(
+        self, assets: Iterable[MoneyVector] | MoneyMatrix
+    ) -> list[tuple[float, float]]:
+        """Approximately evaluate each of the `assets`.
+
+        The float dot products are calculated one column at a time for the whole
+        batch, so this is much faster than calling the `ApproxEvaluator` for each
+        asset, especially for a `FixedMoneyMatrix` when NumPy is installed.
+
+        Args:
+            assets:
+                An iterable of asset vectors or a `MoneyMatrix`.
+                `assets` is consumed in a single pass, so it can be a generator.
+        Returns:
+            The approximate value and the bound on its error for each asset in the
+            same order as `assets`.
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If any of the `assets` are not part of the currency space of the forex
+                vector.
+        """
+
+        if isinstance(assets, FixedMoneyMatrix):
+            if assets._axes != self._axes:
+                raise SpaceError("MoneyVectors must be in the same space.")
+            columns = [
+                _kernels.fixed_to_float(col, places)
+                for col, places in zip(assets._ints, assets._places)
+            ]
+        elif isinstance(assets, MoneyMatrix):
+            if assets._axes != self._axes:
+                raise SpaceError("MoneyVectors must be in the same space.")
+            columns = [
+                _kernels.float_column([float(i) for i in col]) for col in assets.columns
+            ]
+        else:
+            rows = [[float(i) for i in row] for row in _asset_rows(assets, self._axes)]
+            if not rows:
+                return []
+            columns = [_kernels.float_column(col) for col in zip(*rows)]
+        totals, abs_totals = _kernels.float_dot(columns, self._gamma)
+        a, b = _approx_error_coefficients(len(self._gamma))
+        return [
+            (total, a * abs_total + b) for total, abs_total in zip(totals, abs_totals)
+        ]
+
+    @property
+    def forex_vec(self) -> ForexVector:
+        """The forex vector this `ApproxEvaluator` was created from."""
+
+        return self._forex_vec
+
+    @property
+    def iso_code(self) -> str:
+        """The ISO 4217 currency code this `ApproxEvaluator` evaluates to."""
+
+        return self._iso_code
+
+
+def evaluate_approx(
+    asset_vec: MoneyVector, iso_code: str, forex_vec: ForexVector
+) -> tuple[float, float]:
+    """Approximately [evaluate](/linearmoney/glossary.html#evaluation) `asset_vec` to
+    `iso_code` using rates defined by `forex_vec` with `float64` arithmetic.
+
+    This is a shortcut for `ApproxEvaluator(forex_vec, iso_code)(asset_vec)`.
+    Use `ApproxEvaluator.many` to approximately evaluate many assets at once.
+
+    Returns:
+        The approximate value and a rigorous upper bound on its absolute difference
+        from the result of `evaluate` for the same arguments.
+    Raises:
+        `linearmoney.exceptions.SpaceError`:
+            If `iso_code` is not part of the currency space of `forex_vec` or
+            `asset_vec` is not part of the same currency space as `forex_vec`.
+
+    Example:
+        >>> import linearmoney as lm
+        >>> fo = lm.vector.forex({"base": "usd", "rates": {"jpy": 100}})
+        >>> sp = lm.vector.space(fo)
+        >>> asset = lm.vector.asset(10, "usd", sp) + lm.vector.asset(500, "jpy", sp)
+        >>> value, error_bound = lm.vector.evaluate_approx(asset, "usd", fo)
+        >>> value
+        15.0
+        >>> abs(value - float(lm.vector.evaluate(asset, "usd", fo))) <= error_bound
+        True
+    """
+
+    return ApproxEvaluator(forex_vec, iso_code)(asset_vec)
+
+
+def _sort_keys(
+    assets: Iterable[MoneyVector] | MoneyMatrix, iso_code: str, forex_vec: ForexVector
+) -> tuple[Sequence[MoneyVector] | MoneyMatrix, list[decimal.Decimal]]:
+    """Return `assets` as an indexable sequence and the evaluated value of each asset
+    calculated in a single batch."""
+
+    if not isinstance(assets, (MoneyMatrix, Sequence)):
+        assets = list(assets)
+    return assets, Evaluator(forex_vec, iso_code).many(assets)
+
+
+def nlargest(
+    n: int,
+    assets: Iterable[MoneyVector] | MoneyMatrix,
+    iso_code: str,
+    forex_vec: ForexVector,
+) -> list[MoneyVector]:
+    """Return the `n` assets with the largest values in `iso_code` using the rates
+    defined by `forex_vec` in descending order of value.
+
+    The values are calculated in a single batch like `evaluate_many`, and the assets
+    are selected with a heap of size `n`, so selecting the largest `n` of `N` assets
+    takes `O(N log n)` time. Assets with equal values are returned in the order they
+    appear in `assets`.
+
+    Args:
+        n:
+            The number of assets to return.
+        assets:
+            An iterable of asset vectors or a `MoneyMatrix`.
+        iso_code:
+            The ISO 4217 currency code to compare the values of the assets in.
+        forex_vec:
+            The forex vector defining the rates used for evaluation.
+    Raises:
+        `linearmoney.exceptions.SpaceError`:
+            If `iso_code` is not part of the currency space of `forex_vec` or any of
+            the `assets` are not part of the same currency space as `forex_vec`.
+
+    Example:
+        >>> import linearmoney as lm
+        >>> fo = lm.vector.forex({"base": "usd", "rates": {"jpy": 100}})
+        >>> sp = lm.vector.space(fo)
+        >>> assets = [lm.vector.asset(x, c, sp) for x, c in [(5, "usd"), (800, "jpy")]]
+        >>> lm.vector.nlargest(1, assets, "usd", fo)
+        [MoneyVector('800', '0')]
+    """
+
+    assets, keys = _sort_keys(assets, iso_code, forex_vec)
+    indices = heapq.nlargest(n, range(len(keys)), key=keys.__getitem__)
+    return [assets[i] for i in indices]
+
+
+def nsmallest(
+    n: int,
+    assets: Iterable[MoneyVector] | MoneyMatrix,
+    iso_code: str,
+    forex_vec: ForexVector,
+) -> list[MoneyVector]:
+    """Return the `n` assets with the smallest values in `iso_code` using the rates
+    defined by `forex_vec` in ascending order of value.
+
+    See `nlargest` for details.
+
+    Raises:
+        `linearmoney.exceptions.SpaceError`:
+            If `iso_code` is not part of the currency space of `forex_vec` or any of
+            the `assets` are not part of the same currency space as `forex_vec`.
+    """
+
+    assets, keys = _sort_keys(assets, iso_code, forex_vec)
+    indices = heapq.nsmallest(n, range(len(keys)), key=keys.__getitem__)
+    return [assets[i] for i in indices]
+
+
+def argsort(
+    assets: Iterable[MoneyVector] | MoneyMatrix,
+    iso_code: str,
+    forex_vec: ForexVector,
+    *,
+    reverse: bool = False,
+) -> list[int]:
+    """Return the indices of `assets` in ascending order of their values in
+    `iso_code` using the rates defined by `forex_vec`.
+
+    The values are calculated in a single batch like `evaluate_many`. The sort is
+    stable, so assets with equal values keep their original order, even if `reverse`
+    is `True`.
+
+    Args:
+        assets:
+            An iterable of asset vectors or a `MoneyMatrix`.
+        iso_code:
+            The ISO 4217 currency code to compare the values of the assets in.
+        forex_vec:
+            The forex vector defining the rates used for evaluation.
+        reverse:
+            Whether to sort in descending order of value instead.
+    Raises:
+        `linearmoney.exceptions.SpaceError`:
+            If `iso_code` is not part of the currency space of `forex_vec` or any of
+            the `assets` are not part of the same currency space as `forex_vec`.
+    """
+
+    _, keys = _sort_keys(assets, iso_code, forex_vec)
+    return sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+
+
+class CrossRates(ImmutableDeduplicationMixin):
+    """The table of exchange rates between every pair of currencies in the currency
+    space of a forex vector.
+
+    Row `k` of the table is the gamma vector for the `k`th axis of the currency space,
+    so the table holds the rates ***from*** every currency ***to*** every currency.
+    The whole table is calculated once when the `CrossRates` object is created, which
+    only takes one division per currency instead of the `basis_vector`, `dot` and
+    cached calls of a separate `gamma` call for each currency.
+
+    With the same `decimal_places`, every row is exactly the same as the result of
+    `gamma`, and the values of `evaluate_all` are exactly the same as the results of
+    `evaluate`.
+
+    The table holds `n * n` `decimal.Decimal`s for a currency space with `n` axes,
+    which is about 120 bytes per rate on CPython, including the row and column
+    tuples. That is less than 6KB for 7 currencies but about 2.7MB for a space of
+    150 currencies.
+
+    Example:
+        >>> import linearmoney as lm
+        >>> fo = lm.vector.forex({"base": "usd", "rates": {"jpy": 100}})
+        >>> rates = lm.vector.cross_rates(fo)
+        >>> rates.rate("usd", "jpy")
+        Decimal('100.00000000000000000')
+        >>> rates.gamma("usd") == lm.vector.gamma(fo, "usd")
+        True
+        >>> rates.evaluate_all(lm.vector.asset(500, "jpy", lm.vector.space(fo)))
+        {'JPY': Decimal('5E+2'), 'USD': Decimal('5')}
+    """
+
+    __slots__ = ["_forex_vec", "_decimal_places", "_axes", "_rows", "_columns"]
+
+    def __init__(self, forex_vec: ForexVector, decimal_places: int = 17) -> None:
+        """
+        Args:
+            forex_vec:
+                The forex vector defining the rates of the table.
+            decimal_places:
+                The number of decimal places of the rates in the table.
+                See `gamma` for details.
+        """
+
+        quantizer = decimal.Decimal("1.0") ** decimal_places
+        # Same operations as `gamma` for each row, so the rows are exactly the same.
+        rates = forex_vec._vector
+        rows = []
+        for rate in rates:
+            conversion_factor = _ONE / rate
+            rows.append(
+                tuple([(conversion_factor * i).quantize(quantizer) for i in rates])
+            )
+        self._forex_vec = forex_vec
+        self._decimal_places = decimal_places
+        self._axes = forex_vec._axes
+        self._rows = tuple(rows)
+        self._columns = tuple(zip(*rows))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._forex_vec!r})"
+
+    def gamma(self, iso_code: str) -> ForexVector:
+        """Return the gamma vector for `iso_code` from the table.
+
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If `iso_code` is not part of the currency space of the table.
+        """
+
+        return ForexVector._from_trusted(
+            self._rows[self._axis_index(iso_code)], self._axes
+        )
+
+    def rate(self, from_iso_code: str, to_iso_code: str) -> decimal.Decimal:
+        """Return the exchange rate ***from*** `from_iso_code` ***to*** `to_iso_code`.
+
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If either currency is not part of the currency space of the table.
+        """
+
+        return self._rows[self._axis_index(to_iso_code)][
+            self._axis_index(from_iso_code)
+        ]
+
+    def evaluate_all(self, asset_vec: MoneyVector) -> dict[str, decimal.Decimal]:
+        """[Evaluate](/linearmoney/glossary.html#evaluation) `asset_vec` to every
+        currency of the table in a single pass over its components.
+
+        Returns:
+            A dict of the ISO 4217 currency code of each axis to the value of
+            `asset_vec` in that currency.
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If `asset_vec` is not part of the currency space of the table.
+        """
+
+        if asset_vec._axes != self._axes:
+            raise SpaceError("MoneyVectors must be in the same space.")
+        if isinstance(asset_vec, SparseMoneyVector):
+            components: Iterable[tuple[int, decimal.Decimal]] = (
+                asset_vec._components.items()
+            )
+        else:
+            components = enumerate(asset_vec)
+        totals = [_ZERO for _ in self._axes]
+        # Zero components are skipped like in `_sparse_dot_components`, and the
+        # products of each currency are accumulated in the same order as `dot`.
+        for idx, component in components:
+            if component:
+                totals = [
+                    total + component * rate
+                    for total, rate in zip(totals, self._columns[idx])
+                ]
+        return {
+            axis: _round_evaluation(total) for axis, total in zip(self._axes, totals)
+        }
+
+    def _axis_index(self, iso_code: str) -> int:
+        # Raises `SpaceError` if `iso_code` is not an axis of the table.
+
+        iso_code = iso_code.upper()
+        try:
+            return _index_map(self._axes)[iso_code]
+        except KeyError:
+            raise SpaceError(f"{iso_code} is not an axis of {self}")
+
+    @property
+    def forex_vec(self) -> ForexVector:
+        """The forex vector this table was created from."""
+
+        return self._forex_vec
+
+    @property
+    def decimal_places(self) -> int:
+        """The number of decimal places of the rates in this table."""
+
+        return self._decimal_places
+
+    @property
+    def axes(self) -> tuple[str, ...]:
+        """The ISO 4217 currency codes of the rows and columns of this table."""
+
+        return self._axes
+
+    @property
+    def rows(self) -> tuple[DecimalVector, ...]:
+        """The rows of the table, one gamma vector per axis."""
+
+        return self._rows
+
+
+@cache.cached(size_multiplier=1 / 32)
+def cross_rates(forex_vec: ForexVector, decimal_places: int = 17) -> CrossRates:
+    """Return the `CrossRates` table of the rates between every pair of currencies in
+    the currency space of `forex_vec`.
+
+    Each table holds `n * n` rates for a currency space with `n` axes, e.g. about
+    2.7MB for a space of 150 currencies, so only `base_size / 32` tables are cached,
+    i.e. 8 tables with the default `base_size` of 256. Keep a reference to the table
+    when it is used for more evaluations than the cache can hold.
+
+    Args:
+        forex_vec:
+            The forex vector defining the rates of the table.
+        decimal_places:
+            The number of decimal places of the rates in the table.
+            See `gamma` for details.
+    """
+
+    return CrossRates(forex_vec, decimal_places)
+
+
+def evaluate_all(
+    asset_vec: MoneyVector, forex_vec: ForexVector
+) -> dict[str, decimal.Decimal]:
+    """[Evaluate](/linearmoney/glossary.html#evaluation) `asset_vec` to every currency
+    in the currency space of `forex_vec`.
+
+    Uses the cached `CrossRates` table of `forex_vec`, so the results are exactly the
+    same as the results of `evaluate` for every currency, and the table is only
+    calculated once for all evaluations with the same forex vector. See `cross_rates`
+    for the memory used by the table.
+
+    Each non-zero component of `asset_vec` is multiplied by its rounded rate to every
+    currency like in `evaluate`, which takes one multiplication per non-zero
+    component and currency. Multiplying the value in the base currency by the rate of
+    each currency instead would be cheaper, but it rounds differently, so the results
+    could differ from `evaluate`.
+
+    Returns:
+        A dict of the ISO 4217 currency code of each axis to the value of `asset_vec`
+        in that currency.
+    Raises:
+        `linearmoney.exceptions.SpaceError`:
+            If `asset_vec` is not part of the same currency space as `forex_vec`.
+
+    Example:
+        >>> import linearmoney as lm
+        >>> fo = lm.vector.forex({"base": "usd", "rates": {"jpy": 100}})
+        >>> sp = lm.vector.space(fo)
+        >>> asset = lm.vector.asset(10, "usd", sp) + lm.vector.asset(500, "jpy", sp)
+        >>> lm.vector.evaluate_all(asset, fo)
+        {'JPY': Decimal('1.5E+3'), 'USD': Decimal('15')}
+    """
+
+    return cross_rates(forex_vec).evaluate_all(asset_vec)
+
+
+class Portfolio:
+    """A running total of asset vectors whose value in a single currency is kept up to
+    date as assets are added and rates change.
+
+    The portfolio keeps the total of its assets along each axis and the gamma vector
+    for `iso_code`. Adding an asset only updates the value by the dot product of the
+    asset's non-zero components with the gamma vector, and changing the rate of a
+    currency only updates the value by the change of that currency's gamma component
+    times the holdings along its axis, so the cost of each update is proportional to
+    the number of components that changed instead of the dimension of the space.
+    Changing the rate of `iso_code` itself changes every gamma component, so the
+    portfolio is fully revalued in that case.
+
+    The incremental updates accumulate the products in a different order than a full
+    `evaluate`, so with large enough values, the `decimal.Decimal` rounding of the
+    intermediate sums could make the value drift away from the result of `evaluate`.
+    `reconcile` recalculates the value from scratch and returns the difference.
+
+    Portfolios are mutable and are not thread-safe.
+
+    Example:
+        >>> import linearmoney as lm
+        >>> fo = lm.vector.forex({"base": "usd", "rates": {"jpy": 100, "eur": 0.5}})
+        >>> sp = lm.vector.space(fo)
+        >>> book = lm.vector.Portfolio(fo, "usd")
+        >>> book.add(lm.vector.asset(1000, "jpy", sp))
+        >>> book.add(lm.vector.asset(5, "eur", sp))
+        >>> book.value
+        Decimal('2E+1')
+        >>> book.update_rates(jpy=50)
+        >>> book.value
+        Decimal('3E+1')
+        >>> book.reconcile()
+        Decimal('0')
+    """
+
+    __slots__ = [
+        "_forex_vec",
+        "_iso_code",
+        "_decimal_places",
+        "_quantizer",
+        "_target_idx",
+        "_conversion_factor",
+        "_gamma",
+        "_holdings",
+        "_raw_value",
+    ]
+
+    def __init__(
+        self,
+        forex_vec: ForexVector,
+        iso_code: str,
+        assets: Iterable[MoneyVector] = (),
+        decimal_places: int = 17,
+    ) -> None:
+        """
+        Args:
+            forex_vec:
+                The forex vector defining the current rates.
+            iso_code:
+                The ISO 4217 currency code to value the portfolio in.
+            assets:
+                The initial assets of the portfolio.
+            decimal_places:
+                The number of decimal places of the gamma vector.
+                See `gamma` for details.
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If `iso_code` or any of the `assets` are not part of the currency space
+                of `forex_vec`.
+        """
+
+        self._iso_code = iso_code.upper()
+        self._decimal_places = decimal_places
+        self._quantizer = decimal.Decimal("1.0") ** decimal_places
+        try:
+            self._target_idx = _index_map(forex_vec._axes)[self._iso_code]
+        except KeyError:
+            raise SpaceError(f"{self._iso_code} is not an axis of {forex_vec}.")
+        self._holdings = [_ZERO for _ in forex_vec._axes]
+        self._forex_vec: ForexVector
+        self._conversion_factor: decimal.Decimal
+        self._gamma: DecimalVector
+        self._raw_value: decimal.Decimal
+        self._set_forex(forex_vec)
+        for vec in assets:
+            self.add(vec)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._forex_vec!r}, {self._iso_code!r})"
+
+    def add(self, asset_vec: MoneyVector) -> None:
+        """Add `asset_vec` to the portfolio and update the value by its value.
+
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If `asset_vec` is not part of the currency space of the forex vector.
+        """
+
+        if asset_vec._axes != self._forex_vec._axes:
+            raise SpaceError("MoneyVectors must be in the same space.")
+        if isinstance(asset_vec, SparseMoneyVector):
+            components: Iterable[tuple[int, decimal.Decimal]] = (
+                asset_vec._components.items()
+            )
+        else:
+            components = enumerate(asset_vec)
+        holdings = self._holdings
+        gamma_components = self._gamma
+        raw_value = self._raw_value
+        for idx, component in components:
+            if component:
+                holdings[idx] += component
+                raw_value += component * gamma_components[idx]
+        self._raw_value = raw_value
+
+    def update_rates(self, **changes: int | float | decimal.Decimal) -> None:
+        r"""Change some of the rates and update the value by the contribution of each
+        changed rate.
+
+        Args:
+            \*\*changes:
+                The new rates interpreted in the same way as by `update_forex`.
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If any of the currencies in `changes` are not part of the currency
+                space of the forex vector.
+            `linearmoney.exceptions.IntegrityError`:
+                If any of the new rates are less than or equal to 0.
+            ValueError:
+                If `changes` change the rate of the base currency of the forex vector.
+                The portfolio is left unchanged, so it never caches values computed
+                with rates that have no base currency.
+        """
+
+        # Validates all changes before any state of the portfolio is changed.
+        new_forex = update_forex(self._forex_vec, **changes)
+        indices = _index_map(new_forex._axes)
+        self._update([indices[i.upper()] for i in changes], new_forex)
+
+    def set_forex(self, forex_vec: ForexVector) -> None:
+        """Replace the rates with the rates of `forex_vec` and update the value by the
+        contribution of each rate that changed.
+
+        Raises:
+            `linearmoney.exceptions.SpaceError`:
+                If `forex_vec` is not part of the same currency space as the current
+                forex vector.
+        """
+
+        if forex_vec._axes != self._forex_vec._axes:
+            raise SpaceError("MoneyVectors must be in the same space.")
+        changed = [
+            idx
+            for idx, (old, new) in enumerate(zip(self._forex_vec._vector, forex_vec))
+            if old != new
+        ]
+        self._update(changed, forex_vec)
+
+    def reconcile(self) -> decimal.Decimal:
+        """Recalculate the value of the portfolio with a full `evaluate` of the
+        holdings and return the difference between the incrementally updated value and
+        the recalculated value.
+
+        The portfolio uses the recalculated value afterwards, so any drift is
+        corrected.
+        """
+
+        value = self.value
+        exact = evaluate(self.holdings, self._iso_code, self._forex_vec)
+        self._raw_value = _dot_components(self._holdings, self._gamma)
+        return (value - exact).normalize()
+
+    def _update(self, changed: Iterable[int], forex_vec: ForexVector) -> None:
+        # Update the gamma components of the `changed` axes and the value by their
+        # contribution, or fully revalue the portfolio if the rate of the target
+        # currency changed.
+
+        changed = set(changed)
+        if self._target_idx in changed:
+            self._set_forex(forex_vec)
+            return
+        gamma_components = list(self._gamma)
+        raw_value = self._raw_value
+        # Same operations as `gamma`, so the components are exactly the same.
+        for idx in changed:
+            new_gamma = (self._conversion_factor * forex_vec._vector[idx]).quantize(
+                self._quantizer
+            )
+            raw_value += self._holdings[idx] * (new_gamma - gamma_components[idx])
+            gamma_components[idx] = new_gamma
+        self._gamma = tuple(gamma_components)
+        self._forex_vec = forex_vec
+        self._raw_value = raw_value
+
+    def _set_forex(self, forex_vec: ForexVector) -> None:
+        # Recalculate the gamma vector and the value from scratch.
+
+        self._forex_vec = forex_vec
+        self._conversion_factor = _ONE / forex_vec._vector[self._target_idx]
+        self._gamma = tuple(gamma(forex_vec, self._iso_code, self._decimal_places))
+        self._raw_value = _dot_components(self._holdings, self._gamma)
+
+    @property
+    def value(self) -> decimal.Decimal:
+        """The current value of the portfolio in `iso_code`."""
+
+        return _round_evaluation(self._raw_value)
+
+    @property
+    def holdings(self) -> MoneyVector:
+        """The total of all assets in the portfolio."""
+
+        return MoneyVector._from_trusted(tuple(self._holdings), self._forex_vec._axes)
+
+    @property
+    def forex_vec(self) -> ForexVector:
+        """The forex vector of the current rates."""
+
+        return self._forex_vec
+
+    @property
+    def iso_code(self) -> str:
+        """The ISO 4217 currency code the portfolio is valued in."""
+
+        return self._iso_code
+
+
 @cache.cached()
 def store(vec: MoneyVector) -> str:
     """Serialize `vec` to a string that can be used to recreate the exact same
     vector."""
 
-    component_list = [
-        ";".join([k, str(v.normalize())]) for k, v in zip(vec.axes, vec, strict=True)
-    ]
+    if isinstance(vec, SparseMoneyVector):
+        # Only the non-zero components need to be normalized.
+        components = vec._components
+        component_list = [
+            (
+                ";".join([k, str(components[idx].normalize())])
+                if idx in components
+                else ";".join([k, "0"])
+            )
+            for idx, k in enumerate(vec._axes)
+        ]
+    else:
+        component_list = [
+            ";".join([k, str(v.normalize())])
+            for k, v in zip(vec.axes, vec, strict=True)
+        ]
     return ":".join(component_list)
 
 
@@ -258,9 +258,17 @@ def fixt_restore_global_cache():
 
     stored_bs = lm.cache.get_base_size()
     stored_enabled = lm.cache.is_enabled()
+    stored_scope = lm.cache.get_scope()
+    stored_stats_enabled = lm.cache.is_stats_enabled()
+    stored_policy = lm.cache.get_policy()
+    stored_max_bytes = lm.cache.get_max_bytes()
     yield None
     lm.cache.set_base_size(stored_bs)
     lm.cache.enable(stored_enabled)
+    lm.cache.set_scope(stored_scope)
+    lm.cache.enable_stats(stored_stats_enabled)
+    lm.cache.set_policy(stored_policy)
+    lm.cache.set_max_bytes(stored_max_bytes)
 
 
 helpers = SimpleNamespace()
@@ -1,11 +1,12 @@
 import decimal
+import random
 
 import pytest
 from pytest_lazy_fixtures import lf
 from pytest_parametrize_cases import Case, parametrize_cases
 
 import linearmoney as lm
-from linearmoney.exceptions import SpaceError
+from linearmoney.exceptions import IntegrityError, SpaceError
 from tests.conftest import helpers
 
 evaluations = [
@@ -107,6 +108,145 @@ def test_basis_vector_space_error(fixt_space):
         lm.vector.basis_vector(fixt_space, "SOME_INVALID_ISO_CODE")
 
 
+def test_space_index_and_component(fixt_space):
+    """Components should be accessible by ISO code through the precomputed axis
+    indices of the currency space."""
+
+    for idx, axis in enumerate(fixt_space.axes):
+        assert fixt_space.index(axis) == idx
+        assert fixt_space.index(axis.lower()) == idx
+        basis = lm.vector.basis_vector(fixt_space, axis)
+        assert basis.component(axis) == 1
+        assert sum([basis.component(i) for i in fixt_space.axes]) == 1
+    vec = lm.vector.asset(10, "usd", fixt_space) + lm.vector.asset(5, "jpy", fixt_space)
+    for sut in (vec, lm.vector.to_sparse(vec), lm.vector.matrix([vec])[0]):
+        assert sut.component("jpy") == 5
+        assert sut.component("USD") == 10
+        assert sut.component("eur") == 0
+        with pytest.raises(SpaceError):
+            sut.component("gil")
+    with pytest.raises(SpaceError):
+        fixt_space.index("gil")
+
+
+def test_index_maps_are_bounded():
+    """The index maps of ad-hoc spaces and vectors should not be kept forever."""
+
+    for i in range(lm.vector._MAX_INDEX_MAPS + 10):
+        sp = lm.vector.CurrencySpace(("USD", f"X{i:02}"))
+        assert lm.vector.asset(i, f"x{i:02}", sp).component(f"X{i:02}") == i
+        assert sp.index(f"x{i:02}") == 1
+    assert len(lm.vector._INDEX_MAPS) <= lm.vector._MAX_INDEX_MAPS
+    # Spaces keep their own map after it is dropped from the table.
+    assert lm.vector.CurrencySpace(("USD", "X00")).index("x00") == 1
+    # Equal axes tuples that are different objects get the same indices.
+    axes = tuple("JPY USD".split())
+    assert lm.vector._index_map(axes) == {"JPY": 0, "USD": 1}
+    assert lm.vector._index_map(axes) is lm.vector._index_map(axes)
+
+
+def test_asset_in_large_space():
+    """Assets in a space of every supported currency should only have one non-zero
+    component at the index of their currency."""
+
+    iso_codes = lm.resources.get_package_resource("supported_iso_codes")
+    sp = lm.vector.CurrencySpace(tuple(sorted(iso_codes)))
+    for iso_code in sp.axes[:: len(sp.axes) // 10] + sp.axes[-1:]:
+        vec = lm.vector.asset(3, iso_code, sp)
+        assert len(vec) == len(sp.axes)
+        assert vec.component(iso_code) == 3
+        assert [i for i in vec if i] == [3]
+        assert vec[sp.index(iso_code)] == 3
+
+
+def test_space_union():
+    """The union of currency spaces should have the sorted axes of every space and
+    only keep fixed-point places that all spaces agree on."""
+
+    sp1 = lm.vector.CurrencySpace(("JPY", "USD"), (0, 2))
+    sp2 = lm.vector.CurrencySpace(("EUR", "USD"), (2, 2))
+    sp3 = lm.vector.CurrencySpace(("CAD",))
+    assert sp1.union(sp2) == lm.vector.CurrencySpace(("EUR", "JPY", "USD"), (2, 0, 2))
+    assert sp1.union(sp2, sp3) == lm.vector.CurrencySpace(("CAD", "EUR", "JPY", "USD"))
+    assert sp1.union() == sp1
+    with pytest.raises(ValueError):
+        sp1.union(lm.vector.CurrencySpace(("USD",), 4))
+
+
+def test_project(fixt_space, fixt_forex_usd):
+    """Projecting into a wider space and back should preserve the components and the
+    kind of vector or matrix."""
+
+    small = lm.vector.CurrencySpace(("JPY", "USD"))
+    vec = lm.vector.asset(10, "usd", small) + lm.vector.asset(5, "jpy", small)
+    expected = lm.vector.asset(10, "usd", fixt_space) + lm.vector.asset(
+        5, "jpy", fixt_space
+    )
+    fixed = lm.vector.fixed_space(fixt_space)
+    for sut_vec in (vec, lm.vector.to_sparse(vec)):
+        sut = lm.vector.project(sut_vec, fixt_space)
+        assert type(sut) is type(sut_vec)
+        assert sut == expected
+        assert lm.vector.project(sut, small) == sut_vec
+        sut = lm.vector.project(sut_vec, fixed)
+        assert isinstance(sut, lm.vector.FixedMoneyVector)
+        assert lm.vector.space(sut) == fixed
+        assert lm.vector.project(sut, fixed) == expected
+        assert type(lm.vector.project(sut, small)) is lm.vector.MoneyVector
+    mat = lm.vector.matrix([vec, vec * 2])
+    for sut_mat in (mat, lm.vector.project(mat, lm.vector.fixed_space(small))):
+        for target in (fixt_space, fixed):
+            sut = lm.vector.project(sut_mat, target)
+            assert sut.axes == fixt_space.axes
+            assert isinstance(sut, lm.vector.FixedMoneyMatrix) == (target is fixed)
+            assert list(sut) == [expected, expected * 2]
+            assert lm.vector.project(sut, small) == mat
+    reordered = lm.vector.CurrencySpace(tuple(reversed(fixt_space.axes)))
+    sut = lm.vector.project(fixt_forex_usd, reordered)
+    assert isinstance(sut, lm.vector.ForexVector)
+    assert sut.component("jpy") == fixt_forex_usd.component("jpy")
+
+
+@pytest.mark.usefixtures("fixt_restore_global_cache")
+def test_project_reuses_remap(fixt_space):
+    """Projecting vectors from equal spaces should reuse the cached remap table even
+    if their axes are different tuples."""
+
+    lm.cache.enable_stats(True)
+    lm.cache.reset_stats()
+    for i in range(5):
+        small = lm.vector.CurrencySpace(tuple("JPY USD".split()))
+        vec = lm.vector.asset(i, "usd", small)
+        assert lm.vector.project(vec, fixt_space).component("usd") == i
+    stats = lm.cache.stats(lm.vector._remap)
+    assert stats["misses"] <= 1
+    assert stats["hits"] >= 4
+
+
+def test_project_invalid(fixt_space, fixt_forex_usd):
+    """Projecting should not drop non-zero components or create zero-valued rates."""
+
+    small = lm.vector.CurrencySpace(("JPY", "USD"))
+    vec = lm.vector.asset(10, "eur", fixt_space)
+    for sut in (vec, lm.vector.to_sparse(vec), lm.vector.matrix([vec])):
+        with pytest.raises(SpaceError):
+            lm.vector.project(sut, small)
+    fixed_vec = lm.vector.asset(10, "eur", lm.vector.fixed_space(fixt_space))
+    for sut in (fixed_vec, lm.vector.matrix([fixed_vec])):
+        with pytest.raises(SpaceError):
+            lm.vector.project(sut, small)
+    with pytest.raises(IntegrityError):
+        lm.vector.project(
+            fixt_forex_usd, fixt_space.union(lm.vector.CurrencySpace(("GIL",)))
+        )
+    with pytest.raises(ValueError):
+        lm.vector.project(
+            lm.vector.asset("0.5", "jpy", fixt_space), lm.vector.fixed_space(fixt_space)
+        )
+    with pytest.raises(TypeError):
+        lm.vector.project(10, fixt_space)
+
+
 def test_gamma():
     """Ensure the gamma function gives correct results."""
 
@@ -161,3 +301,262 @@ def test_gamma_decimal_places(fixt_forex_usd, fixt_iso_codes):
                 integral, fractional = tuple(str(j).split("."))
                 # Number of decimal places should match for all components.
                 assert len(fractional) == i
+
+
+@pytest.fixture(scope="module")
+def fixt_mixed_assets(fixt_space):
+    """A batch of assets with awkward values to exercise intermediate rounding."""
+
+    return [
+        lm.vector.asset(10, "usd", fixt_space),
+        lm.vector.asset(1000, "jpy", fixt_space),
+        lm.vector.asset("0.3333333333333333", "cad", fixt_space)
+        + lm.vector.asset("123456789.987654321", "inr", fixt_space),
+        lm.vector.asset(-7, "gbp", fixt_space)
+        + lm.vector.asset("1E+5", "cny", fixt_space),
+        lm.vector.asset(0, "eur", fixt_space),
+    ]
+
+
+def test_evaluate_many(fixt_mixed_assets, fixt_forex_usd, fixt_iso_codes):
+    """`evaluate_many` should give exactly the same results as `evaluate` for each
+    asset whether the assets are passed as an iterable or a `MoneyMatrix`."""
+
+    expected = [
+        lm.vector.evaluate(i, fixt_iso_codes, fixt_forex_usd) for i in fixt_mixed_assets
+    ]
+    sut = lm.vector.evaluate_many(
+        (i for i in fixt_mixed_assets), fixt_iso_codes, fixt_forex_usd
+    )
+    assert [str(i) for i in sut] == [str(i) for i in expected]
+    mat = lm.vector.matrix(fixt_mixed_assets)
+    sut = lm.vector.evaluate_many(mat, fixt_iso_codes, fixt_forex_usd)
+    assert [str(i) for i in sut] == [str(i) for i in expected]
+
+
+def test_convert_many(fixt_mixed_assets, fixt_forex_usd, fixt_iso_codes):
+    """Each row of the result of `convert_many` should be exactly the same as the
+    result of `convert` for the corresponding asset."""
+
+    sut = lm.vector.convert_many(fixt_mixed_assets, fixt_iso_codes, fixt_forex_usd)
+    for row, asset in zip(sut, fixt_mixed_assets, strict=True):
+        expected = lm.vector.convert(asset, fixt_iso_codes, fixt_forex_usd)
+        assert repr(row) == repr(expected)
+
+
+def test_evaluate_many_space_error(fixt_mixed_assets, fixt_forex_usd):
+    """The batch functions should raise a `SpaceError` for assets in the wrong space
+    and for target currencies that are not part of the forex vector's space."""
+
+    other = lm.vector.forex({"base": "usd", "rates": {"jpy": 100}})
+    with pytest.raises(SpaceError):
+        lm.vector.evaluate_many(fixt_mixed_assets, "usd", other)
+    with pytest.raises(SpaceError):
+        lm.vector.evaluate_many(lm.vector.matrix(fixt_mixed_assets), "usd", other)
+    with pytest.raises(SpaceError):
+        lm.vector.convert_many(fixt_mixed_assets, "gil", fixt_forex_usd)
+
+
+def test_evaluator(fixt_mixed_assets, fixt_forex_usd, fixt_iso_codes):
+    """An `Evaluator` should give exactly the same results as `evaluate`."""
+
+    sut = lm.vector.Evaluator(fixt_forex_usd, fixt_iso_codes)
+    assert sut.iso_code == fixt_iso_codes.upper()
+    assert sut.gamma_vec == lm.vector.gamma(fixt_forex_usd, fixt_iso_codes)
+    for i in fixt_mixed_assets:
+        assert str(sut(i)) == str(lm.vector.evaluate(i, fixt_iso_codes, fixt_forex_usd))
+    assert sut.many(fixt_mixed_assets) == [sut(i) for i in fixt_mixed_assets]
+
+
+def test_evaluator_bypasses_cache(fixt_mixed_assets, fixt_forex_usd):
+    """Calling an `Evaluator` should not read or write the cache."""
+
+    sut = lm.vector.Evaluator(fixt_forex_usd, "usd")
+    lm.cache.invalidate()
+    sut(fixt_mixed_assets[0])
+    sut.many(fixt_mixed_assets)
+    assert lm.cache.size() == 0
+
+
+def test_evaluator_space_error(fixt_mixed_assets, fixt_forex_usd):
+    """An `Evaluator` should raise a `SpaceError` for invalid currencies and for assets
+    that are not part of the forex vector's currency space."""
+
+    with pytest.raises(SpaceError):
+        lm.vector.Evaluator(fixt_forex_usd, "gil")
+    other = lm.vector.Evaluator(
+        lm.vector.forex({"base": "usd", "rates": {"jpy": 100}}), "usd"
+    )
+    with pytest.raises(SpaceError):
+        other(fixt_mixed_assets[0])
+
+
+def test_evaluate_approx(fixt_mixed_assets, fixt_forex_usd, fixt_iso_codes):
+    """Approximate evaluations should be within their error bounds of the exact
+    results for dense and sparse vectors and matrices."""
+
+    sut = lm.vector.ApproxEvaluator(fixt_forex_usd, fixt_iso_codes)
+    assets = fixt_mixed_assets + [lm.vector.to_sparse(i) for i in fixt_mixed_assets]
+    expected = [lm.vector.evaluate(i, fixt_iso_codes, fixt_forex_usd) for i in assets]
+    results = [sut(i) for i in assets]
+    assert results[0] == lm.vector.evaluate_approx(
+        assets[0], fixt_iso_codes, fixt_forex_usd
+    )
+    assert sut.many(i for i in assets) == results
+    assert (
+        sut.many(lm.vector.matrix(fixt_mixed_assets)) == results[: len(expected) // 2]
+    )
+    assert sut.many([]) == []
+    for (value, error_bound), exact in zip(results, expected, strict=True):
+        assert 0 < error_bound < 1e-6
+        assert abs(decimal.Decimal(value) - exact) <= decimal.Decimal(error_bound)
+    with pytest.raises(SpaceError):
+        lm.vector.ApproxEvaluator(fixt_forex_usd, "gil")
+    with pytest.raises(SpaceError):
+        lm.vector.evaluate_approx(
+            fixt_mixed_assets[0],
+            "usd",
+            lm.vector.forex({"base": "usd", "rates": {"jpy": 100}}),
+        )
+
+
+def test_cross_rates(fixt_mixed_assets, fixt_forex_usd, fixt_space):
+    """Every row of the cross rate table should be exactly the same as `gamma` and
+    `evaluate_all` should give exactly the same results as `evaluate`."""
+
+    irregular_forex = lm.vector.forex(
+        {
+            "base": "usd",
+            "rates": {
+                "cad": "1.3612",
+                "cny": "7.2391",
+                "eur": "0.9234",
+                "gbp": "0.7891",
+                "inr": "83.127",
+                "jpy": "151.37",
+            },
+        }
+    )
+    for forex_vec in (fixt_forex_usd, irregular_forex):
+        for decimal_places in (17, 4):
+            sut = lm.vector.cross_rates(forex_vec, decimal_places)
+            assert sut.axes == fixt_space.axes
+            for iso_code in fixt_space.axes:
+                expected = lm.vector.gamma(forex_vec, iso_code, decimal_places)
+                assert sut.gamma(iso_code.lower()) == expected
+                assert repr(sut.gamma(iso_code)) == repr(expected)
+                assert sut.rate("usd", iso_code) == expected.component("usd")
+        sut = lm.vector.cross_rates(forex_vec)
+        for asset_vec in fixt_mixed_assets + [sum(fixt_mixed_assets)]:
+            expected = {
+                i: str(lm.vector.evaluate(asset_vec, i, forex_vec))
+                for i in fixt_space.axes
+            }
+            for vec in (asset_vec, lm.vector.to_sparse(asset_vec)):
+                values = sut.evaluate_all(vec)
+                assert {k: str(v) for k, v in values.items()} == expected
+
+
+def test_cross_rates_space_error(fixt_forex_usd, fixt_asset_usd):
+    """The cross rate table should raise a `SpaceError` for currencies and assets that
+    are not part of its currency space."""
+
+    sut = lm.vector.cross_rates(fixt_forex_usd)
+    with pytest.raises(SpaceError):
+        sut.gamma("gil")
+    with pytest.raises(SpaceError):
+        sut.rate("usd", "gil")
+    other = lm.vector.forex({"base": "usd", "rates": {"jpy": 100}})
+    with pytest.raises(SpaceError):
+        lm.vector.cross_rates(other).evaluate_all(fixt_asset_usd)
+
+
+@pytest.mark.usefixtures("fixt_restore_global_cache")
+def test_cross_rates_cache_is_small():
+    """Only a few of the large cross rate tables should be cached."""
+
+    lm.cache.set_base_size(256)
+    for i in range(20):
+        forex_vec = lm.vector.forex({"base": "usd", "rates": {"jpy": 100 + i}})
+        asset_vec = lm.vector.asset(1, "usd", lm.vector.space(forex_vec))
+        assert lm.vector.evaluate_all(asset_vec, forex_vec)["JPY"] == 100 + i
+    assert lm.cache.max_size(lm.vector.cross_rates) == 8
+    assert lm.cache.size(lm.vector.cross_rates) <= 8
+
+
+def test_evaluate_all(fixt_mixed_assets, fixt_forex_usd, fixt_space):
+    """`evaluate_all` should evaluate an asset to every currency of the space with the
+    same results as `evaluate` for dense and sparse vectors."""
+
+    for asset in fixt_mixed_assets:
+        for vec in (asset, lm.vector.to_sparse(asset)):
+            sut = lm.vector.evaluate_all(vec, fixt_forex_usd)
+            assert tuple(sut) == fixt_space.axes
+            for iso_code, value in sut.items():
+                expected = lm.vector.evaluate(vec, iso_code, fixt_forex_usd)
+                assert str(value) == str(expected)
+    asset = lm.vector.asset(100, "usd", fixt_space)
+    assert lm.vector.evaluate_all(asset, fixt_forex_usd) == {
+        iso_code: lm.vector.evaluate(asset, iso_code, fixt_forex_usd)
+        for iso_code in fixt_space.axes
+    }
+    other = lm.vector.forex({"base": "usd", "rates": {"jpy": 100}})
+    with pytest.raises(SpaceError):
+        lm.vector.evaluate_all(asset, other)
+
+
+def test_evaluate_all_random(fixt_space):
+    """`evaluate_all` should give exactly the same results as `evaluate` for random
+    amounts and rates with many significant digits."""
+
+    rng = random.Random(0)
+
+    def _decimal(digits: int, places: int) -> decimal.Decimal:
+        return decimal.Decimal(rng.randrange(1, 10**digits)).scaleb(-places)
+
+    for _ in range(20):
+        forex_vec = lm.vector.forex(
+            {
+                "base": "usd",
+                "rates": {i: _decimal(7, 4) for i in fixt_space.axes if i != "USD"},
+            }
+        )
+        for _ in range(20):
+            asset_vec = sum(
+                [
+                    lm.vector.asset(_decimal(9, 2), i, fixt_space)
+                    for i in fixt_space.axes
+                ]
+            )
+            sut = lm.vector.evaluate_all(asset_vec, forex_vec)
+            for iso_code in fixt_space.axes:
+                expected = lm.vector.evaluate(asset_vec, iso_code, forex_vec)
+                assert sut[iso_code] == expected
+                assert str(sut[iso_code]) == str(expected)
+
+
+def test_nlargest_nsmallest_argsort(fixt_mixed_assets, fixt_forex_usd, fixt_iso_codes):
+    """The selection and sorting helpers should order the assets in the same way as
+    sorting them by the result of `evaluate`."""
+
+    assets = fixt_mixed_assets * 3
+
+    def key(vec):
+        return lm.vector.evaluate(vec, fixt_iso_codes, fixt_forex_usd)
+
+    ascending = sorted(range(len(assets)), key=lambda i: key(assets[i]))
+    descending = sorted(range(len(assets)), key=lambda i: key(assets[i]), reverse=True)
+    mat = lm.vector.matrix(assets)
+    for make_assets in (lambda: assets, lambda: iter(assets), lambda: mat):
+        for n in (0, 1, 4, len(assets) + 1):
+            sut = lm.vector.nlargest(n, make_assets(), fixt_iso_codes, fixt_forex_usd)
+            assert sut == [assets[i] for i in descending[:n]]
+            sut = lm.vector.nsmallest(n, make_assets(), fixt_iso_codes, fixt_forex_usd)
+            assert sut == [assets[i] for i in ascending[:n]]
+    assert lm.vector.argsort(assets, fixt_iso_codes, fixt_forex_usd) == ascending
+    assert (
+        lm.vector.argsort(mat, fixt_iso_codes, fixt_forex_usd, reverse=True)
+        == descending
+    )
+    with pytest.raises(SpaceError):
+        lm.vector.nlargest(1, assets, "gil", fixt_forex_usd)
@@ -378,3 +378,110 @@ def test_sum_assets(fixt_forex_usd, fixt_three_space):
     with helpers.does_not_raise(TypeError):
         sum(vectors)
     assert helpers.vector_to_tuple(sum(vectors)) == helpers.decimal_tuple(0, 0, 6)
+
+
+def test_vector_sum_matches_builtin_sum(fixt_space, fixt_forex_usd):
+    """The `sum` function should give exactly the same result as the builtin `sum`
+    for every kind of vector."""
+
+    fixed_space = lm.vector.fixed_space(fixt_space)
+    amounts = [("10", "usd"), ("0.125", "eur"), ("-3.50", "jpy"), ("1E+2", "gbp")]
+    dense = [lm.vector.asset(a, c, fixt_space) for a, c in amounts]
+    sparse = [lm.vector.to_sparse(i) for i in dense]
+    fixed = [
+        lm.vector.asset(a, c, fixed_space)
+        for a, c in [("10", "usd"), ("0.13", "eur"), ("-350", "jpy")]
+    ]
+    for vectors in (
+        dense,
+        sparse,
+        fixed,
+        dense + sparse,
+        fixed + dense,
+        [fixt_forex_usd],
+    ):
+        expected = sum(vectors)
+        sut = lm.vector.sum(vectors)
+        assert type(sut) is type(expected)
+        assert sut == expected
+        assert helpers.vector_to_tuple(sut) == helpers.vector_to_tuple(expected)
+    assert [str(i) for i in lm.vector.sum(dense)] == [str(i) for i in sum(dense)]
+    assert lm.vector.sum(i for i in dense) == sum(dense)
+
+
+def test_vector_sum_empty(fixt_space):
+    """Summing an empty iterable should return the zero vector of the given space."""
+
+    assert lm.vector.sum([], fixt_space) == lm.vector.asset(0, "usd", fixt_space)
+    sut = lm.vector.sum([], lm.vector.fixed_space(fixt_space))
+    assert isinstance(sut, lm.vector.FixedMoneyVector)
+    with pytest.raises(ValueError):
+        lm.vector.sum([])
+
+
+def test_vector_sum_invalid_input(fixt_space, fixt_three_space):
+    """Summing vectors in different spaces or non-vectors should raise."""
+
+    usd = lm.vector.asset(1, "usd", fixt_space)
+    with pytest.raises(SpaceError):
+        lm.vector.sum([usd, lm.vector.asset(1, "usd", fixt_three_space)])
+    with pytest.raises(SpaceError):
+        lm.vector.sum([usd], fixt_three_space)
+    with pytest.raises(TypeError):
+        lm.vector.sum([usd, 1])
+    with pytest.raises(TypeError):
+        lm.vector.sum([1])
+
+
+def test_vector_sum_bypasses_cache(fixt_space):
+    """The `sum` function should not write any intermediate vectors to the cache."""
+
+    vectors = [lm.vector.asset(i, "usd", fixt_space) for i in range(10)]
+    lm.cache.invalidate()
+    lm.vector.sum(vectors)
+    assert lm.cache.size() == 0
+
+
+def test_group_sum(fixt_space, fixt_forex_usd):
+    """Each group should have exactly the same total as the builtin `sum` of its
+    vectors and the same value as `evaluate` of that total."""
+
+    amounts = [("10", "usd"), ("0.125", "eur"), ("-3.50", "jpy"), ("1E+2", "gbp")]
+    vectors = [lm.vector.asset(a, c, fixt_space) for a, c in amounts]
+    pairs = [(("desk", i % 3), v * i) for i, v in enumerate(vectors * 4)]
+    expected = {}
+    for key, vec in pairs:
+        expected.setdefault(key, []).append(vec)
+    lm.cache.invalidate()
+    sut = lm.vector.group_sum(iter(pairs))
+    # No intermediate vectors go through the cache.
+    assert lm.cache.size() == 0
+    assert list(sut) == list(expected)
+    for key, group in expected.items():
+        assert helpers.vector_to_tuple(sut[key]) == helpers.vector_to_tuple(sum(group))
+    evaluator = lm.vector.Evaluator(fixt_forex_usd, "jpy")
+    values = lm.vector.group_sum(pairs, fixt_space, evaluator=evaluator)
+    for key, group in expected.items():
+        assert str(values[key]) == str(
+            lm.vector.evaluate(sum(group), "jpy", fixt_forex_usd)
+        )
+
+
+def test_group_accumulator(fixt_space, fixt_three_space):
+    """Groups can be added to incrementally, and vectors in different spaces should be
+    rejected."""
+
+    usd = lm.vector.asset(1, "usd", fixt_space)
+    sut = lm.vector.GroupAccumulator()
+    sut.add("a", usd)
+    sut.update([("b", usd), ("a", lm.vector.to_sparse(usd))])
+    assert len(sut) == 2
+    assert "a" in sut
+    assert sut.result() == {"a": usd * 2, "b": usd}
+    with pytest.raises(SpaceError):
+        sut.add("c", lm.vector.asset(1, "usd", fixt_three_space))
+    with pytest.raises(SpaceError):
+        lm.vector.group_sum([("a", usd)], fixt_three_space)
+    with pytest.raises(TypeError):
+        sut.add("a", 1)
+    assert lm.vector.group_sum([]) == {}
@@ -202,6 +202,8 @@ def test_set_base_size_invalid_input(fixt_invalid_base_size_types):
     Case("invalidate_with_arg", func=lm.cache.invalidate),
     Case("tail", func=lm.cache.tail),
     Case("head", func=lm.cache.head),
+    Case("stats_with_arg", func=lm.cache.stats),
+    Case("reset_stats_with_arg", func=lm.cache.reset_stats),
 )
 def test_cache_not_found_error(func):
     """Functions in the cache module that accept a `cached_func` as an argument
@@ -222,6 +224,8 @@ def test_cache_not_found_error(func):
     Case("invalidate_with_arg", func=lm.cache.invalidate),
     Case("tail", func=lm.cache.tail),
     Case("head", func=lm.cache.head),
+    Case("stats_with_arg", func=lm.cache.stats),
+    Case("reset_stats_with_arg", func=lm.cache.reset_stats),
 )
 def test_cache_not_found_error_before_first_call(func):
     """The caches for functions and methods lm.cached with the @cache.cached()
@@ -382,3 +386,349 @@ def test_decimal_hash_collisions_regression():
     # Keyword argument hashing.
     assert str(_mul1(num=two_places)) == "2.0000"
     assert str(_mul1(num=four_places)) == "2.000000"
+
+
+@pytest.mark.usefixtures("fixt_restore_global_cache")
+def test_set_scope():
+    """The scope of the cache should be "thread" by default and only accept "thread"
+    or "process"."""
+
+    assert lm.cache.get_scope() == "thread"
+    lm.cache.set_scope("process")
+    assert lm.cache.get_scope() == "process"
+    with pytest.raises(ValueError):
+        lm.cache.set_scope("interpreter")
+    assert lm.cache.get_scope() == "process"
+
+
+@pytest.mark.usefixtures("fixt_restore_global_cache")
+def test_stats():
+    """The cache should count the hits, misses, writes and evictions of each function
+    cache and the time spent building keys and calling the function while statistics
+    are enabled."""
+
+    @lm.cache.cached(size_multiplier=0.01)
+    def _add1(num: int) -> int:
+        return num + 1
+
+    lm.cache.set_base_size(256)
+    _add1(1)
+    assert lm.cache.stats(_add1)["misses"] == 0  # Disabled by default.
+    lm.cache.enable_stats(True)
+    _add1(1)
+    for i in range(5):
+        _add1(i)
+    sut = lm.cache.stats(_add1)
+    assert sut == lm.cache.stats()[_add1.__qualname__]
+    assert (sut["hits"], sut["misses"], sut["writes"]) == (2, 4, 4)
+    # `max_size` is 2, so the 4 writes evicted 3 values including `_add1(1)` from
+    # before statistics were enabled.
+    assert (sut["evictions"], sut["size"]) == (3, 2)
+    assert sut["key_time"] > 0
+    assert sut["func_time"] > 0
+    lm.cache.reset_stats()
+    sut = lm.cache.stats(_add1)
+    assert (sut["hits"], sut["misses"], sut["evictions"], sut["size"]) == (0, 0, 0, 2)
+    assert sut["key_time"] == sut["func_time"] == 0
+    lm.cache.enable_stats(False)
+    _add1(100)
+    assert lm.cache.stats(_add1)["misses"] == 0
+
+
+def test_value_based_keys():
+    """Equal ints, floats, strings and unhashable containers should share cache entries
+    even if they are different objects, but values of different types or with
+    different representations should not."""
+
+    calls = []
+
+    @lm.cache.cached()
+    def _identity(value, **kwargs):
+        calls.append(value)
+        return value
+
+    big = 10**20
+    _identity(big)
+    _identity(int(str(big)))
+    _identity("".join(["u", "s", "d"]))
+    _identity("".join(["u", "s", "d"]))
+    assert len(calls) == 2
+    for value in [1.0, -0.0, 0.0, True, 1, "1", decimal.Decimal("1.0")]:
+        _identity(value)
+    assert len(calls) == 9
+    rates = {"base": "usd", "rates": {"jpy": 100, "eur": 0.9}}
+    _identity(rates)
+    _identity({"base": "usd", "rates": {"jpy": 100, "eur": 0.9}})
+    assert len(calls) == 10
+    for value in [
+        {"base": "usd", "rates": {"jpy": 100.0, "eur": 0.9}},
+        {"base": "usd", "rates": {"jpy": "100", "eur": 0.9}},
+        {"base": "usd", "rates": {"jpy": decimal.Decimal(100), "eur": 0.9}},
+        {"base": "usd", "rates": {"jpy": 100, "eur": -0.0}},
+        {"base": "usd", "rates": {"jpy": 100, "eur": 0.0}},
+        ["base", "usd"],
+        {"base": "usd"},
+        ("base", "usd"),
+    ]:
+        _identity(value)
+    assert len(calls) == 18
+    # Keyword arguments are compared by value too.
+    _identity(None, rates=rates)
+    _identity(None, rates={"base": "usd", "rates": {"jpy": 100, "eur": 0.9}})
+    assert len(calls) == 19
+    # Hashable containers are compared by their items like unhashable ones.
+    _identity(("usd", "jpy"))
+    _identity(tuple("usd jpy".split()))
+    assert len(calls) == 20
+    for value in [
+        ("usd", 1),
+        ("usd", 1.0),
+        ("usd", True),
+        ("usd", decimal.Decimal("1.0")),
+        ("usd", decimal.Decimal("1.00")),
+        ("usd", 0.0),
+        ("usd", -0.0),
+        ("usd", ("jpy",)),
+        ("usd", ["jpy"]),
+        frozenset(["usd"]),
+    ]:
+        # Equal containers that are different objects share the cache entries.
+        _identity(value)
+        _identity(type(value)(list(value)))
+        _identity(value=type(value)(list(value)))
+    assert len(calls) == 40
+
+
+@pytest.mark.usefixtures("fixt_restore_global_cache")
+def test_identity_keys_of_new_classes():
+    """The first call with an object of a class compared by identity should be
+    cached under the same key as later calls with the same object."""
+
+    class _Token(lm.mixins.EqualityByHashMixin):
+        def __hash__(self):
+            return 1
+
+    @lm.cache.cached()
+    def _token_id(token):
+        return id(token)
+
+    @lm.cache.cached()
+    def _token_ids(tokens):
+        return [id(i) for i in tokens]
+
+    lm.cache.enable_stats(True)
+    token = _Token()
+    for func, arg in [(_token_id, token), (_token_ids, [token])]:
+        func(arg)
+        func(arg)
+        sut = lm.cache.stats(func)
+        assert (sut["hits"], sut["misses"]) == (1, 1)
+    # Objects with colliding hashes still don't share cache entries.
+    other = _Token()
+    assert _token_id(other) == id(other)
+
+
+@pytest.fixture(params=["lru", "lfu", "2q"])
+def fixt_policy(request):
+    return request.param
+
+
+def _cached_with_policy(func, policy, size_multiplier):
+    # Function caches are identified by the qualified name of the function, so each
+    # policy needs a function with a different name.
+    func.__qualname__ = f"{func.__qualname__}_{policy}"
+    return lm.cache.cached(size_multiplier=size_multiplier, policy=policy)(func)
+
+
+@pytest.mark.usefixtures("fixt_restore_global_cache")
+@pytest.mark.parametrize("scope", ["thread", "process"])
+def test_policies_return_correct_values(fixt_policy, scope):
+    """Every eviction policy should return the same values as the function and never
+    exceed the `max_size` of the cache."""
+
+    lm.cache.set_scope(scope)
+    lm.cache.set_base_size(256)
+    calls = []
+
+    def _mul2(num: int) -> int:
+        calls.append(num)
+        return num * 2
+
+    _mul2 = _cached_with_policy(_mul2, fixt_policy, 0.05)
+    lm.cache.invalidate()
+    for i in list(range(40)) + [1, 2, 3] * 10 + list(range(40)):
+        assert _mul2(i) == i * 2
+        assert lm.cache.size(_mul2) <= lm.cache.max_size(_mul2) == 12
+    assert lm.cache.tail(_mul2) == 78
+    assert len(calls) < 110
+    lm.cache.invalidate(_mul2)
+    assert lm.cache.size(_mul2) == 0
+    _mul2(1)
+    assert lm.cache.head(_mul2) == lm.cache.tail(_mul2) == 2
+
+
+@pytest.mark.usefixtures("fixt_restore_global_cache")
+def test_lfu_keeps_frequently_used_values():
+    """The LFU policy should evict the least frequently used value first."""
+
+    lm.cache.set_base_size(256)
+
+    @lm.cache.cached(size_multiplier=0.01, policy="lfu")
+    def _add1_lfu(num: int) -> int:
+        return num + 1
+
+    _add1_lfu(1)
+    _add1_lfu(1)
+    _add1_lfu(2)
+    assert lm.cache.head(_add1_lfu) == 3
+    _add1_lfu(3)  # Evicts `_add1_lfu(2)` even though `_add1_lfu(1)` is older.
+    assert lm.cache.head(_add1_lfu) == 4
+    _add1_lfu(4)
+    _add1_lfu(5)
+    assert lm.cache.head(_add1_lfu) == 6
+    assert lm.cache.size(_add1_lfu) == 2
+
+
+@pytest.mark.usefixtures("fixt_restore_global_cache")
+def test_scan_resistance():
+    """Scans over many unique arguments should evict the frequently used values with
+    the LRU policy, but not with the LFU and 2Q policies."""
+
+    lm.cache.set_base_size(256)
+    misses = {"lru": 0, "lfu": 0, "2q": 0}
+    for policy in misses:
+
+        def _identity(num: int) -> int:
+            misses[policy] += 1
+            return num
+
+        _identity = _cached_with_policy(_identity, policy, 0.1)
+        hot = list(range(8))
+        unique = iter(range(1000, 10000))
+        for _ in range(3):
+            for i in hot + [next(unique) for _ in range(10)]:
+                _identity(i)
+        misses[policy] = 0
+        for _ in range(20):
+            for i in [next(unique) for _ in range(30)] + hot:
+                _identity(i)
+    assert misses["lru"] == 20 * (30 + 8)
+    assert misses["lfu"] == misses["2q"] == 20 * 30
+
+
+@pytest.mark.usefixtures("fixt_restore_global_cache")
+def test_set_policy():
+    """The default policy should be used for new caches without a policy and only
+    accept the available policies."""
+
+    assert lm.cache.get_policy() == "lru"
+    lm.cache.set_policy("2q")
+
+    @lm.cache.cached()
+    def _add1_default(num: int) -> int:
+        return num + 1
+
+    _add1_default(1)
+    assert lm.cache.get_policy() == "2q"
+    assert isinstance(
+        lm.cache._get_funccache(_add1_default), lm.cache._TwoQueueFuncCache
+    )
+    with pytest.raises(ValueError):
+        lm.cache.set_policy("mru")
+    with pytest.raises(ValueError):
+        lm.cache.cached(policy="mru")
+
+
+def test_estimate_nbytes(fixt_space):
+    """The estimated size of a value should grow with the data it holds."""
+
+    estimate = lm.cache._estimate_nbytes
+    assert estimate(decimal.Decimal("1.23")) > 0
+    assert estimate("usd" * 100) > estimate("usd")
+    rates = {"base": "usd", "rates": {"jpy": 100}}
+    small_space = lm.vector.space(lm.vector.forex(rates))
+    small_asset = lm.vector.asset(1, "usd", small_space)
+    asset = lm.vector.asset(1, "usd", fixt_space)
+    assert len(fixt_space.axes) > len(small_space.axes)
+    assert estimate(asset) > estimate(small_asset) > 0
+    assert estimate(lm.data.locale("en", "us")) > 10 * estimate(asset)
+    # Objects referenced twice by the same value are counted once.
+    assert estimate([rates, rates]) < estimate([rates, dict(rates)])
+
+
+@pytest.mark.usefixtures("fixt_restore_global_cache")
+@pytest.mark.parametrize("scope", ["thread", "process"])
+def test_function_max_bytes(fixt_policy, scope):
+    """A function cache with `max_bytes` should evict values once the cached values
+    use more bytes than the budget, and never cache a value larger than the
+    budget."""
+
+    lm.cache.set_scope(scope)
+    lm.cache.set_base_size(256)
+
+    def _repeat(num: int, times: int) -> str:
+        return str(num) * times
+
+    _repeat.__qualname__ = f"_repeat_{fixt_policy}"
+    _repeat = lm.cache.cached(policy=fixt_policy, max_bytes=5000)(_repeat)
+    lm.cache.invalidate()
+    for i in range(20):
+        assert _repeat(i % 10, 1000) == str(i % 10) * 1000
+        assert 0 < lm.cache.nbytes(_repeat) <= lm.cache.max_bytes(_repeat) == 5000
+    assert lm.cache.size(_repeat) < 10
+    assert lm.cache.tail(_repeat) == "9" * 1000
+    assert lm.cache.stats(_repeat)["nbytes"] == lm.cache.nbytes(_repeat)
+    size = lm.cache.size(_repeat)
+    assert _repeat(1, 10_000) == "1" * 10_000
+    assert lm.cache.size(_repeat) == size
+    lm.cache.invalidate(_repeat)
+    assert lm.cache.nbytes(_repeat) == 0
+    with pytest.raises(TypeError):
+        lm.cache.cached(max_bytes="5000")  # type: ignore[arg-type]
+
+
+@pytest.mark.usefixtures("fixt_restore_global_cache")
+def test_set_max_bytes():
+    """The whole cache should evict values from the function cache that uses the most
+    bytes once the function caches use more bytes than the budget together."""
+
+    lm.cache.set_base_size(256)
+
+    @lm.cache.cached()
+    def _large(num: int) -> str:
+        return str(num) * 1000
+
+    @lm.cache.cached()
+    def _small(num: int) -> str:
+        return str(num)
+
+    assert lm.cache.get_max_bytes() is None
+    lm.cache.invalidate()
+    for i in range(10):
+        _large(i)
+        _small(i)
+    assert lm.cache.size(_large) == lm.cache.size(_small) == 10
+    unbounded = lm.cache.nbytes()
+    assert unbounded == lm.cache.nbytes(_large) + lm.cache.nbytes(_small)
+    lm.cache.enable_stats(True)
+    lm.cache.reset_stats()
+    lm.cache.set_max_bytes(unbounded // 2)
+    assert lm.cache.nbytes() <= unbounded // 2
+    assert lm.cache.size(_large) < 10
+    assert lm.cache.size(_small) == 10
+    assert lm.cache.stats(_large)["evictions"] == 10 - lm.cache.size(_large)
+    for i in range(10, 20):
+        _large(i)
+        assert lm.cache.nbytes() <= unbounded // 2
+        # The running total of the whole cache matches the sizes of the caches.
+        assert lm.cache._get_cachedict().nbytes == lm.cache.nbytes()
+    # Every value that is no longer cached was evicted.
+    assert lm.cache.stats(_large)["evictions"] == 20 - lm.cache.size(_large)
+    assert lm.cache.stats(_small)["evictions"] == 0
+    assert lm.cache.max_bytes(_large) is None
+    lm.cache.set_max_bytes(None)
+    for i in range(20):
+        _large(i)
+    assert lm.cache.size(_large) == 20
+    with pytest.raises(TypeError):
+        lm.cache.set_max_bytes("1000")  # type: ignore[arg-type]
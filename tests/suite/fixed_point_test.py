@@ -0,0 +1,136 @@
+import decimal
+
+import pytest
+
+import linearmoney as lm
+from linearmoney.exceptions import SpaceError
+from tests.conftest import helpers
+
+
+@pytest.fixture(scope="module")
+def fixt_fixed_space(fixt_space):
+    """Fixed-point space using the `places` of each currency from the CLDR data."""
+
+    return lm.vector.fixed_space(fixt_space)
+
+
+_amounts = [
+    (10, "usd"),
+    ("1000", "jpy"),
+    ("0.13", "eur"),
+    ("-3.5", "cad"),
+    ("123456789.01", "gbp"),
+    (0, "inr"),
+]
+
+
+@pytest.fixture(scope="module")
+def fixt_fixed_assets(fixt_fixed_space):
+    return [lm.vector.asset(a, c, fixt_fixed_space) for a, c in _amounts]
+
+
+@pytest.fixture(scope="module")
+def fixt_decimal_assets(fixt_space):
+    return [lm.vector.asset(a, c, fixt_space) for a, c in _amounts]
+
+
+def test_fixed_space(fixt_space, fixt_fixed_space):
+    """`fixed_space` should use the places from the currency data by default or the
+    places provided."""
+
+    # CAD, CNY, EUR, GBP, INR, JPY, USD
+    assert fixt_fixed_space.places == (2, 2, 2, 2, 2, 0, 2)
+    assert fixt_fixed_space.axes == fixt_space.axes
+    assert fixt_fixed_space != fixt_space
+    assert lm.vector.fixed_space(fixt_space, 4).places == tuple(
+        [4 for _ in fixt_space.axes]
+    )
+    with pytest.raises(SpaceError):
+        lm.vector.CurrencySpace(fixt_space.axes, (1, 2))
+    with pytest.raises(ValueError):
+        lm.vector.fixed_space(fixt_space, -1)
+
+
+def test_fixed_assets(fixt_fixed_assets, fixt_decimal_assets, fixt_fixed_space):
+    """Fixed-point assets should have the same values as decimal assets and should
+    compare equal to them."""
+
+    for fixed, dec in zip(fixt_fixed_assets, fixt_decimal_assets):
+        assert isinstance(fixed, lm.vector.FixedMoneyVector)
+        assert fixed == dec
+        assert hash(fixed) == hash(dec)
+        assert helpers.vector_to_tuple(fixed) == helpers.vector_to_tuple(dec)
+        assert lm.vector.space(fixed) == fixt_fixed_space
+        assert lm.vector.store(fixed) == lm.vector.store(dec)
+        assert type(lm.vector.to_dense(fixed)) is lm.vector.MoneyVector
+        assert lm.vector.to_fixed(dec, fixt_fixed_space) == fixed
+    # Components are read out with the places of their axis.
+    assert str(fixt_fixed_assets[0][-1]) == "10.00"
+    assert str(fixt_fixed_assets[1][5]) == "1000"
+
+
+def test_add_sub_exact(fixt_fixed_assets, fixt_decimal_assets):
+    """Addition and subtraction must give exactly the same values as the Decimal
+    implementation and stay fixed-point."""
+
+    for fixed_lhs, dec_lhs in zip(fixt_fixed_assets, fixt_decimal_assets):
+        for fixed_rhs, dec_rhs in zip(fixt_fixed_assets, fixt_decimal_assets):
+            sut = fixed_lhs + fixed_rhs
+            assert isinstance(sut, lm.vector.FixedMoneyVector)
+            assert helpers.vector_to_tuple(sut) == helpers.vector_to_tuple(
+                dec_lhs + dec_rhs
+            )
+            sut = fixed_lhs - fixed_rhs
+            assert isinstance(sut, lm.vector.FixedMoneyVector)
+            assert helpers.vector_to_tuple(sut) == helpers.vector_to_tuple(
+                dec_lhs - dec_rhs
+            )
+            # Mixed backends fall back to Decimal arithmetic.
+            assert helpers.vector_to_tuple(fixed_lhs + dec_rhs) == (
+                helpers.vector_to_tuple(dec_lhs + dec_rhs)
+            )
+            assert helpers.vector_to_tuple(dec_lhs - fixed_rhs) == (
+                helpers.vector_to_tuple(dec_lhs - dec_rhs)
+            )
+    assert sum(fixt_fixed_assets) == sum(fixt_decimal_assets)
+
+
+def test_scaling(fixt_fixed_assets, fixt_decimal_assets):
+    """Integer scaling stays fixed-point and other scalars fall back to Decimal."""
+
+    for fixed, dec in zip(fixt_fixed_assets, fixt_decimal_assets):
+        sut = fixed * 3
+        assert isinstance(sut, lm.vector.FixedMoneyVector)
+        assert sut == dec * 3
+        sut = -fixed
+        assert isinstance(sut, lm.vector.FixedMoneyVector)
+        assert sut == -dec
+        sut = fixed * "1.5"
+        assert type(sut) is lm.vector.MoneyVector
+        assert sut == dec * "1.5"
+        assert fixed / 3 == dec / 3
+
+
+def test_evaluate(fixt_fixed_assets, fixt_decimal_assets, fixt_forex_usd):
+    """Fixed-point assets should evaluate exactly the same as Decimal assets."""
+
+    for fixed, dec in zip(fixt_fixed_assets, fixt_decimal_assets):
+        assert str(lm.vector.evaluate(fixed, "usd", fixt_forex_usd)) == str(
+            lm.vector.evaluate(dec, "usd", fixt_forex_usd)
+        )
+
+
+def test_unrepresentable_amounts(fixt_fixed_space, fixt_space):
+    """Amounts with more decimal places than their axis can't be represented exactly,
+    so they should raise a `ValueError` instead of being rounded."""
+
+    with pytest.raises(ValueError):
+        lm.vector.asset("0.001", "usd", fixt_fixed_space)
+    with pytest.raises(ValueError):
+        lm.vector.asset("0.5", "jpy", fixt_fixed_space)
+    with pytest.raises(ValueError):
+        lm.vector.asset(1, "usd", fixt_fixed_space, sparse=True)
+    with pytest.raises(ValueError):
+        lm.vector.to_fixed(lm.vector.asset(1, "usd", fixt_space), fixt_space)
+    sut = lm.vector.asset(decimal.Decimal("0.10"), "usd", fixt_fixed_space)
+    assert sut.ints[-1] == 10
@@ -0,0 +1,81 @@
+import datetime
+
+import pytest
+
+import linearmoney as lm
+from linearmoney.exceptions import IntegrityError, UnknownDataError
+
+
+def _rates(day: int) -> lm.vector.RatesDict:
+    return {
+        "base": "usd",
+        "rates": {"jpy": 140 + day, "eur": f"0.9{day:02}", "gbp": 0.75},
+        "date": datetime.date(2024, 1, day),
+    }
+
+
+@pytest.fixture
+def fixt_history():
+    # Out of order to make sure the history sorts the snapshots.
+    return lm.vector.ForexHistory([(i["date"], i) for i in map(_rates, (10, 1, 20))])
+
+
+def test_as_of(fixt_history):
+    """`as_of` should return the forex vector of the latest snapshot at or before the
+    timestamp, which should be exactly the same as the result of `forex`."""
+
+    assert len(fixt_history) == 3
+    assert fixt_history.timestamps == tuple(
+        [datetime.date(2024, 1, i) for i in (1, 10, 20)]
+    )
+    for day, expected_day in [(1, 1), (9, 1), (10, 10), (19, 10), (20, 20), (31, 20)]:
+        sut = fixt_history.as_of(datetime.date(2024, 1, day))
+        expected = lm.vector.forex(_rates(expected_day))
+        assert sut == expected
+        assert repr(sut) == repr(expected)
+    with pytest.raises(UnknownDataError):
+        fixt_history.as_of(datetime.date(2023, 12, 31))
+
+
+def test_vectors_are_memoized(fixt_history):
+    """The same snapshot should always return the same vector without using the
+    cache."""
+
+    lm.cache.invalidate()
+    sut = fixt_history.as_of(datetime.date(2024, 1, 15))
+    assert fixt_history.as_of(datetime.date(2024, 1, 12)) is sut
+    assert lm.cache.size() == 0
+
+
+def test_add_and_load(fixt_history):
+    """Snapshots can be added individually or in bulk, and later snapshots with the
+    same timestamp should replace earlier ones."""
+
+    memoized = fixt_history.as_of(datetime.date(2024, 1, 1))
+    fixt_history.add(datetime.date(2024, 1, 5), _rates(5))
+    assert fixt_history.as_of(datetime.date(2024, 1, 6)) == lm.vector.forex(_rates(5))
+    fixt_history.add(datetime.date(2024, 1, 5), _rates(6))
+    assert fixt_history.as_of(datetime.date(2024, 1, 6)) == lm.vector.forex(_rates(6))
+    fixt_history.load([_rates(i) for i in (25, 2, 25)], key=lambda i: i["date"])
+    assert len(fixt_history) == 6
+    assert fixt_history.as_of(datetime.date(2024, 1, 3)) == lm.vector.forex(_rates(2))
+    # Loading more snapshots keeps the vectors that were already built.
+    assert fixt_history.as_of(datetime.date(2024, 1, 1)) is memoized
+    # Snapshots with the same currencies share their axes.
+    assert (
+        fixt_history.as_of(datetime.date(2024, 1, 2))._axes
+        is fixt_history.as_of(datetime.date(2024, 1, 25))._axes
+    )
+
+
+def test_invalid_rates():
+    """Rates less than or equal to 0 should be rejected when they are added."""
+
+    sut = lm.vector.ForexHistory()
+    with pytest.raises(IntegrityError):
+        sut.add(1, {"base": "usd", "rates": {"jpy": 0}})
+    with pytest.raises(IntegrityError):
+        sut.load([(1, {"base": "usd", "rates": {"jpy": -1}})])
+    assert len(sut) == 0
+    with pytest.raises(UnknownDataError):
+        sut.as_of(1)
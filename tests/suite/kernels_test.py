@@ -0,0 +1,193 @@
+import decimal
+
+import pytest
+
+import linearmoney as lm
+from linearmoney import _kernels
+
+
+@pytest.fixture(params=["numpy", "python"])
+def fixt_backend(request, monkeypatch):
+    """Run the test with the NumPy kernels and with the pure Python fallback."""
+
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(_kernels, "np", None)
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def fixt_fixed_space(fixt_space):
+    return lm.vector.fixed_space(fixt_space)
+
+
+@pytest.fixture(scope="module")
+def fixt_irregular_forex():
+    """Forex vector with rates that produce gamma vectors with many decimal places."""
+
+    rates = {
+        "cad": "1.3612",
+        "cny": "7.2391",
+        "eur": "0.9234",
+        "gbp": "0.7891",
+        "inr": "83.127",
+        "jpy": "151.37",
+    }
+    return lm.vector.forex({"base": "usd", "rates": rates})
+
+
+_amounts = [
+    (10, "usd"),
+    ("1000", "jpy"),
+    ("0.13", "eur"),
+    ("-3.5", "cad"),
+    ("123456789.01", "gbp"),
+    (0, "inr"),
+]
+
+
+@pytest.fixture
+def fixt_vectors(fixt_backend, fixt_fixed_space):
+    return [lm.vector.asset(a, c, fixt_fixed_space) for a, c in _amounts]
+
+
+@pytest.fixture
+def fixt_matrix(fixt_vectors):
+    return lm.vector.matrix(fixt_vectors)
+
+
+def _assert_rows_match(mat, vectors):
+    assert isinstance(mat, lm.vector.FixedMoneyMatrix)
+    assert len(mat) == len(vectors)
+    for row, vec in zip(mat, vectors, strict=True):
+        assert isinstance(row, lm.vector.FixedMoneyVector)
+        assert row.ints == vec.ints
+
+
+def test_fixed_matrix(fixt_matrix, fixt_vectors, fixt_fixed_space):
+    """Matrices of fixed-point vectors should be fixed-point matrices with the same
+    rows and equal to the equivalent `decimal.Decimal` matrix."""
+
+    _assert_rows_match(fixt_matrix, fixt_vectors)
+    assert fixt_matrix[-1] == fixt_vectors[-1]
+    assert fixt_matrix.places == fixt_fixed_space.places
+    assert fixt_matrix == lm.vector.matrix(
+        [lm.vector.to_dense(i) for i in fixt_vectors]
+    )
+    assert fixt_matrix.column("usd") == tuple([i[-1] for i in fixt_vectors])
+    assert lm.vector.matrix(fixt_vectors, fixt_fixed_space) == fixt_matrix
+    sut = lm.vector.asset_matrix(*zip(*_amounts), fixt_fixed_space)
+    _assert_rows_match(sut, fixt_vectors)
+
+
+def test_arithmetic_matches_vectors(fixt_matrix, fixt_vectors):
+    """Kernel arithmetic should give exactly the same results as the `FixedMoneyVector`
+    operators applied to each row."""
+
+    other = fixt_matrix * 3
+    _assert_rows_match(other, [v * 3 for v in fixt_vectors])
+    _assert_rows_match(fixt_matrix + other, [v + v * 3 for v in fixt_vectors])
+    _assert_rows_match(fixt_matrix - other, [v - v * 3 for v in fixt_vectors])
+    _assert_rows_match(-fixt_matrix, [-v for v in fixt_vectors])
+    vec = fixt_vectors[4]
+    _assert_rows_match(fixt_matrix + vec, [v + vec for v in fixt_vectors])
+    _assert_rows_match(vec + fixt_matrix, [vec + v for v in fixt_vectors])
+    _assert_rows_match(fixt_matrix - vec, [v - vec for v in fixt_vectors])
+    _assert_rows_match(vec - fixt_matrix, [vec - v for v in fixt_vectors])
+
+
+def test_decimal_fallback(fixt_matrix, fixt_vectors):
+    """Operations that can't be done with fixed-point integers should fall back to the
+    `decimal.Decimal` implementation."""
+
+    dense = lm.vector.to_dense(fixt_vectors[4])
+    for sut, expected in [
+        (fixt_matrix * "1.5", [v * "1.5" for v in fixt_vectors]),
+        (fixt_matrix / 3, [v / 3 for v in fixt_vectors]),
+        (fixt_matrix + dense, [v + dense for v in fixt_vectors]),
+        (dense - fixt_matrix, [dense - v for v in fixt_vectors]),
+    ]:
+        assert type(sut) is lm.vector.MoneyMatrix
+        assert list(sut) == expected
+
+
+def test_overflow(fixt_backend, fixt_fixed_space):
+    """Results that overflow 64 bits should be recomputed exactly."""
+
+    big = lm.vector.asset(2**62, "jpy", fixt_fixed_space)
+    mat = lm.vector.matrix([big, -big])
+    _assert_rows_match(mat + mat, [big + big, -big - big])
+    _assert_rows_match(mat - -mat, [big + big, -big - big])
+    _assert_rows_match(mat * 4, [big * 4, -big * 4])
+    _assert_rows_match(-(mat * 2), [-(big * 2), big * 2])
+    huge = lm.vector.matrix([big * 2**70])
+    _assert_rows_match(huge + huge, [big * 2**71])
+    # Scalars that don't fit in 64 bits, with a column that is all zeros.
+    zero = lm.vector.asset(0, "jpy", fixt_fixed_space)
+    mat = lm.vector.matrix([big, zero])
+    for scalar in (10**20, 2**63, -(2**63) - 1):
+        _assert_rows_match(mat * scalar, [big * scalar, zero * scalar])
+    zeros = _kernels.column([0, 0])
+    assert list(_kernels.to_ints(_kernels.scale(zeros, 2**63))) == [0, 0]
+
+
+def test_evaluate_many(fixt_matrix, fixt_vectors, fixt_forex_usd, fixt_irregular_forex):
+    """Evaluating a fixed-point matrix should give exactly the same results as
+    evaluating each row, including rows that need the `decimal.Decimal` path."""
+
+    big = fixt_matrix * 10**4
+    for forex_vec in (fixt_forex_usd, fixt_irregular_forex):
+        for mat in (fixt_matrix, big):
+            for iso_code in ("usd", "jpy", "eur"):
+                expected = [
+                    str(lm.vector.evaluate(row, iso_code, forex_vec)) for row in mat
+                ]
+                sut = lm.vector.evaluate_many(mat, iso_code, forex_vec)
+                assert [str(i) for i in sut] == expected
+
+
+def test_dot_kernel_limit(fixt_backend):
+    """Rows whose products exceed the limit should not be calculated, but rows that
+    overflow 64 bits within the limit should be calculated exactly."""
+
+    columns = [_kernels.column([1, 2**40, -(2**61)]), _kernels.column([2, 3, 0])]
+    weights = [5, 2**21]
+    assert _kernels.dot(columns, weights, 2**63) == [
+        5 + 2 * 2**21,
+        2**40 * 5 + 3 * 2**21,
+        None,
+    ]
+    assert _kernels.dot(columns, weights, 2**70)[-1] == -(2**61) * 5
+
+
+def test_evaluate_many_decimal_precision(fixt_matrix, fixt_irregular_forex):
+    """Rows with products that would be rounded by the decimal context should be
+    evaluated with the `decimal.Decimal` implementation."""
+
+    with decimal.localcontext() as ctx:
+        ctx.prec = 24
+        evaluator = lm.vector.Evaluator(fixt_irregular_forex, "jpy")
+        expected = [str(evaluator(row)) for row in fixt_matrix]
+        assert [str(i) for i in evaluator.many(fixt_matrix)] == expected
+
+
+def test_evaluate_approx(fixt_matrix, fixt_vectors, fixt_irregular_forex):
+    """Approximate evaluations of a fixed-point matrix should match the evaluations of
+    each row and be within their error bounds of the exact results."""
+
+    for mat in (fixt_matrix, fixt_matrix * 10**4):
+        sut = lm.vector.ApproxEvaluator(fixt_irregular_forex, "jpy")
+        results = sut.many(mat)
+        for row, (value, error_bound) in zip(mat, results, strict=True):
+            exact = lm.vector.evaluate(row, "jpy", fixt_irregular_forex)
+            assert abs(decimal.Decimal(value) - exact) <= decimal.Decimal(error_bound)
+            assert abs(value - sut(row)[0]) <= 2 * error_bound
+
+
+def test_float_dot_kernel(fixt_backend):
+    """The float dot product should accumulate each row from left to right."""
+
+    columns = [_kernels.float_column([1e16, -1.5]), _kernels.float_column([1.0, 2.0])]
+    assert _kernels.float_dot(columns, [1.0, 1.0]) == ([1e16, 0.5], [1e16, 3.5])
+    assert list(_kernels.fixed_to_float(_kernels.column([125, -3]), 2)) == [1.25, -0.03]
@@ -0,0 +1,92 @@
+import pytest
+
+import linearmoney as lm
+from linearmoney.exceptions import SpaceError
+from tests.conftest import helpers
+
+
+@pytest.fixture(scope="module")
+def fixt_operands(fixt_space):
+    fixed_space = lm.vector.fixed_space(fixt_space)
+    return (
+        lm.vector.asset("10.5", "usd", fixt_space)
+        + lm.vector.asset("0.3333333333333333", "cad", fixt_space),
+        lm.vector.asset(1000, "jpy", fixt_space, sparse=True),
+        lm.vector.asset("-3.50", "eur", fixed_space),
+    )
+
+
+def test_matches_eager_arithmetic(fixt_operands, fixt_forex_usd, fixt_iso_codes):
+    """Lazy expressions should give exactly the same components as the same
+    expressions with eager `MoneyVector` arithmetic."""
+
+    a, b, c = fixt_operands
+    la = lm.vector.lazy(a)
+    for sut, expected in [
+        (la + b - c, a + b - c),
+        ((la + b - c) * "1.5" / 3, (a + b - c) * "1.5" / 3),
+        (-(2 * la) + (b - la), -(2 * a) + (b - a)),
+        (c - la, c - a),
+        (sum([la, b, c]), sum([a, b, c])),
+        (+la / 7, a / 7),
+    ]:
+        materialized = sut.materialize()
+        assert type(materialized) is lm.vector.MoneyVector
+        assert helpers.vector_to_tuple(materialized) == helpers.vector_to_tuple(
+            expected
+        )
+        assert [str(i) for i in materialized] == [str(i) for i in expected]
+        assert str(sut.evaluate(fixt_iso_codes, fixt_forex_usd)) == str(
+            lm.vector.evaluate(expected, fixt_iso_codes, fixt_forex_usd)
+        )
+
+
+def test_common_subexpressions(fixt_operands):
+    """Shared subexpressions should only be compiled into a single instruction."""
+
+    a, b, c = fixt_operands
+    shared = lm.vector.lazy(a) + b
+    sut = (shared - c) + (shared * 2) + ((lm.vector.lazy(a) + b) * 2)
+    instructions, leaves, _ = sut._compile()
+    # a, b, a + b, c, (a + b) - c, (a + b) * 2, sum, sum
+    assert len(instructions) == 8
+    assert leaves == (a, b, c)
+    assert sut.materialize() == (a + b - c) + (a + b) * 2 + (a + b) * 2
+
+
+def test_long_chain(fixt_operands):
+    """Long chains of operations should not hit the recursion limit."""
+
+    a, _, _ = fixt_operands
+    sut = lm.vector.lazy(a)
+    for _ in range(5000):
+        sut = sut + a
+    assert sut.materialize() == a * 5001
+
+
+def test_no_intermediate_vectors_are_cached(fixt_operands):
+    """Building and materializing an expression should not use the cache."""
+
+    a, b, c = fixt_operands
+    lm.cache.invalidate()
+    ((lm.vector.lazy(a) + b - c) * 3).materialize()
+    assert lm.cache.size() == 0
+
+
+def test_errors(fixt_operands, fixt_three_space, fixt_forex_usd):
+    """The space should be checked when the expression is calculated, and unsupported
+    operands should be rejected."""
+
+    a, _, _ = fixt_operands
+    other = lm.vector.asset(1, "usd", fixt_three_space)
+    sut = lm.vector.lazy(a) + other
+    with pytest.raises(SpaceError):
+        sut.materialize()
+    with pytest.raises(SpaceError):
+        lm.vector.lazy(other).evaluate("usd", fixt_forex_usd)
+    with pytest.raises(TypeError):
+        lm.vector.lazy(1)
+    with pytest.raises(TypeError):
+        lm.vector.lazy(a) * a
+    with pytest.raises(TypeError):
+        lm.vector.lazy(a) + 1
@@ -0,0 +1,131 @@
+import decimal
+
+import pytest
+
+import linearmoney as lm
+from linearmoney.exceptions import SpaceError
+from tests.conftest import helpers
+
+
+@pytest.fixture(scope="module")
+def fixt_vectors_list(fixt_space):
+    return [
+        lm.vector.asset(10, "usd", fixt_space),
+        lm.vector.asset(1000, "jpy", fixt_space),
+        lm.vector.asset(5, "usd", fixt_space) + lm.vector.asset(500, "jpy", fixt_space),
+        lm.vector.asset("0.125", "eur", fixt_space),
+    ]
+
+
+@pytest.fixture(scope="module")
+def fixt_matrix(fixt_vectors_list):
+    return lm.vector.matrix(fixt_vectors_list)
+
+
+def _assert_rows_match(mat, vectors):
+    assert len(mat) == len(vectors)
+    for row, vec in zip(mat, vectors, strict=True):
+        assert helpers.vector_to_tuple(row) == helpers.vector_to_tuple(vec)
+        # Components should match exactly, including precision.
+        assert [str(i) for i in row] == [str(i) for i in vec]
+
+
+def test_rows_round_trip(fixt_matrix, fixt_vectors_list):
+    """The rows of a matrix should be exactly the vectors it was built from."""
+
+    _assert_rows_match(fixt_matrix, fixt_vectors_list)
+    assert fixt_matrix[2] == fixt_vectors_list[2]
+
+
+def test_matrix_from_generator(fixt_vectors_list):
+    """The `matrix` function should accept any iterable including generators."""
+
+    mat = lm.vector.matrix(vec for vec in fixt_vectors_list)
+    _assert_rows_match(mat, fixt_vectors_list)
+
+
+def test_columns(fixt_matrix, fixt_space):
+    """Columns should be accessible by ISO code in the order of the rows."""
+
+    assert fixt_matrix.column("usd") == helpers.decimal_tuple(10, 0, 5, 0)
+    assert fixt_matrix.columns[fixt_space.axes.index("JPY")] == helpers.decimal_tuple(
+        0, 1000, 500, 0
+    )
+    with pytest.raises(SpaceError):
+        fixt_matrix.column("GIL")
+
+
+def test_asset_matrix(fixt_space):
+    """Each row of an asset matrix should be equal to the corresponding `asset`."""
+
+    amounts = [10, 2.5, decimal.Decimal("3.00")]
+    codes = ["usd", "JPY", "eur"]
+    mat = lm.vector.asset_matrix(amounts, codes, fixt_space)
+    expected = [
+        lm.vector.asset(amount, code, fixt_space)
+        for amount, code in zip(amounts, codes)
+    ]
+    _assert_rows_match(mat, expected)
+
+    single = lm.vector.asset_matrix(amounts, "usd", fixt_space)
+    _assert_rows_match(single, [lm.vector.asset(i, "usd", fixt_space) for i in amounts])
+
+
+def test_asset_matrix_errors(fixt_space):
+    """The `asset_matrix` function should raise the same errors as `asset`."""
+
+    with pytest.raises(SpaceError):
+        lm.vector.asset_matrix([1], ["gil"], fixt_space)
+    with pytest.raises(TypeError):
+        lm.vector.asset_matrix([[]], ["usd"], fixt_space)
+    with pytest.raises(ValueError):
+        lm.vector.asset_matrix([1, 2], ["usd"], fixt_space)
+
+
+def test_arithmetic_matches_vectors(fixt_matrix, fixt_vectors_list, fixt_forex_usd):
+    """Matrix arithmetic should give exactly the same results as the equivalent
+    vector arithmetic applied to each row."""
+
+    other = fixt_matrix * 3
+    _assert_rows_match(fixt_matrix + other, [v + v * 3 for v in fixt_vectors_list])
+    _assert_rows_match(fixt_matrix - other, [v - v * 3 for v in fixt_vectors_list])
+    _assert_rows_match(fixt_matrix * "1.5", [v * "1.5" for v in fixt_vectors_list])
+    _assert_rows_match(2 * fixt_matrix, [2 * v for v in fixt_vectors_list])
+    _assert_rows_match(fixt_matrix / 3, [v / 3 for v in fixt_vectors_list])
+    _assert_rows_match(-fixt_matrix, [-v for v in fixt_vectors_list])
+    _assert_rows_match(+fixt_matrix, fixt_vectors_list)
+
+    fo = fixt_forex_usd
+    _assert_rows_match(fixt_matrix + fo, [v + fo for v in fixt_vectors_list])
+    _assert_rows_match(fo + fixt_matrix, [fo + v for v in fixt_vectors_list])
+    _assert_rows_match(fixt_matrix - fo, [v - fo for v in fixt_vectors_list])
+    _assert_rows_match(fo - fixt_matrix, [fo - v for v in fixt_vectors_list])
+
+
+def test_equality(fixt_matrix, fixt_vectors_list):
+    """Matrices are compared by value and are not hashable."""
+
+    assert fixt_matrix == lm.vector.matrix(fixt_vectors_list)
+    assert fixt_matrix != fixt_matrix * 2
+    with pytest.raises(TypeError):
+        hash(fixt_matrix)
+
+
+def test_space_errors(fixt_matrix, fixt_three_space):
+    """Operations between a matrix and vectors or matrices in a different space, or
+    between matrices with different numbers of rows should raise."""
+
+    other_space = lm.vector.asset(1, "usd", fixt_three_space)
+    with pytest.raises(SpaceError):
+        fixt_matrix + other_space
+    with pytest.raises(SpaceError):
+        other_space - fixt_matrix
+    with pytest.raises(SpaceError):
+        lm.vector.matrix([fixt_matrix[0], other_space])
+    with pytest.raises(ValueError):
+        fixt_matrix + lm.vector.matrix([fixt_matrix[0]])
+    with pytest.raises(ValueError):
+        lm.vector.matrix([])
+    empty = lm.vector.matrix([], fixt_three_space)
+    assert len(empty) == 0
+    assert empty.axes == fixt_three_space.axes
@@ -0,0 +1,94 @@
+import decimal
+
+import pytest
+
+import linearmoney as lm
+from linearmoney.exceptions import IntegrityError, SpaceError
+
+
+@pytest.fixture
+def fixt_assets(fixt_space):
+    return [
+        lm.vector.asset(10, "usd", fixt_space),
+        lm.vector.asset(1000, "jpy", fixt_space, sparse=True),
+        lm.vector.asset("0.3333333333333333", "cad", fixt_space)
+        + lm.vector.asset("123456789.987654321", "inr", fixt_space),
+        lm.vector.asset(-7, "gbp", lm.vector.fixed_space(fixt_space)),
+    ]
+
+
+def _expected(assets, iso_code, forex_vec):
+    return lm.vector.evaluate(sum(assets), iso_code, forex_vec)
+
+
+def test_add(fixt_assets, fixt_forex_usd, fixt_iso_codes):
+    """Adding assets should update the value to the value of the total assets."""
+
+    sut = lm.vector.Portfolio(fixt_forex_usd, fixt_iso_codes)
+    assert sut.value == 0
+    for idx, asset_vec in enumerate(fixt_assets):
+        sut.add(asset_vec)
+        expected = _expected(fixt_assets[: idx + 1], fixt_iso_codes, fixt_forex_usd)
+        assert str(sut.value) == str(expected)
+    assert sut.holdings == sum(fixt_assets)
+    assert sut.iso_code == fixt_iso_codes.upper()
+    assert sut.reconcile() == 0
+
+
+def test_rate_changes(fixt_assets, fixt_forex_usd, fixt_iso_codes):
+    """Changing rates should update the value to the value of the total assets with
+    the new rates, including changes to the rate of the portfolio's currency."""
+
+    sut = lm.vector.Portfolio(fixt_forex_usd, fixt_iso_codes, fixt_assets)
+    forex_vec = fixt_forex_usd
+    # The rate of the base currency can't be changed.
+    own_rate = {} if fixt_iso_codes.upper() == "USD" else {fixt_iso_codes: "3.75"}
+    for changes in [
+        {"jpy": "101.5"},
+        {"cad": "1.3612", "gbp": "0.7891"},
+        own_rate,
+        {"eur": decimal.Decimal("0.9234"), "inr": 83},
+    ]:
+        sut.update_rates(**changes)
+        forex_vec = lm.vector.update_forex(forex_vec, **changes)
+        assert sut.forex_vec == forex_vec
+        assert str(sut.value) == str(_expected(fixt_assets, fixt_iso_codes, forex_vec))
+    sut.set_forex(fixt_forex_usd)
+    assert str(sut.value) == str(_expected(fixt_assets, fixt_iso_codes, fixt_forex_usd))
+    assert sut.reconcile() == 0
+
+
+def test_errors(fixt_forex_usd):
+    """The portfolio should reject currencies, assets and rates that are not part of
+    the currency space or that are invalid, without changing its state."""
+
+    with pytest.raises(SpaceError):
+        lm.vector.Portfolio(fixt_forex_usd, "gil")
+    sut = lm.vector.Portfolio(fixt_forex_usd, "usd")
+    other = lm.vector.forex({"base": "usd", "rates": {"jpy": 100}})
+    with pytest.raises(SpaceError):
+        sut.add(lm.vector.asset(1, "usd", lm.vector.space(other)))
+    with pytest.raises(SpaceError):
+        sut.set_forex(other)
+    with pytest.raises(SpaceError):
+        sut.update_rates(gil=1)
+    with pytest.raises(IntegrityError):
+        sut.update_rates(jpy=0)
+    sut.add(lm.vector.asset(100, "jpy", lm.vector.space(fixt_forex_usd)))
+    value = sut.value
+    with pytest.raises(ValueError):
+        sut.update_rates(jpy=50, usd=2)
+    with pytest.raises(ValueError):
+        sut.update_rates(usd=2, jpy=1)
+    assert sut.forex_vec is fixt_forex_usd
+    assert sut.value == value
+    # A currency pegged to the base doesn't make the base rate changeable.
+    pegged = lm.vector.forex({"base": "usd", "rates": {"jpy": 100, "eur": 1}})
+    sut = lm.vector.Portfolio(
+        pegged, "jpy", [lm.vector.asset(1, "usd", lm.vector.space(pegged))]
+    )
+    value = sut.value
+    with pytest.raises(ValueError):
+        sut.update_rates(usd=2)
+    assert sut.forex_vec is pegged
+    assert sut.value == value
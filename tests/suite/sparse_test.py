@@ -0,0 +1,149 @@
+import copy
+import decimal
+import pickle
+
+import pytest
+
+import linearmoney as lm
+from linearmoney.exceptions import SpaceError
+from tests.conftest import helpers
+
+
+@pytest.fixture(scope="module")
+def fixt_dense_assets(fixt_space):
+    return [
+        lm.vector.asset(10, "usd", fixt_space),
+        lm.vector.asset(1000, "jpy", fixt_space),
+        lm.vector.asset("0.125", "eur", fixt_space)
+        + lm.vector.asset("-3.5", "cad", fixt_space),
+        lm.vector.asset(0, "gbp", fixt_space),
+    ]
+
+
+@pytest.fixture(scope="module")
+def fixt_sparse_assets(fixt_dense_assets):
+    return [lm.vector.to_sparse(i) for i in fixt_dense_assets]
+
+
+def test_sparse_asset(fixt_space):
+    """The `asset` function should create a sparse vector with the same components as
+    the dense asset if called with `sparse=True`."""
+
+    dense = lm.vector.asset(10, "usd", fixt_space)
+    sparse = lm.vector.asset(10, "usd", fixt_space, sparse=True)
+    assert isinstance(sparse, lm.vector.SparseMoneyVector)
+    assert helpers.vector_to_tuple(sparse) == helpers.vector_to_tuple(dense)
+    assert sparse.dim == dense.dim
+    assert sparse.axes == dense.axes
+    assert sparse[-1] == dense[-1]
+    assert sparse[2:5] == dense[2:5]
+    with pytest.raises(IndexError):
+        sparse[len(fixt_space.axes)]
+    with pytest.raises(SpaceError):
+        lm.vector.asset(10, "gil", fixt_space, sparse=True)
+
+
+def test_equality_and_hashing(fixt_dense_assets, fixt_sparse_assets):
+    """Sparse vectors should hash and compare equal to dense vectors with the same
+    components."""
+
+    for dense, sparse in zip(fixt_dense_assets, fixt_sparse_assets):
+        assert sparse == dense
+        assert hash(sparse) == hash(dense)
+        assert lm.vector.to_dense(sparse) == dense
+        assert lm.vector.to_dense(dense) is dense
+        assert lm.vector.to_sparse(sparse) is sparse
+    assert fixt_sparse_assets[0] != fixt_sparse_assets[1]
+
+
+def test_arithmetic_matches_dense(fixt_dense_assets, fixt_sparse_assets):
+    """Arithmetic on sparse vectors should give the same values as on dense vectors
+    and sparse-only operations should return sparse vectors."""
+
+    pairs = list(zip(fixt_dense_assets, fixt_sparse_assets))
+    for dense_lhs, sparse_lhs in pairs:
+        for dense_rhs, sparse_rhs in pairs:
+            expected_add = helpers.vector_to_tuple(dense_lhs + dense_rhs)
+            expected_sub = helpers.vector_to_tuple(dense_lhs - dense_rhs)
+            sut = sparse_lhs + sparse_rhs
+            assert isinstance(sut, lm.vector.SparseMoneyVector)
+            assert helpers.vector_to_tuple(sut) == expected_add
+            sut = sparse_lhs - sparse_rhs
+            assert isinstance(sut, lm.vector.SparseMoneyVector)
+            assert helpers.vector_to_tuple(sut) == expected_sub
+            # Mixed operations produce dense vectors.
+            for sut in (sparse_lhs + dense_rhs, dense_lhs + sparse_rhs):
+                assert type(sut) is lm.vector.MoneyVector
+                assert helpers.vector_to_tuple(sut) == expected_add
+            for sut in (sparse_lhs - dense_rhs, dense_lhs - sparse_rhs):
+                assert type(sut) is lm.vector.MoneyVector
+                assert helpers.vector_to_tuple(sut) == expected_sub
+        assert helpers.vector_to_tuple(sparse_lhs * "2.5") == helpers.vector_to_tuple(
+            dense_lhs * "2.5"
+        )
+        assert helpers.vector_to_tuple(sparse_lhs / 3) == helpers.vector_to_tuple(
+            dense_lhs / 3
+        )
+        assert helpers.vector_to_tuple(-sparse_lhs) == helpers.vector_to_tuple(
+            -dense_lhs
+        )
+    assert sum(fixt_sparse_assets) == sum(fixt_dense_assets)
+
+
+def test_zero_components_are_dropped(fixt_space):
+    """Components that cancel out should not be stored."""
+
+    usd = lm.vector.asset(10, "usd", fixt_space, sparse=True)
+    assert (usd - usd)._components == {}
+    assert (usd * 0)._components == {}
+    assert usd - usd == lm.vector.asset(0, "usd", fixt_space)
+
+
+def test_dot_and_evaluate(
+    fixt_dense_assets, fixt_sparse_assets, fixt_forex_usd, fixt_iso_codes
+):
+    """`dot`, `evaluate` and the batch evaluation functions should give the same
+    results for sparse vectors as for dense vectors."""
+
+    gamma = lm.vector.gamma(fixt_forex_usd, fixt_iso_codes)
+    evaluator = lm.vector.Evaluator(fixt_forex_usd, fixt_iso_codes)
+    for dense, sparse in zip(fixt_dense_assets, fixt_sparse_assets):
+        assert lm.vector.dot(sparse, gamma) == lm.vector.dot(dense, gamma)
+        assert lm.vector.dot(gamma, sparse) == lm.vector.dot(dense, gamma)
+        expected = str(lm.vector.evaluate(dense, fixt_iso_codes, fixt_forex_usd))
+        assert str(lm.vector.evaluate(sparse, fixt_iso_codes, fixt_forex_usd)) == (
+            expected
+        )
+        assert str(evaluator(sparse)) == expected
+    assert evaluator.many(fixt_sparse_assets) == evaluator.many(fixt_dense_assets)
+
+
+def test_store_and_restore(fixt_dense_assets, fixt_sparse_assets):
+    """Sparse vectors should serialize to exactly the same string as dense vectors."""
+
+    for dense, sparse in zip(fixt_dense_assets, fixt_sparse_assets):
+        assert lm.vector.store(sparse) == lm.vector.store(dense)
+        assert lm.vector.restore(lm.vector.store(sparse)) == sparse
+
+
+def test_copy_and_pickle(fixt_sparse_assets):
+    """Sparse vectors should support copying and pickling like dense vectors."""
+
+    for i in fixt_sparse_assets:
+        assert copy.copy(i) is i
+        assert copy.deepcopy(i) is i
+        restored = pickle.loads(pickle.dumps(i))
+        assert restored == i
+        assert repr(restored) == repr(i)
+
+
+def test_invalid_component_index(fixt_space):
+    """Constructing a sparse vector with an index outside of its axes should raise a
+    `SpaceError`."""
+
+    with pytest.raises(SpaceError):
+        lm.vector.SparseMoneyVector(
+            {len(fixt_space.axes): decimal.Decimal(1)}, fixt_space.axes
+        )
+    with pytest.raises(SpaceError):
+        lm.vector.SparseMoneyVector({-1: decimal.Decimal(1)}, fixt_space.axes)
@@ -157,3 +157,61 @@ def test_thread_local_cache(FixtExcThread):
     t1.join()
 
     assert lm.cache.size(_add1) == 1
+
+
+@pytest.mark.filterwarnings("ignore: Exception in Thread")
+@pytest.mark.usefixtures("fixt_restore_global_cache")
+def test_process_scope_cache(FixtExcThread):
+    """With the process scope, all threads should share a single cache, and values
+    cached in the thread scope should not be visible in the process scope."""
+
+    @lm.cache.cached()
+    def _add1(num: int) -> int:
+        return num + 1
+
+    _add1(100)
+    lm.cache.set_scope("process")
+    lm.cache.invalidate()
+    _add1(100)
+    assert lm.cache.size(_add1) == 1
+
+    def thread1():
+        for i in range(10):
+            _add1(i)
+        _add1(100)  # Cached by the main thread.
+        assert lm.cache.size(_add1) == 11
+
+    t1 = FixtExcThread(target=thread1)
+    t1.start()
+    t1.join()
+
+    assert lm.cache.size(_add1) == 11
+    assert lm.cache.tail(_add1) == 101
+    lm.cache.set_scope("thread")
+    assert lm.cache.size(_add1) == 1
+
+
+@pytest.mark.filterwarnings("ignore: Exception in Thread")
+@pytest.mark.usefixtures("fixt_restore_global_cache")
+def test_process_scope_concurrent_access(FixtExcThread):
+    """Concurrent reads, writes and evictions of the shared cache should always
+    return the correct values and never exceed the `max_size`."""
+
+    @lm.cache.cached(size_multiplier=0.25)
+    def _mul2(num: int) -> int:
+        return num * 2
+
+    lm.cache.set_scope("process")
+
+    def thread1():
+        for _ in range(20):
+            for i in range(200):
+                assert _mul2(i) == i * 2
+
+    threads = [FixtExcThread(target=thread1) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert lm.cache.size(_mul2) == lm.cache.max_size(_mul2)
@@ -4,7 +4,7 @@ import fractions
 import pytest
 
 import linearmoney as lm
-from linearmoney.exceptions import IntegrityError, SpaceError
+from linearmoney.exceptions import IntegrityError, SpaceError, UnknownDataError
 from tests.conftest import helpers
 
 _vector_classes = [lm.vector.MoneyVector, lm.vector.ForexVector]
@@ -77,6 +77,23 @@ class TestMoneyVectors:
         with pytest.raises(TypeError):
             lm.vector.asset(fixt_invalid_asset_input_types, "usd", fixt_space)
 
+    def test_lazy_repr_and_hash(self, fixt_space):
+        """Arithmetic results should not compute their repr or hash until they are
+        used, and the lazily computed values should be the same as the values of an
+        equal vector created with the public constructor."""
+
+        usd = lm.vector.asset(10, "usd", fixt_space)
+        jpy = lm.vector.asset("1000.50", "jpy", fixt_space)
+        # Make sure the results aren't cached vectors that have already been used.
+        lm.cache.invalidate()
+        for sut in (usd + jpy, usd - jpy, usd * 3, -jpy, jpy / 4):
+            assert sut._hash is None
+            assert sut._v_repr is None
+            expected = lm.vector.MoneyVector(tuple(sut), sut.axes)
+            assert repr(sut) == repr(expected)
+            assert hash(sut) == hash(expected)
+            assert sut == expected
+
 
 class TestForexVectors:
     @pytest.fixture(scope="class")
@@ -265,3 +282,85 @@ class TestForexVectors:
         assert usd.dim == 1
         eur = lm.vector.forex({"base": "eur", "rates": {}})
         assert eur.dim == 1
+
+    def test_update_forex(self, fixt_api_rates):
+        """Updating rates should give exactly the same vector as passing the new rates
+        as overrides to `forex` and keep the axes of the original vector."""
+
+        fo = lm.vector.forex(fixt_api_rates)
+        changes = {"jpy": "135.10", "GBP": 0.86, "usd": decimal.Decimal("1.2301")}
+        sut = lm.vector.update_forex(fo, **changes)
+        expected = lm.vector.forex(fixt_api_rates, **changes)
+        assert isinstance(sut, lm.vector.ForexVector)
+        assert sut == expected
+        assert repr(sut) == repr(expected)
+        assert sut.axes is fo.axes
+        assert lm.vector.update_forex(fo) == fo
+
+    def test_update_forex_errors(self, fixt_rates_usd):
+        """Updating rates should not add new currencies, allow rates less than or
+        equal to 0, or change the rate of the base currency."""
+
+        fo = lm.vector.forex(fixt_rates_usd)
+        with pytest.raises(SpaceError):
+            lm.vector.update_forex(fo, eur=1)
+        with pytest.raises(IntegrityError):
+            lm.vector.update_forex(fo, jpy=0)
+        with pytest.raises(IntegrityError):
+            lm.vector.update_forex(fo, jpy=-100)
+        with pytest.raises(ValueError):
+            lm.vector.update_forex(fo, usd=2)
+        with pytest.raises(ValueError):
+            lm.vector.update_forex(fo, jpy=50, USD="0.5")
+        with pytest.raises(ValueError):
+            lm.vector.update_forex(fo, usd=2, jpy=1)
+        pegged = lm.vector.forex({"base": "usd", "rates": {"jpy": 100, "eur": 1}})
+        with pytest.raises(ValueError):
+            lm.vector.update_forex(pegged, usd=2)
+        # Setting the base rate to 1 is a no-op, and a currency pegged to the base can
+        # still be updated.
+        assert lm.vector.update_forex(fo, usd=1) == fo
+        assert lm.vector.update_forex(fo, jpy=1, usd=1) == lm.vector.forex(
+            {"base": "usd", "rates": {"jpy": 1}}
+        )
+
+    @pytest.mark.usefixtures("fixt_restore_global_cache")
+    def test_triangulate(self, fixt_api_rates):
+        """Triangulating quotes that are all from the base should give exactly the
+        same vector as `forex`, and other quotes should be chained along the shortest
+        path to the base."""
+
+        quotes = {("eur", k): v for k, v in fixt_api_rates["rates"].items()}
+        sut = lm.vector.triangulate(quotes, "eur")
+        expected = lm.vector.forex(fixt_api_rates)
+        assert sut == expected
+        assert repr(sut) == repr(expected)
+
+        quotes = {("EUR", "USD"): "1.25", ("USD", "JPY"): 100, ("GBP", "EUR"): 2}
+        sut = lm.vector.triangulate(quotes, "usd")
+        assert sut == lm.vector.forex(
+            {"base": "usd", "rates": {"eur": "0.8", "jpy": 100, "gbp": "0.4"}}
+        )
+        # The plan is reused for fresh quotes with the same pairs.
+        lm.cache.enable_stats(True)
+        lm.cache.reset_stats()
+        lm.vector.triangulate(quotes, "usd")
+        hits = lm.cache.stats(lm.vector._triangulation_plan)["hits"]
+        quotes = dict(quotes)
+        quotes[("USD", "JPY")] = 200
+        sut = lm.vector.triangulate(quotes, "usd")
+        assert lm.cache.stats(lm.vector._triangulation_plan)["hits"] == hits + 1
+        assert sut.component("jpy") == decimal.Decimal("0.005")
+        assert sut.component("gbp") == decimal.Decimal("2.5")
+
+    def test_triangulate_errors(self):
+        """Triangulating should fail for quotes less than or equal to 0 and for
+        currencies that can't be reached from the base."""
+
+        with pytest.raises(IntegrityError):
+            lm.vector.triangulate({("usd", "jpy"): 0}, "usd")
+        with pytest.raises(UnknownDataError):
+            lm.vector.triangulate({("usd", "jpy"): 100, ("eur", "gbp"): 2}, "usd")
+        assert lm.vector.triangulate({}, "usd") == lm.vector.forex(
+            {"base": "usd", "rates": {}}
+        )